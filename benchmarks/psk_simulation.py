@@ -0,0 +1,55 @@
+"""
+Measure the time to resolve a 1e-7 bit error rate by Monte Carlo simulation of Gray
+coded PSK, with and without the reference symbol shortcut
+
+Run from the repository root, which python -m puts on the import path:
+
+    python -m benchmarks.psk_simulation
+"""
+from time import perf_counter
+
+from scipy.optimize import brentq
+
+from link_calculator.conversions import decibel_to_watt
+from link_calculator.signal_processing.error_rates import psk_bit_error_rate
+from link_calculator.signal_processing.simulation import simulate_psk_error_rate
+
+BIT_ERROR_RATE = 1e-7
+TARGET_ERRORS = 100
+# enough for the target errors at the reference error rate with room for chance
+MAX_BITS = 10**10
+LEVELS = [2, 4, 8]
+
+
+def main():
+    print(
+        f"{'levels':>6}{'Eb/No (dB)':>12}{'symmetric':>11}{'BER':>10}"
+        f"{'errors':>8}{'bits':>10}{'time (s)':>10}"
+    )
+    for levels in LEVELS:
+        eb_no_db = brentq(
+            lambda x: psk_bit_error_rate(decibel_to_watt(x), levels) - BIT_ERROR_RATE,
+            0,
+            30,
+        )
+        for symmetric in [True, False]:
+            start = perf_counter()
+            results = simulate_psk_error_rate(
+                decibel_to_watt(eb_no_db),
+                levels,
+                target_errors=TARGET_ERRORS,
+                max_bits=MAX_BITS,
+                symmetric=symmetric,
+                seed=0,
+            )
+            elapsed = perf_counter() - start
+            print(
+                f"{levels:>6}{eb_no_db:>12.2f}{str(symmetric):>11}"
+                f"{results.bit_error_rate[0]:>10.2g}{results.bit_errors[0]:>8}"
+                f"{results.bits[0]:>10.2g}"
+                f"{elapsed:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
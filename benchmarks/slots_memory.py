@@ -0,0 +1,148 @@
+"""
+Compare the size and attribute access time of the slotted component classes with
+equivalent classes that keep their attributes in a per-instance __dict__
+
+Run from the repository root, which python -m puts on the import path:
+
+    python -m benchmarks.slots_memory
+"""
+import sys
+import tracemalloc
+from copy import copy
+from timeit import timeit
+from types import CellType, FunctionType
+
+from link_calculator.components.antennas import Amplifier, ParabolicAntenna
+from link_calculator.components.communicators import GroundStation, Satellite
+from link_calculator.constants import EARTH_RADIUS
+from link_calculator.conversions import MHz_to_GHz, decibel_to_watt
+from link_calculator.link_budget import Link
+from link_calculator.orbits.utils import GeodeticCoordinate, Orbit
+from link_calculator.signal_processing.modulation import MPhaseShiftKeying
+
+ACCESSES = 10**6
+COPIES = 10**4
+
+
+def _rebind(function: FunctionType, cls: type) -> FunctionType:
+    """
+    Copy a function so super() inside it refers to cls
+    """
+    if "__class__" not in function.__code__.co_freevars:
+        return function
+    closure = tuple(
+        CellType(cls) if name == "__class__" else cell
+        for name, cell in zip(function.__code__.co_freevars, function.__closure__)
+    )
+    rebound = FunctionType(
+        function.__code__,
+        function.__globals__,
+        function.__name__,
+        function.__defaults__,
+        closure,
+    )
+    rebound.__kwdefaults__ = function.__kwdefaults__
+    return rebound
+
+
+def dict_backed(cls: type) -> type:
+    """
+    Rebuild a class hierarchy without __slots__, as the classes were laid out before
+    """
+    if cls is object:
+        return object
+    slots = cls.__dict__.get("__slots__", ())
+    namespace = {
+        name: value
+        for name, value in cls.__dict__.items()
+        if name not in ("__slots__", "__dict__", "__weakref__", *slots)
+    }
+    rebuilt = type(cls.__name__, tuple(map(dict_backed, cls.__bases__)), namespace)
+    for name, value in namespace.items():
+        if isinstance(value, FunctionType):
+            setattr(rebuilt, name, _rebind(value, rebuilt))
+    return rebuilt
+
+
+def instance_size(obj: object) -> float:
+    """
+    Measure the memory allocated per shallow copy of an instance: the object and its
+    __dict__, if any, but not the attribute values, which both layouts share
+    """
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    copies = [copy(obj) for _ in range(COPIES)]
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (end - start - sys.getsizeof(copies)) / len(copies)
+
+
+def build(modulation: type, antenna: type, station: type, link: type) -> dict:
+    psk = modulation(
+        levels=8, bit_error_rate=1e-6, bandwidth=MHz_to_GHz(40), rolloff_rate=0.2
+    )
+    amplifier = Amplifier(power=decibel_to_watt(20), loss=decibel_to_watt(-3))
+    dish = antenna(
+        circular_diameter=2.4,
+        frequency=14,
+        efficiency=0.6,
+        loss=decibel_to_watt(-1),
+        modulation=psk,
+        amplifier=amplifier,
+    )
+    point = GeodeticCoordinate(0, 0, 0)
+    gs = station(
+        name="gs",
+        transmit=dish,
+        receive=dish,
+        ground_coordinate=point,
+        gain_to_equiv_noise_temp=decibel_to_watt(35.5),
+    )
+    sat = Satellite(
+        name="sat",
+        transmit=dish,
+        receive=dish,
+        ground_coordinate=point,
+        orbit=Orbit(orbital_radius=630 + EARTH_RADIUS),
+        gain_to_equiv_noise_temp=decibel_to_watt(-5.5),
+    )
+    uplink = link(
+        transmitter=gs,
+        receiver=sat,
+        atmospheric_loss=decibel_to_watt(-0.5),
+        path_loss=decibel_to_watt(-206.4),
+        slant_range=1000,
+    )
+    return {
+        "MPhaseShiftKeying": (psk, "levels"),
+        "ParabolicAntenna": (dish, "gain"),
+        "GroundStation": (gs, "name"),
+        "Link": (uplink, "path_loss"),
+    }
+
+
+def main():
+    classes = [MPhaseShiftKeying, ParabolicAntenna, GroundStation, Link]
+    slotted = build(*classes)
+    unslotted = build(*map(dict_backed, classes))
+
+    print(
+        f"{'class':<20}{'dict (B)':>10}{'slots (B)':>11}"
+        f"{'dict (ns)':>11}{'slots (ns)':>12}"
+    )
+    for name, (obj, attribute) in slotted.items():
+        before, _ = unslotted[name]
+        times = [
+            timeit(f"obj.{attribute}", globals={"obj": o}, number=ACCESSES)
+            / ACCESSES
+            * 1e9
+            for o in (before, obj)
+        ]
+        print(
+            f"{name:<20}{instance_size(before):>10.0f}{instance_size(obj):>11.0f}"
+            f"{times[0]:>11.1f}{times[1]:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,92 @@
-from math import cos, degrees, exp, pi, radians, sin
+from math import pi
 
 import numpy as np
 import pandas as pd
+from scipy.special import gamma, jv
 
 from link_calculator.constants import BOLTZMANN_CONSTANT
 from link_calculator.conversions import (
+    decibel_to_watt,
     frequency_to_wavelength,
     watt_to_decibel,
     wavelength_to_frequency,
 )
+from link_calculator.grids import RegularGrid
 from link_calculator.signal_processing.modulation import Modulation
 
+# 12 ln(10) / 10 from the 12 dB rule, exp(-2.76 x**2) being -12 x**2 dB, so a
+# Gaussian beam is at half power half a beamwidth from boresight
+GAUSSIAN_BEAM_CONSTANT = 2.76
+
+
+def gaussian_pattern(
+    off_axis_angle: np.ndarray, half_beamwidth: np.ndarray
+) -> np.ndarray:
+    """
+    Calculate the gain relative to boresight of a Gaussian main beam
+
+    Parameters
+    ----------
+        off_axis_angle (np.ndarray, deg): the angles from boresight, scalar or array
+        half_beamwidth (np.ndarray, deg): the half power beamwidth, broadcastable
+            with off_axis_angle
+
+    Returns
+    -------
+        relative_gain (np.ndarray, ): 0.5 at the half power angle
+    """
+    return np.exp(
+        -GAUSSIAN_BEAM_CONSTANT
+        * (np.asarray(off_axis_angle) / np.asarray(half_beamwidth)) ** 2
+    )[()]
+
+
+def aperture_pattern(
+    off_axis_angle: np.ndarray,
+    diameter: np.ndarray,
+    wavelength: np.ndarray,
+    taper: int = 0,
+) -> np.ndarray:
+    """
+    Calculate the gain relative to boresight of a circular aperture, including its
+    nulls and sidelobes
+
+    The aperture illumination falls as (1 - r^2)^taper from the centre, so taper=0
+    is uniform illumination with the 2 J1(u) / u pattern and first sidelobes at
+    -17.6 dB, and higher tapers trade a wider beam for lower sidelobes.
+
+    Parameters
+    ----------
+        off_axis_angle (np.ndarray, deg): the angles from boresight, scalar or array
+        diameter (np.ndarray, m): the aperture diameter, broadcastable with
+            off_axis_angle
+        wavelength (np.ndarray, m): the radiation wavelength
+        taper (int, ): the order of the illumination taper
+
+    Returns
+    -------
+        relative_gain (np.ndarray, )
+    """
+    u = (
+        np.pi
+        * np.asarray(diameter)
+        * np.sin(np.radians(off_axis_angle))
+        / np.asarray(wavelength)
+    )
+    order = taper + 1
+    with np.errstate(divide="ignore", invalid="ignore"):
+        amplitude = gamma(order + 1) * (2 / u) ** order * jv(order, u)
+    return np.where(u == 0, 1.0, amplitude**2)[()]
+
 
 class Amplifier:
+    __slots__ = (
+        "_power",
+        "_gain",
+        "_loss",
+        "_noise_power",
+    )
+
     def __init__(
         self, power: float, gain: float = 1, loss: float = 1, noise_power: float = None
     ):
@@ -94,6 +168,30 @@ class Amplifier:
 
 
 class Antenna:
+    __slots__ = (
+        "_amplifier",
+        "_gain",
+        "_loss",
+        "_eirp",
+        "_efficiency",
+        "_half_beamwidth",
+        "_cross_sect_area",
+        "_cross_sect_diameter",
+        "_frequency",
+        "_wavelength",
+        "_modulation",
+        "_effective_aperture",
+        "_roughness_factor",
+        "_carrier_to_noise",
+        "_signal_to_noise",
+        "_carrier_power",
+        "_gain_to_noise_temperature",
+        "_combined_loss",
+        "_power_density",
+        "_surface_roughness_loss",
+        "_transmit_loss",
+    )
+
     def __init__(
         self,
         gain: float = None,
@@ -156,6 +254,8 @@ class Antenna:
         self._gain_to_noise_temperature = gain_to_noise_temperature
         self._combined_loss = combined_loss
         self._power_density = power_density
+        self._surface_roughness_loss = None
+        self._transmit_loss = None
 
     def power_density_eirp(self, distance: float, atmospheric_loss: float = 1) -> float:
         """
@@ -261,15 +361,30 @@ class Antenna:
         TODO
         Parameters
         ---------
-          pointing_error (float, deg): angle off nominal pointing direction
+          pointing_error (float, deg): angle off nominal pointing direction, scalar
+            or array
 
         Returns
         ------
           pointing_loss (float, ??):
         """
-        return exp(
-            -2.76 * (radians(pointing_error) / radians(self.half_beamwidth)) ** 2
-        )
+        return gaussian_pattern(pointing_error, self.half_beamwidth)
+
+    def pattern(self, off_axis_angle: np.ndarray) -> np.ndarray:
+        """
+        Calculate the gain away from boresight with a Gaussian main beam
+
+        Parameters
+        ----------
+            off_axis_angle (np.ndarray, deg): the angles from boresight, scalar or
+                array. The antenna's gain and half beamwidth may themselves be arrays
+                broadcastable with it.
+
+        Returns
+        -------
+            gain (np.ndarray, )
+        """
+        return self.gain * gaussian_pattern(off_axis_angle, self.half_beamwidth)
 
     def surface_roughness_loss(self) -> float:
         """
@@ -282,7 +397,7 @@ class Antenna:
           pointing_loss (float, ??):
         """
         if self._surface_roughness_loss is None:
-            self._surface_roughness_loss = exp(
+            self._surface_roughness_loss = np.exp(
                 -(4 * pi * self.roughness_factor / self.wavelength)
             )
         return self._surface_roughness_loss
@@ -527,7 +642,7 @@ class Antenna:
                 getattr(self, var)
 
     def _isset(self, *args) -> bool:
-        return not (None in args)
+        return all(arg is not None for arg in args)
 
 
 class HalfWaveDipole(Antenna):
@@ -535,6 +650,8 @@ class HalfWaveDipole(Antenna):
     Class for omnidirectuinal radiation pattern
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         amplifier: Amplifier = None,
@@ -561,12 +678,19 @@ class HalfWaveDipole(Antenna):
 
     def off_sight_gain(self, theta: float) -> float:
         """
-        theta (float, deg): ??
+        theta (float, deg): ??, scalar or array
         """
-        return cos(np.pi / 2 * cos(radians(theta))) ** 2 / sin(radians(theta)) ** 2
+        theta = np.radians(theta)
+        sin_squared = np.sin(theta) ** 2
+        with np.errstate(divide="ignore", invalid="ignore"):
+            gain = np.cos(np.pi / 2 * np.cos(theta)) ** 2 / sin_squared
+        # the pattern has nulls along the dipole axis
+        return np.where(sin_squared < 1e-20, 0.0, gain)[()]
 
 
 class ConicalHornAntenna(Antenna):
+    __slots__ = ()
+
     def __init__(
         self,
         amplifier: Amplifier = None,
@@ -587,6 +711,8 @@ class ConicalHornAntenna(Antenna):
 
 
 class SquareHornAntenna(Antenna):
+    __slots__ = ()
+
     def __init__(
         self,
         cross_sect_diameter: float,
@@ -631,13 +757,15 @@ class SquareHornAntenna(Antenna):
         TODO
         """
         if self._half_beamwidth is None:
-            self._half_beamwidth = degrees(
+            self._half_beamwidth = np.degrees(
                 0.88 * self.wavelength / self.cross_sect_diameter
             )
         return self._half_beamwidth
 
 
 class ParabolicAntenna(Antenna):
+    __slots__ = ("_beamwidth_scale_factor",)
+
     def __init__(
         self,
         circular_diameter: float,
@@ -699,7 +827,10 @@ class ParabolicAntenna(Antenna):
         TODO
         """
         if self._half_beamwidth is None:
-            self._half_beamwidth = self._beamwidth_scale_factor * (
+            scale_factor = self._beamwidth_scale_factor
+            if scale_factor is None:
+                scale_factor = 70
+            self._half_beamwidth = scale_factor * (
                 self.wavelength / self.cross_sect_diameter
             )
         return self._half_beamwidth
@@ -710,6 +841,26 @@ class ParabolicAntenna(Antenna):
         """
         return self.gain * self.pointing_loss(theta)
 
+    def aperture_gain(self, off_axis_angle: np.ndarray, taper: int = 0) -> np.ndarray:
+        """
+        Calculate the gain away from boresight from the circular aperture pattern,
+        which unlike the Gaussian approximation of pattern() models the nulls and
+        sidelobes
+
+        Parameters
+        ----------
+            off_axis_angle (np.ndarray, deg): the angles from boresight, scalar or
+                array broadcastable with the antenna's parameters
+            taper (int, ): the order of the (1 - r^2)^taper illumination taper
+
+        Returns
+        -------
+            gain (np.ndarray, )
+        """
+        return self.gain * aperture_pattern(
+            off_axis_angle, self.cross_sect_diameter, self.wavelength, taper
+        )
+
     def summary(self) -> pd.DataFrame:
         summary = pd.DataFrame.from_records(
             [
@@ -739,6 +890,11 @@ class ParabolicAntenna(Antenna):
 
 
 class HelicalAntenna(Antenna):
+    __slots__ = (
+        "n_helix_turns",
+        "turn_spacing",
+    )
+
     def __init__(
         self,
         circular_diameter: float,
@@ -779,3 +935,464 @@ class HelicalAntenna(Antenna):
                 / self.wavelength**3
             )
         return self._gain
+
+
+class TabulatedAntenna(Antenna):
+    __slots__ = ("_gain_pattern",)
+
+    def __init__(
+        self,
+        gain_pattern: RegularGrid,
+        amplifier: Amplifier = None,
+        gain: float = None,
+        loss: float = 1,
+        frequency: float = None,
+        wavelength: float = None,
+        efficiency: float = None,
+        half_beamwidth: float = None,  # deg
+        modulation: Modulation = None,
+        combined_loss: float = None,
+    ):
+        """
+        An antenna described by a measured gain pattern
+
+        Parameters
+        ----------
+            gain_pattern (RegularGrid, dBi): the gain sampled against elevation (rows)
+                and azimuth (columns) in degrees relative to the antenna boresight.
+                May be memory mapped, in which case pickled copies re-open the file
+                rather than carrying the table.
+            gain (float, optional): the boresight gain, defaults to the peak of the
+                pattern
+            see Antenna for the remaining parameters
+        """
+        self._gain_pattern = gain_pattern
+        super().__init__(
+            amplifier=amplifier,
+            gain=gain,
+            loss=loss,
+            frequency=frequency,
+            wavelength=wavelength,
+            efficiency=efficiency,
+            half_beamwidth=half_beamwidth,
+            modulation=modulation,
+            combined_loss=combined_loss,
+        )
+
+    @classmethod
+    def from_file(
+        cls,
+        path: str,
+        elevation_start: float,
+        elevation_step: float,
+        azimuth_start: float,
+        azimuth_step: float,
+        azimuth_period: float = None,
+        shape: tuple = None,
+        dtype: str = "float64",
+        **kwargs,
+    ) -> "TabulatedAntenna":
+        """
+        Memory map a measured pattern from a local file
+
+        Parameters
+        ----------
+            path (str, ): the path to the pattern, in any format RegularGrid.from_file
+                reads
+            elevation_start (float, deg): the elevation of the first row
+            elevation_step (float, deg): the spacing between rows
+            azimuth_start (float, deg): the azimuth of the first column
+            azimuth_step (float, deg): the spacing between columns
+            azimuth_period (float, deg, optional): the period used to wrap azimuths,
+                e.g. 360 for a pattern covering a full turn. Azimuths outside a
+                pattern without one are clamped to its edges.
+            shape (tuple, optional): the (rows, columns) shape of a raw binary file
+            dtype (str, optional): the data type of a raw binary file
+            kwargs: passed to TabulatedAntenna
+
+        Returns
+        -------
+            antenna (TabulatedAntenna, )
+        """
+        gain_pattern = RegularGrid.from_file(
+            path,
+            elevation_start,
+            elevation_step,
+            azimuth_start,
+            azimuth_step,
+            column_period=azimuth_period,
+            shape=shape,
+            dtype=dtype,
+        )
+        return cls(gain_pattern, **kwargs)
+
+    @property
+    def gain_pattern(self) -> RegularGrid:
+        return self._gain_pattern
+
+    @property
+    def gain(self) -> float:
+        """
+        Returns
+        -------
+            gain (float, ): the boresight gain, the peak of the pattern unless given
+        """
+        if self._gain is None:
+            self._gain = decibel_to_watt(float(np.max(self.gain_pattern.values)))
+        return self._gain
+
+    def directional_gain(
+        self, azimuth: np.ndarray, elevation: np.ndarray
+    ) -> np.ndarray:
+        """
+        Interpolate the gain towards arbitrary directions
+
+        Parameters
+        ----------
+            azimuth (np.ndarray, deg): azimuths relative to boresight, scalar or array
+            elevation (np.ndarray, deg): elevations relative to boresight,
+                broadcastable with azimuth
+
+        Returns
+        -------
+            gain (np.ndarray, )
+        """
+        return decibel_to_watt(self.gain_pattern.interpolate(elevation, azimuth))
+
+    def pattern(self, off_axis_angle: np.ndarray) -> np.ndarray:
+        """
+        Interpolate the gain along the elevation cut through boresight
+
+        Parameters
+        ----------
+            off_axis_angle (np.ndarray, deg): the angles from boresight, scalar or
+                array
+
+        Returns
+        -------
+            gain (np.ndarray, )
+        """
+        return self.directional_gain(0, off_axis_angle)
+
+
+class PhasedArrayAntenna(Antenna):
+    __slots__ = (
+        "_element_positions",
+        "_weights",
+        "_element_gain",
+        "_element_exponent",
+        "_steering_angle",
+        "_steering_azimuth",
+        "_system_noise_temperature",
+    )
+
+    def __init__(
+        self,
+        element_positions: np.ndarray,
+        frequency: float = None,
+        wavelength: float = None,
+        weights: np.ndarray = None,
+        element_gain: float = None,
+        element_exponent: float = 1.2,
+        steering_angle: float = 0,
+        steering_azimuth: float = 0,
+        system_noise_temperature: float = None,
+        amplifier: Amplifier = None,
+        loss: float = 1,
+        modulation: Modulation = None,
+        combined_loss: float = None,
+        half_beamwidth: float = None,  # deg
+    ):
+        """
+        An electronically steered planar array
+
+        The array lies in the x-y plane with its normal at boresight. Each element
+        has a cos^q(theta) pattern, and the array factor is summed over the elements
+        with the phases that steer the beam.
+
+        Parameters
+        ----------
+            element_positions (np.ndarray, m): the (x, y) position of each element,
+                with shape (n_elements, 2)
+            frequency (float, GHz): the operating frequency
+            wavelength (float, m): the radiation wavelength
+            weights (np.ndarray, optional): the amplitude excitation of each element,
+                defaults to uniform
+            element_gain (float, optional): the boresight gain of one element
+                embedded in the array, defaults to pi, the gain of a half wavelength
+                lattice cell
+            element_exponent (float, ): the exponent q of the element pattern
+            steering_angle (float, deg): the angle of the beam from boresight
+            steering_azimuth (float, deg): the azimuth of the beam about boresight,
+                from the x axis
+            system_noise_temperature (float, K, optional): the receive system noise
+                temperature, used for G/T
+            amplifier (Amplifier, optional): the total power fed to the array
+            see Antenna for the remaining parameters
+        """
+        self._element_positions = np.asarray(element_positions, dtype=float)
+        if weights is None:
+            weights = np.ones(len(self._element_positions))
+        self._weights = np.asarray(weights, dtype=float)
+        if element_gain is None:
+            element_gain = pi
+        self._element_gain = element_gain
+        self._element_exponent = element_exponent
+        self._steering_angle = steering_angle
+        self._steering_azimuth = steering_azimuth
+        self._system_noise_temperature = system_noise_temperature
+        super().__init__(
+            amplifier=amplifier,
+            loss=loss,
+            frequency=frequency,
+            wavelength=wavelength,
+            half_beamwidth=half_beamwidth,
+            modulation=modulation,
+            combined_loss=combined_loss,
+        )
+
+    @classmethod
+    def rectangular(
+        cls,
+        n_rows: int,
+        n_columns: int,
+        spacing: float = None,
+        frequency: float = None,
+        wavelength: float = None,
+        **kwargs,
+    ) -> "PhasedArrayAntenna":
+        """
+        Build an array on a rectangular grid centred on the origin
+
+        Parameters
+        ----------
+            n_rows (int, ): the number of elements along y
+            n_columns (int, ): the number of elements along x
+            spacing (float, m, optional): the element spacing, defaults to half a
+                wavelength
+            frequency (float, GHz): the operating frequency
+            wavelength (float, m): the radiation wavelength
+            kwargs: passed to PhasedArrayAntenna. The element gain defaults to the
+                gain of a lattice cell, 4 pi spacing^2 / wavelength^2
+
+        Returns
+        -------
+            antenna (PhasedArrayAntenna, )
+        """
+        if wavelength is None:
+            wavelength = frequency_to_wavelength(frequency)
+        if spacing is None:
+            spacing = wavelength / 2
+        x = spacing * (np.arange(n_columns) - (n_columns - 1) / 2)
+        y = spacing * (np.arange(n_rows) - (n_rows - 1) / 2)
+        positions = np.stack(np.meshgrid(x, y), axis=-1).reshape(-1, 2)
+        kwargs.setdefault("element_gain", 4 * pi * spacing**2 / wavelength**2)
+        return cls(positions, frequency=frequency, wavelength=wavelength, **kwargs)
+
+    @property
+    def element_positions(self) -> np.ndarray:
+        return self._element_positions
+
+    @property
+    def n_elements(self) -> int:
+        return len(self._element_positions)
+
+    @property
+    def weights(self) -> np.ndarray:
+        return self._weights
+
+    @property
+    def element_gain(self) -> float:
+        return self._element_gain
+
+    @property
+    def element_exponent(self) -> float:
+        return self._element_exponent
+
+    @property
+    def steering_angle(self) -> float:
+        return self._steering_angle
+
+    @property
+    def steering_azimuth(self) -> float:
+        return self._steering_azimuth
+
+    @property
+    def system_noise_temperature(self) -> float:
+        return self._system_noise_temperature
+
+    @property
+    def array_gain(self) -> float:
+        """
+        Returns
+        -------
+            array_gain (float, ): the gain of the array factor in the steered
+                direction, the number of elements for uniform weights
+        """
+        return np.sum(self.weights) ** 2 / np.sum(self.weights**2)
+
+    def element_pattern(self, theta: np.ndarray) -> np.ndarray:
+        """
+        Calculate the gain of one element relative to its boresight gain
+
+        Parameters
+        ----------
+            theta (np.ndarray, deg): the angles from boresight, scalar or array
+
+        Returns
+        -------
+            relative_gain (np.ndarray, ): zero behind the array
+        """
+        cos_theta = np.cos(np.radians(theta))
+        return np.where(cos_theta > 0, np.abs(cos_theta) ** self.element_exponent, 0.0)[
+            ()
+        ]
+
+    def scan_loss(self, steering_angle: np.ndarray = None) -> np.ndarray:
+        """
+        Calculate the loss of peak gain from steering the beam away from boresight,
+        as the element pattern falls and the projected aperture shrinks
+
+        Parameters
+        ----------
+            steering_angle (np.ndarray, deg, optional): the steering angles, scalar or
+                array, defaults to the array's steering angle
+
+        Returns
+        -------
+            scan_loss (np.ndarray, )
+        """
+        if steering_angle is None:
+            steering_angle = self.steering_angle
+        return self.element_pattern(steering_angle)
+
+    def scanned_gain(self, steering_angle: np.ndarray = None) -> np.ndarray:
+        """
+        Calculate the peak gain of the beam when steered
+
+        Parameters
+        ----------
+            steering_angle (np.ndarray, deg, optional): the steering angles, scalar or
+                array, defaults to the array's steering angle
+
+        Returns
+        -------
+            gain (np.ndarray, )
+        """
+        return self.element_gain * self.array_gain * self.scan_loss(steering_angle)
+
+    def array_factor(
+        self,
+        theta: np.ndarray,
+        phi: np.ndarray = 0,
+        steering_angle: np.ndarray = None,
+        steering_azimuth: np.ndarray = None,
+    ) -> np.ndarray:
+        """
+        Calculate the array factor, normalised to one in the steered direction
+
+        All angles broadcast together, so a pattern cut for many steering angles is
+        theta[None, :] against steering_angle[:, None].
+
+        Parameters
+        ----------
+            theta (np.ndarray, deg): the angles of the directions from boresight
+            phi (np.ndarray, deg): the azimuths of the directions about boresight
+            steering_angle (np.ndarray, deg, optional): the steering angles, defaults
+                to the array's steering angle
+            steering_azimuth (np.ndarray, deg, optional): the steering azimuths,
+                defaults to the array's steering azimuth
+
+        Returns
+        -------
+            array_factor (np.ndarray, ): the complex array factor
+        """
+        if steering_angle is None:
+            steering_angle = self.steering_angle
+        if steering_azimuth is None:
+            steering_azimuth = self.steering_azimuth
+        theta, phi, steering_angle, steering_azimuth = np.broadcast_arrays(
+            *(
+                np.radians(angle)
+                for angle in (theta, phi, steering_angle, steering_azimuth)
+            )
+        )
+        # direction cosines relative to the steered direction
+        u = np.sin(theta) * np.cos(phi) - np.sin(steering_angle) * np.cos(
+            steering_azimuth
+        )
+        v = np.sin(theta) * np.sin(phi) - np.sin(steering_angle) * np.sin(
+            steering_azimuth
+        )
+        wavenumber = 2 * np.pi / self.wavelength
+        x, y = self.element_positions.T
+        phase = wavenumber * (u[..., None] * x + v[..., None] * y)
+        return (np.exp(1j * phase) @ self.weights / np.sum(self.weights))[()]
+
+    def beam_pattern(
+        self,
+        theta: np.ndarray,
+        phi: np.ndarray = 0,
+        steering_angle: np.ndarray = None,
+        steering_azimuth: np.ndarray = None,
+    ) -> np.ndarray:
+        """
+        Calculate the gain towards arbitrary directions
+
+        Parameters
+        ----------
+            see array_factor
+
+        Returns
+        -------
+            gain (np.ndarray, )
+        """
+        array_factor = self.array_factor(theta, phi, steering_angle, steering_azimuth)
+        return (
+            self.element_gain
+            * self.element_pattern(theta)
+            * self.array_gain
+            * np.abs(array_factor) ** 2
+        )
+
+    def pattern(self, off_axis_angle: np.ndarray) -> np.ndarray:
+        """
+        Calculate the gain away from the steered beam, in the plane of steering
+
+        Parameters
+        ----------
+            off_axis_angle (np.ndarray, deg): the angles from the beam, scalar or
+                array
+
+        Returns
+        -------
+            gain (np.ndarray, )
+        """
+        return self.beam_pattern(
+            self.steering_angle + np.asarray(off_axis_angle), self.steering_azimuth
+        )
+
+    @property
+    def gain(self) -> float:
+        """
+        Returns
+        -------
+            gain (float, ): the peak gain of the steered beam, including scan loss
+        """
+        if self._gain is None:
+            self._gain = self.scanned_gain()
+        return self._gain
+
+    @property
+    def gain_to_noise_temperature(self) -> float:
+        """
+        Returns
+        -------
+            gain_to_noise_temperature (float, 1/K): the G/T of the steered beam
+        """
+        if self._gain_to_noise_temperature is None:
+            if self._isset(self._system_noise_temperature):
+                self._gain_to_noise_temperature = (
+                    self.gain / self.system_noise_temperature
+                )
+        return self._gain_to_noise_temperature
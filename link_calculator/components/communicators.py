@@ -9,6 +9,19 @@ from link_calculator.orbits.utils import GeodeticCoordinate, Orbit
 
 
 class Communicator:
+    __slots__ = (
+        "_name",
+        "_transmit",
+        "_receive",
+        "_ground_coordinate",
+        "_noise_figure",
+        "_noise_density",
+        "_noise_temperature",
+        "_combined_gain",
+        "_gain_to_equiv_noise_temp",
+        "_equiv_noise_temp",
+    )
+
     def __init__(
         self,
         name: str,
@@ -111,6 +124,10 @@ class Communicator:
                 ) / (self.noise_density * self.receive_carrier_power)
         return self._gain_to_equiv_noise_temp
 
+    @property
+    def name(self) -> str:
+        return self._name
+
     @property
     def ground_coordinate(self) -> GeodeticCoordinate:
         return self._ground_coordinate
@@ -173,10 +190,12 @@ class Communicator:
                 getattr(self, var)
 
     def _isset(self, *args) -> bool:
-        return not (None in args)
+        return all(arg is not None for arg in args)
 
 
 class GroundStation(Communicator):
+    __slots__ = ()
+
     def __init__(
         self,
         name: str,
@@ -219,6 +238,8 @@ class GroundStation(Communicator):
 
 
 class Satellite(Communicator):
+    __slots__ = ("_orbit",)
+
     def __init__(
         self,
         name: str,
@@ -0,0 +1,209 @@
+import numpy as np
+from scipy.special import chndtrix
+
+from link_calculator.components.antennas import GAUSSIAN_BEAM_CONSTANT, gaussian_pattern
+
+
+def _broadcast(*args) -> list:
+    return np.broadcast_arrays(*(np.asarray(arg, dtype=float) for arg in args))
+
+
+def mean_pointing_loss(
+    half_beamwidth: np.ndarray,
+    bias_elevation: np.ndarray = 0,
+    bias_azimuth: np.ndarray = 0,
+    jitter_elevation: np.ndarray = 0,
+    jitter_azimuth: np.ndarray = None,
+) -> np.ndarray:
+    """
+    Calculate the average pointing loss of a Gaussian beam under a fixed bias and
+    Gaussian jitter on each axis
+
+    The loss factorises over the two axes and the average over a Gaussian error has
+    a closed form, so unequal jitters need no sampling. All parameters broadcast, so
+    arrays of antennas are evaluated at once.
+
+    Parameters
+    ----------
+        half_beamwidth (np.ndarray, deg): the half power beamwidth of each antenna
+        bias_elevation (np.ndarray, deg): the fixed pointing error in elevation
+        bias_azimuth (np.ndarray, deg): the fixed pointing error across azimuth,
+            measured on the sky
+        jitter_elevation (np.ndarray, deg): the standard deviation of the random
+            error in elevation
+        jitter_azimuth (np.ndarray, deg, optional): the standard deviation of the
+            random error across azimuth, defaults to jitter_elevation, so the radial
+            error is Rayleigh (Rician with a bias) distributed
+
+    Returns
+    -------
+        loss (np.ndarray, ): the mean of the pointing loss factor
+    """
+    if jitter_azimuth is None:
+        jitter_azimuth = jitter_elevation
+    coefficient = GAUSSIAN_BEAM_CONSTANT / np.asarray(half_beamwidth, dtype=float) ** 2
+    loss = 1
+    for bias, jitter in [
+        (bias_elevation, jitter_elevation),
+        (bias_azimuth, jitter_azimuth),
+    ]:
+        spread = 1 + 2 * coefficient * np.asarray(jitter) ** 2
+        loss = (
+            loss
+            * np.exp(-coefficient * np.asarray(bias) ** 2 / spread)
+            / np.sqrt(spread)
+        )
+    return loss[()]
+
+
+def pointing_loss_samples(
+    half_beamwidth: np.ndarray,
+    bias_elevation: np.ndarray = 0,
+    bias_azimuth: np.ndarray = 0,
+    jitter_elevation: np.ndarray = 0,
+    jitter_azimuth: np.ndarray = None,
+    n_samples: int = 2**14,
+    seed: int = None,
+) -> np.ndarray:
+    """
+    Draw pointing losses of a Gaussian beam under a fixed bias and Gaussian jitter on
+    each axis
+
+    Parameters
+    ----------
+        see mean_pointing_loss
+        n_samples (int, ): the number of samples drawn for each antenna
+        seed (int, optional): seed for the random number generator
+
+    Returns
+    -------
+        loss (np.ndarray, ): pointing loss factors with shape (n_samples, *shape),
+            where shape is the broadcast shape of the parameters
+    """
+    if jitter_azimuth is None:
+        jitter_azimuth = jitter_elevation
+    (
+        half_beamwidth,
+        bias_elevation,
+        bias_azimuth,
+        jitter_elevation,
+        jitter_azimuth,
+    ) = _broadcast(
+        half_beamwidth, bias_elevation, bias_azimuth, jitter_elevation, jitter_azimuth
+    )
+    rng = np.random.default_rng(seed)
+    size = (n_samples, *half_beamwidth.shape)
+    elevation = bias_elevation + jitter_elevation * rng.standard_normal(size)
+    azimuth = bias_azimuth + jitter_azimuth * rng.standard_normal(size)
+    return gaussian_pattern(np.hypot(elevation, azimuth), half_beamwidth)
+
+
+def pointing_loss_percentile(
+    percentile: np.ndarray,
+    half_beamwidth: np.ndarray,
+    bias_elevation: np.ndarray = 0,
+    bias_azimuth: np.ndarray = 0,
+    jitter_elevation: np.ndarray = 0,
+    jitter_azimuth: np.ndarray = None,
+    n_samples: int = 2**14,
+    seed: int = None,
+) -> np.ndarray:
+    """
+    Calculate the pointing loss that is not exceeded for a fraction of the time
+
+    With equal jitter on both axes the squared radial error is a scaled non-central
+    chi-squared variable with two degrees of freedom, whose quantiles give the loss
+    exactly. Antennas with unequal jitters are evaluated from samples.
+
+    Parameters
+    ----------
+        percentile (np.ndarray, ): the fractions of time, in [0, 1), scalar or 1-D
+        see mean_pointing_loss for the remaining parameters
+        n_samples (int, ): the number of samples drawn when no closed form applies
+        seed (int, optional): seed for the random number generator
+
+    Returns
+    -------
+        loss (np.ndarray, ): the pointing loss factor the loss is no worse than for
+            each fraction of the time, with shape (*percentile.shape, *shape)
+    """
+    if jitter_azimuth is None:
+        jitter_azimuth = jitter_elevation
+    percentile = np.asarray(percentile, dtype=float)
+    (
+        half_beamwidth,
+        bias_elevation,
+        bias_azimuth,
+        jitter_elevation,
+        jitter_azimuth,
+    ) = _broadcast(
+        half_beamwidth, bias_elevation, bias_azimuth, jitter_elevation, jitter_azimuth
+    )
+    shape = percentile.shape + (1,) * half_beamwidth.ndim
+    quantile = percentile.reshape(shape)
+
+    bias = np.hypot(bias_elevation, bias_azimuth)
+    variance = jitter_elevation**2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        squared_error = variance * chndtrix(quantile, 2, bias**2 / variance)
+    squared_error = np.where(variance == 0, bias**2, squared_error)
+    loss = np.exp(-GAUSSIAN_BEAM_CONSTANT * squared_error / half_beamwidth**2)
+
+    circular = jitter_elevation == jitter_azimuth
+    if not np.all(circular):
+        samples = pointing_loss_samples(
+            half_beamwidth,
+            bias_elevation,
+            bias_azimuth,
+            jitter_elevation,
+            jitter_azimuth,
+            n_samples,
+            seed,
+        )
+        # the loss is no worse than L for a fraction p of the time when L is the
+        # (1 - p) quantile of the loss factor
+        sampled = np.quantile(samples, 1 - percentile, axis=0)
+        loss = np.where(circular, loss, sampled)
+    return loss[()]
+
+
+def max_jitter(
+    loss: np.ndarray,
+    percentile: np.ndarray,
+    half_beamwidth: np.ndarray,
+    bias: np.ndarray = 0,
+    iterations: int = 60,
+) -> np.ndarray:
+    """
+    Calculate the largest per-axis jitter that keeps the pointing loss within a limit
+    for a fraction of the time, for sizing tracking accuracy
+
+    Parameters
+    ----------
+        loss (np.ndarray, ): the worst acceptable pointing loss factor, in (0, 1)
+        percentile (np.ndarray, ): the fraction of time the loss must be met
+        half_beamwidth (np.ndarray, deg): the half power beamwidth of each antenna
+        bias (np.ndarray, deg): the magnitude of the fixed pointing error
+        iterations (int, ): the number of bisection steps
+
+    Returns
+    -------
+        jitter (np.ndarray, deg): the standard deviation of the random error on each
+            axis, nan where the bias alone exceeds the loss
+    """
+    loss, percentile, half_beamwidth, bias = _broadcast(
+        loss, percentile, half_beamwidth, bias
+    )
+    # the largest squared radial error the loss allows
+    allowed = -np.log(loss) * half_beamwidth**2 / GAUSSIAN_BEAM_CONSTANT
+    # a bias only raises the quantiles, so the unbiased solution bounds the jitter
+    lower = np.zeros(allowed.shape)
+    upper = np.sqrt(allowed / chndtrix(percentile, 2, 0))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for _ in range(iterations):
+            middle = (lower + upper) / 2
+            error = middle**2 * chndtrix(percentile, 2, bias**2 / middle**2)
+            too_large = error > allowed
+            upper = np.where(too_large, middle, upper)
+            lower = np.where(too_large, lower, middle)
+    return np.where(bias**2 > allowed, np.nan, lower)[()]
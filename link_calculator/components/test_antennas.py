@@ -1,3 +1,4 @@
+import pickle
 from math import degrees, isclose
 
 import numpy as np
@@ -5,8 +6,13 @@ import numpy as np
 from link_calculator.components.antennas import (
     Amplifier,
     Antenna,
+    HalfWaveDipole,
     ParabolicAntenna,
+    PhasedArrayAntenna,
     SquareHornAntenna,
+    TabulatedAntenna,
+    aperture_pattern,
+    gaussian_pattern,
 )
 from link_calculator.conversions import (
     decibel_to_watt,
@@ -60,6 +66,48 @@ def test_pointing_loss_1():
     )
 
 
+def test_pointing_loss_array():
+    ant = Antenna(half_beamwidth=np.array([1, 2]))
+    pointing_error = np.array([[0], [0.5], [1]])
+    loss = ant.pointing_loss(pointing_error)
+    assert loss.shape == (3, 2)
+    assert np.allclose(loss[0], 1)
+    assert np.allclose(loss[1, 0], gaussian_pattern(0.5, 1))
+    assert np.isclose(loss[1, 0], 0.5, rtol=0.01)
+
+
+def test_aperture_pattern():
+    diameter, wavelength = 2, 0.025
+    # the half power and first null angles of a uniformly illuminated aperture
+    assert np.isclose(aperture_pattern(0, diameter, wavelength), 1)
+    assert np.isclose(
+        aperture_pattern(29.2 * wavelength / diameter, diameter, wavelength),
+        0.5,
+        rtol=0.02,
+    )
+    null = degrees(np.arcsin(1.2197 * wavelength / diameter))
+    assert aperture_pattern(null, diameter, wavelength) < 1e-6
+
+    # tapered illumination broadens the main beam
+    angle = np.linspace(0, 0.8 * null, 50)
+    assert np.all(
+        aperture_pattern(angle, diameter, wavelength, taper=1)
+        >= aperture_pattern(angle, diameter, wavelength) - 1e-12
+    )
+
+    ant = ParabolicAntenna(circular_diameter=2, efficiency=0.6, frequency=12)
+    assert np.isclose(ant.aperture_gain(0), ant.gain)
+    assert ant.aperture_gain(np.array([0.1, 0.2])).shape == (2,)
+
+
+def test_dipole_pattern():
+    dipole = HalfWaveDipole(frequency=1)
+    gain = dipole.off_sight_gain(np.array([0, 45, 90, 180]))
+    assert np.allclose(gain[[0, 3]], 0)
+    assert np.isclose(gain[2], 1)
+    assert np.isclose(gain[1], dipole.off_sight_gain(45))
+
+
 def test_received_power():
     sat_altitude = 40000  # km
     transmit_gain = decibel_to_watt(17)  # dB
@@ -131,3 +179,75 @@ def test_receive_power_4():
         distance,
     )
     assert isclose(watt_to_decibel(power), -116, rel_tol=0.01)
+
+
+def test_tabulated_antenna(tmp_path):
+    elevation = np.arange(-90, 91, 1.0)
+    azimuth = np.arange(0, 360, 2.0)
+    # an elliptical beam, narrower in elevation than azimuth
+    offset = np.minimum(azimuth, 360 - azimuth)
+    values = 30 - 12 * (
+        (elevation[:, None] / 4) ** 2 + (offset[None, :] / 8) ** 2
+    ).clip(max=4)
+    path = tmp_path / "pattern.npy"
+    np.save(path, values)
+
+    amp = Amplifier(power=10)
+    ant = TabulatedAntenna.from_file(
+        path, -90, 1, 0, 2, azimuth_period=360, amplifier=amp
+    )
+    assert isinstance(ant.gain_pattern.values, np.memmap)
+    assert np.isclose(watt_to_decibel(ant.gain), 30)
+    assert np.isclose(watt_to_decibel(ant.eirp), 40)
+
+    gain = watt_to_decibel(ant.directional_gain(np.array([0, 8, 359]), 2))
+    assert np.allclose(gain[:2], [27, 15])
+    # wrapped and interpolated between columns
+    assert np.isclose(
+        gain[2], (gain[0] + watt_to_decibel(ant.directional_gain(2, 2))) / 2, atol=0.1
+    )
+    assert np.isclose(watt_to_decibel(ant.pattern(4)), 18)
+
+    # a measured sector is not wrapped into by azimuths outside it
+    sector_path = tmp_path / "sector.npy"
+    np.save(sector_path, values[:, :16])
+    sector = TabulatedAntenna.from_file(sector_path, -90, 1, 0, 2)
+    assert np.isclose(sector.directional_gain(40, 0), sector.directional_gain(30, 0))
+
+    copy = pickle.loads(pickle.dumps(ant))
+    assert isinstance(copy.gain_pattern.values, np.memmap)
+    assert np.allclose(
+        copy.directional_gain(azimuth, 1), ant.directional_gain(azimuth, 1)
+    )
+
+
+def test_phased_array():
+    wavelength = frequency_to_wavelength(12)
+    ant = PhasedArrayAntenna.rectangular(16, 16, frequency=12, amplifier=Amplifier(2))
+    assert ant.n_elements == 256
+    # a filled half wavelength lattice reaches the gain of its aperture
+    assert np.isclose(ant.gain, 4 * np.pi * (8 * wavelength) ** 2 / wavelength**2)
+    assert np.isclose(ant.eirp, 2 * ant.gain)
+
+    steering = np.array([0, 30, 60])
+    assert np.allclose(
+        ant.scanned_gain(steering), ant.gain * np.cos(np.radians(steering)) ** 1.2
+    )
+
+    # the beam follows the steering angle, pulled slightly towards boresight by the
+    # element pattern, and broadens as it is scanned
+    theta = np.linspace(-90, 90, 1801)
+    gain = ant.beam_pattern(theta[None, :], 0, steering[:, None])
+    assert gain.shape == (3, 1801)
+    assert np.allclose(theta[np.argmax(gain, axis=1)], steering, atol=1.5)
+    width = np.sum(gain > gain.max(axis=1, keepdims=True) / 2, axis=1)
+    assert np.all(np.diff(width) > 0)
+    # uniform illumination has a half power beamwidth of 0.886 wavelength / length
+    assert np.isclose(width[0] * 0.1, degrees(0.886 / 8), rtol=0.05)
+
+    steered = PhasedArrayAntenna.rectangular(
+        16, 16, frequency=12, steering_angle=30, system_noise_temperature=150
+    )
+    assert np.isclose(abs(steered.array_factor(30)), 1)
+    assert np.isclose(steered.pattern(0), steered.gain)
+    assert np.isclose(steered.gain_to_noise_temperature, steered.gain / 150)
@@ -0,0 +1,71 @@
+import numpy as np
+
+from link_calculator.components.antennas import Antenna
+from link_calculator.components.pointing import (
+    max_jitter,
+    mean_pointing_loss,
+    pointing_loss_percentile,
+    pointing_loss_samples,
+)
+
+
+def test_mean_pointing_loss():
+    half_beamwidth = np.array([0.5, 1, 2])
+    assert np.allclose(mean_pointing_loss(half_beamwidth), 1)
+
+    # a bias alone is the deterministic pointing loss
+    ant = Antenna(half_beamwidth=half_beamwidth)
+    assert np.allclose(
+        mean_pointing_loss(half_beamwidth, 0.1, 0.2),
+        ant.pointing_loss(np.hypot(0.1, 0.2)),
+    )
+
+    samples = pointing_loss_samples(
+        half_beamwidth, 0.1, 0.05, 0.1, 0.2, n_samples=10**6, seed=0
+    )
+    assert samples.shape == (10**6, 3)
+    assert np.allclose(
+        mean_pointing_loss(half_beamwidth, 0.1, 0.05, 0.1, 0.2),
+        samples.mean(axis=0),
+        rtol=1e-3,
+    )
+
+
+def test_pointing_loss_percentile():
+    half_beamwidth = np.array([0.5, 1, 2])
+    percentile = np.array([0.5, 0.9, 0.99])
+
+    # the radial error is Rayleigh distributed without a bias
+    loss = pointing_loss_percentile(percentile, half_beamwidth, jitter_elevation=0.1)
+    squared_error = -2 * 0.1**2 * np.log(1 - percentile[:, None])
+    assert np.allclose(loss, np.exp(-2.76 * squared_error / half_beamwidth**2))
+
+    # a bias makes it Rician
+    samples = pointing_loss_samples(
+        half_beamwidth, 0.1, 0.05, 0.1, n_samples=10**6, seed=0
+    )
+    assert np.allclose(
+        pointing_loss_percentile(percentile, half_beamwidth, 0.1, 0.05, 0.1),
+        np.quantile(samples, 1 - percentile, axis=0),
+        rtol=1e-2,
+    )
+
+    # antennas with unequal jitters are sampled
+    jitter_azimuth = np.array([0.1, 0.2, 0.1])
+    loss = pointing_loss_percentile(
+        percentile, half_beamwidth, 0.1, 0.05, 0.1, jitter_azimuth, seed=0
+    )
+    assert loss.shape == (3, 3)
+    assert np.all(np.diff(loss, axis=0) < 0)
+    assert np.all(loss[:, 1] < pointing_loss_percentile(percentile, 1, 0.1, 0.05, 0.1))
+
+
+def test_max_jitter():
+    half_beamwidth = np.array([0.5, 1, 2])
+    loss = 10 ** (-0.5 / 10)
+    jitter = max_jitter(loss, 0.99, half_beamwidth, 0.05)
+    assert np.all(np.diff(jitter) > 0)
+    assert np.allclose(
+        pointing_loss_percentile(0.99, half_beamwidth, 0.05, 0, jitter), loss
+    )
+    assert np.isnan(max_jitter(loss, 0.99, 0.5, 0.5))
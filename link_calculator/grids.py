@@ -0,0 +1,236 @@
+import os
+import tempfile
+
+import numpy as np
+
+
+def _save_npy(path: str, values: np.ndarray) -> bool:
+    """
+    Write an array to a .npy file atomically, so concurrent readers and writers only
+    ever see a complete file
+
+    Returns
+    -------
+        saved (bool, ): False if the directory is not writable
+    """
+    try:
+        descriptor, temporary_path = tempfile.mkstemp(
+            suffix=".npy", dir=os.path.dirname(path) or "."
+        )
+    except OSError:
+        return False
+    try:
+        with os.fdopen(descriptor, "wb") as f:
+            np.save(f, values)
+        os.replace(temporary_path, path)
+    except OSError:
+        os.remove(temporary_path)
+        return False
+    return True
+
+
+class RegularGrid:
+    def __init__(
+        self,
+        values: np.ndarray,
+        row_start: float,
+        row_step: float,
+        column_start: float,
+        column_step: float,
+        column_period: float = None,
+        path: str = None,
+    ):
+        """
+        A 2-D table of values sampled on a regular grid, e.g. a climate map indexed by
+        (latitude, longitude) or an antenna pattern indexed by (elevation, azimuth)
+
+        Parameters
+        ----------
+            values (np.ndarray, ): the gridded values with shape (rows, columns). May be
+                a read-only memory map
+            row_start (float, ): the coordinate of the first row
+            row_step (float, ): the spacing between rows
+            column_start (float, ): the coordinate of the first column
+            column_step (float, ): the spacing between columns
+            column_period (float, optional): the period of the column coordinate
+                (e.g. 360 deg of longitude), used to wrap lookups around the grid
+            path (str, optional): the file the values were memory mapped from
+        """
+        self._values = values
+        self._row_start = row_start
+        self._row_step = row_step
+        self._column_start = column_start
+        self._column_step = column_step
+        self._column_period = column_period
+        self._path = path
+
+    @classmethod
+    def from_file(
+        cls,
+        path: str,
+        row_start: float,
+        row_step: float,
+        column_start: float,
+        column_step: float,
+        column_period: float = None,
+        shape: tuple = None,
+        dtype: str = "float64",
+        delimiter: str = ",",
+    ) -> "RegularGrid":
+        """
+        Memory map a grid from a local file
+
+        Files ending in .npy are memory mapped directly. CSV files (.csv, .txt) are
+        parsed once and stored atomically as a .npy file alongside the original, which
+        is then memory mapped; if the directory is not writable the parsed grid is
+        kept in memory instead. Any other file is read as raw binary with the given
+        shape and dtype.
+
+        Parameters
+        ----------
+            path (str, ): the path to the grid file
+            row_start, row_step, column_start, column_step, column_period: see
+                RegularGrid
+            shape (tuple, optional): the (rows, columns) shape of a raw binary grid
+            dtype (str, optional): the data type of a raw binary grid
+            delimiter (str, optional): the delimiter of a CSV grid
+
+        Returns
+        -------
+            grid (RegularGrid, )
+        """
+        path = os.fspath(path)
+        _, extension = os.path.splitext(path)
+        values = None
+        if extension in (".csv", ".txt"):
+            npy_path = path + ".npy"
+            if not os.path.exists(npy_path) or os.path.getmtime(
+                npy_path
+            ) < os.path.getmtime(path):
+                values = np.loadtxt(path, delimiter=delimiter, ndmin=2)
+                if _save_npy(npy_path, values):
+                    values = None
+            if values is None:
+                path = npy_path
+                extension = ".npy"
+            else:
+                path = None
+
+        if values is None and extension == ".npy":
+            values = np.load(path, mmap_mode="r")
+        elif values is None:
+            if shape is None:
+                raise ValueError("The shape of a raw binary grid must be given")
+            values = np.memmap(path, dtype=dtype, mode="r", shape=tuple(shape))
+
+        if values.ndim != 2:
+            raise ValueError(f"Expected a 2-D grid, got shape {values.shape}")
+        return cls(
+            values,
+            row_start,
+            row_step,
+            column_start,
+            column_step,
+            column_period=column_period,
+            path=path,
+        )
+
+    @property
+    def values(self) -> np.ndarray:
+        return self._values
+
+    @property
+    def shape(self) -> tuple:
+        return self._values.shape
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def rows(self) -> np.ndarray:
+        return self._row_start + self._row_step * np.arange(self.shape[0])
+
+    @property
+    def columns(self) -> np.ndarray:
+        return self._column_start + self._column_step * np.arange(self.shape[1])
+
+    def interpolate(self, row: float, column: float) -> np.ndarray:
+        """
+        Bilinearly interpolate the grid at arbitrary coordinates
+
+        Coordinates outside the grid are clamped to the edge rows, and columns are
+        wrapped if the grid covers its full period. Columns outside a grid that
+        covers part of its period are clamped to the nearer edge column. Only the grid
+        cells surrounding each query point are read, so memory mapped grids are never
+        loaded in full.
+
+        Parameters
+        ----------
+            row (float, ): row coordinates, scalar or array
+            column (float, ): column coordinates, broadcastable with row
+
+        Returns
+        -------
+            values (np.ndarray, ): the interpolated values
+        """
+        row, column = np.broadcast_arrays(
+            np.asarray(row, dtype=float), np.asarray(column, dtype=float)
+        )
+        n_rows, n_columns = self.shape
+
+        row_index = np.clip((row - self._row_start) / self._row_step, 0, n_rows - 1)
+        row_lower = np.minimum(np.floor(row_index).astype(np.intp), max(n_rows - 2, 0))
+        row_fraction = row_index - row_lower
+        row_upper = np.minimum(row_lower + 1, n_rows - 1)
+
+        column_index = (column - self._column_start) / self._column_step
+        n_period = None
+        if self._column_period is not None:
+            n_period = int(round(self._column_period / self._column_step))
+            column_index = np.mod(column_index, n_period)
+        if n_period is not None and n_columns >= n_period:
+            # a grid may repeat its first column at the end of the period
+            column_lower = np.floor(column_index).astype(np.intp)
+            column_fraction = column_index - column_lower
+            column_lower = np.mod(column_lower, n_period)
+            column_upper = np.mod(column_lower + 1, n_period)
+        else:
+            if n_period is not None:
+                # a grid covering part of the period is clamped to whichever edge
+                # column is nearer around the period
+                past_end = column_index - (n_columns - 1)
+                before_start = n_period - column_index
+                column_index = np.where(
+                    (past_end > 0) & (before_start < past_end), 0, column_index
+                )
+            column_index = np.clip(column_index, 0, n_columns - 1)
+            column_lower = np.minimum(
+                np.floor(column_index).astype(np.intp), max(n_columns - 2, 0)
+            )
+            column_fraction = column_index - column_lower
+            column_upper = np.minimum(column_lower + 1, n_columns - 1)
+
+        values = self._values
+        return (
+            (1 - row_fraction) * (1 - column_fraction) * values[row_lower, column_lower]
+            + (1 - row_fraction) * column_fraction * values[row_lower, column_upper]
+            + row_fraction * (1 - column_fraction) * values[row_upper, column_lower]
+            + row_fraction * column_fraction * values[row_upper, column_upper]
+        )[()]
+
+    def __getstate__(self) -> dict:
+        # memory mapped grids are re-opened by path rather than copied to workers
+        state = self.__dict__.copy()
+        if self._path is not None and isinstance(self._values, np.memmap):
+            state["_values"] = (self._values.dtype.str, self._values.shape)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        if isinstance(self._values, tuple):
+            dtype, shape = self._values
+            if self._path.endswith(".npy"):
+                self._values = np.load(self._path, mmap_mode="r")
+            else:
+                self._values = np.memmap(self._path, dtype=dtype, mode="r", shape=shape)
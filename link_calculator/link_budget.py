@@ -12,6 +12,26 @@ from link_calculator.orbits.utils import slant_range
 
 
 class Link:
+    __slots__ = (
+        "_transmitter",
+        "_receiver",
+        "_slant_range",
+        "_atmospheric_loss",
+        "_path_loss",
+        "_min_elevation",
+        "_transmitter_eirp",
+        "_receiver_carrier_power",
+        "_noise_temperature",
+        "_carrier_to_noise_density",
+        "_carrier_to_noise",
+        "_bandwidth_to_bit_rate",
+        "_eb_no",
+        "_noise_power",
+        "_noise_density",
+        "_eb_no_coded",
+        "_carrier_to_noise_coded",
+    )
+
     def __init__(
         self,
         transmitter: Communicator,
@@ -326,10 +346,15 @@ class Link:
                 getattr(self, var)
 
     def _isset(self, *args) -> bool:
-        return not (None in args)
+        return all(arg is not None for arg in args)
 
 
 class LinkBudget:
+    __slots__ = (
+        "_uplink",
+        "_downlink",
+    )
+
     def __init__(
         self,
         uplink: Link,
@@ -68,7 +68,7 @@ class Orbit:
         return self._orbital_radius
 
     def _isset(self, *args):
-        return not (None in args)
+        return all(arg is not None for arg in args)
 
     def eccentricity(self) -> float:
         if self._isset([self._semi_major_axis, self._semi_minor_axis]):
@@ -113,15 +113,21 @@ class GeodeticCoordinate:
 
         Returns
         ------
-            gamma (float, rad): angle between satellite and ground station
+            gamma (float, deg): angle between satellite and ground station. Coordinates
+                holding numpy arrays give an array of angles
         """
-        gamma = acos(
-            cos(radians(self.latitude))
-            * cos(radians(point.latitude))
-            * cos(radians(point.longitude) - radians(self.longitude))
-            + sin(radians(self.latitude)) * sin(radians(point.latitude))
+        gamma = np.arccos(
+            np.clip(
+                np.cos(np.radians(self.latitude))
+                * np.cos(np.radians(point.latitude))
+                * np.cos(np.radians(point.longitude) - np.radians(self.longitude))
+                + np.sin(np.radians(self.latitude))
+                * np.sin(np.radians(point.latitude)),
+                -1,
+                1,
+            )
         )
-        return degrees(gamma)
+        return np.degrees(gamma)[()]
 
     def summary(self) -> pd.DataFrame:
         summary = pd.DataFrame.from_records(
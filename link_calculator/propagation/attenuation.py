@@ -1,58 +1,17 @@
-from math import atan2, cos, degrees, radians
-
 import numpy as np
 
 from link_calculator.components.antennas import Antenna
 from link_calculator.constants import EARTH_RADIUS
-
-
-def slant_path(
-    elevation_angle: float,
-    rain_altitude: float,
-    station_altitude: float,
-) -> float:
-    """
-    Calculate the slant path
-
-    Parameters
-    ----------
-        angle_of_elevation (float, deg): the angle between the Earth station and the satellite
-        rain_height (float, km): the rain height
-        station_altitude (float, km): the rain height of the Earth station above sea level
-        refraction_radius (float, km): The modified radius of the Earth to account for the
-            refraction of the wave by thr troposphere
-
-    Returns
-    -------
-        d_s (float, km): The slant height
-    """
-    refraction_radius = 8500 if station_altitude < 1.0 else EARTH_RADIUS
-    elevation_angle_rad = radians(elevation_angle)
-    if elevation_angle < 5:
-        return (
-            2
-            * (rain_altitude - station_altitude)
-            / np.sqrt(
-                np.sin(elevation_angle_rad) ** 2
-                + 2 * (rain_altitude - station_altitude) / refraction_radius
-            )
-        )
-    else:
-        return (rain_altitude - station_altitude) / np.sin(elevation_angle_rad)
-
-
-def rain_specific_attenuation(frequency: float, rain_rate: float, polarization: str):
-    """
-    TODO()
-
-    Parameters
-    ----------
-
-    Returns
-    -------
-
-    """
-    _f = [
+from link_calculator.propagation.gaseous import (
+    STANDARD_TEMPERATURE,
+    STANDARD_WATER_VAPOUR_DENSITY,
+    gaseous_attenuation,
+)
+from link_calculator.propagation.ionosphere import polarization_loss  # noqa: F401
+
+# ITU-R P.838 rain specific attenuation coefficients, tabulated against frequency (GHz)
+_FREQUENCIES = np.array(
+    [
         1,
         2,
         4,
@@ -80,8 +39,10 @@ def rain_specific_attenuation(frequency: float, rain_rate: float, polarization:
         300,
         400,
     ]
+)
 
-    _kH = [
+_K_HORIZONTAL = np.array(
+    [
         0.0000387,
         0.000154,
         0.00065,
@@ -109,8 +70,10 @@ def rain_specific_attenuation(frequency: float, rain_rate: float, polarization:
         1.36,
         1.32,
     ]
+)
 
-    _kV = [
+_K_VERTICAL = np.array(
+    [
         0.0000352,
         0.000138,
         0.000591,
@@ -138,8 +101,10 @@ def rain_specific_attenuation(frequency: float, rain_rate: float, polarization:
         1.35,
         1.31,
     ]
+)
 
-    _alphaH = [
+_ALPHA_HORIZONTAL = np.array(
+    [
         0.912,
         0.963,
         1.121,
@@ -167,8 +132,10 @@ def rain_specific_attenuation(frequency: float, rain_rate: float, polarization:
         0.688,
         0.683,
     ]
+)
 
-    _alphaV = [
+_ALPHA_VERTICAL = np.array(
+    [
         0.88,
         0.923,
         1.075,
@@ -196,12 +163,80 @@ def rain_specific_attenuation(frequency: float, rain_rate: float, polarization:
         0.689,
         0.684,
     ]
+)
+
+
+_LOG_FREQUENCIES = np.log(_FREQUENCIES)
+_LOG_K_HORIZONTAL = np.log(_K_HORIZONTAL)
+_LOG_K_VERTICAL = np.log(_K_VERTICAL)
+
+# Percentages of time (%) over which the rain attenuation scaling is valid
+EXCEEDANCE_PERCENTAGES = np.logspace(-3, np.log10(5), 64)
+
+
+def slant_path(
+    elevation_angle: float,
+    rain_altitude: float,
+    station_altitude: float,
+) -> float:
+    """
+    Calculate the slant path
+
+    All parameters may be scalars or broadcastable numpy arrays; the low elevation
+    and high altitude cases are selected element-wise.
+
+    Parameters
+    ----------
+        angle_of_elevation (float, deg): the angle between the Earth station and the satellite
+        rain_height (float, km): the rain height
+        station_altitude (float, km): the rain height of the Earth station above sea level
+        refraction_radius (float, km): The modified radius of the Earth to account for the
+            refraction of the wave by thr troposphere
+
+    Returns
+    -------
+        d_s (float, km): The slant height
+    """
+    elevation_angle = np.asarray(elevation_angle)
+    station_altitude = np.asarray(station_altitude)
+    refraction_radius = np.where(station_altitude < 1.0, 8500, EARTH_RADIUS)
+    elevation_angle_rad = np.radians(elevation_angle)
+    rain_height = rain_altitude - station_altitude
+    with np.errstate(divide="ignore", invalid="ignore"):
+        low_elevation = (
+            2
+            * rain_height
+            / np.sqrt(
+                np.sin(elevation_angle_rad) ** 2 + 2 * rain_height / refraction_radius
+            )
+        )
+        high_elevation = rain_height / np.sin(elevation_angle_rad)
+    return np.where(elevation_angle < 5, low_elevation, high_elevation)[()]
+
+
+def rain_specific_attenuation(frequency: float, rain_rate: float, polarization: str):
+    """
+    Calculate the specific attenuation due to rain by interpolating the ITU-R P.838
+    regression coefficients
+
+    Parameters
+    ----------
+        frequency (float, GHz): the carrier frequency, scalar or array
+        rain_rate (float, mm/h): the rain rate, scalar or array broadcastable with frequency
+        polarization (str, ): one of "horizontal", "vertical" or "circular"
 
-    KH = np.exp(np.interp(np.log(frequency), np.log(_f), np.log(_kH)))
-    KV = np.exp(np.interp(np.log(frequency), np.log(_f), np.log(_kV)))
+    Returns
+    -------
+        k (float, ): the regression coefficient k
+        alpha (float, ): the regression exponent alpha
+        specific_attenuation (float, dB/km): the attenuation per km of rain path
+    """
+    log_frequency = np.log(frequency)
+    KH = np.exp(np.interp(log_frequency, _LOG_FREQUENCIES, _LOG_K_HORIZONTAL))
+    KV = np.exp(np.interp(log_frequency, _LOG_FREQUENCIES, _LOG_K_VERTICAL))
 
-    alphaH = np.interp(np.log(frequency), np.log(_f), _alphaH)
-    alphaV = np.interp(np.log(frequency), np.log(_f), _alphaV)
+    alphaH = np.interp(log_frequency, _LOG_FREQUENCIES, _ALPHA_HORIZONTAL)
+    alphaV = np.interp(log_frequency, _LOG_FREQUENCIES, _ALPHA_VERTICAL)
 
     if polarization == "circular":
         k = (KH + KV) / 2
@@ -222,13 +257,17 @@ def horizontal_reduction(
     horizontal_projection: float, specific_attenuation: float, frequency: float
 ) -> float:
     """
-    TODO()
+    Calculate the horizontal reduction factor for 0.01% of the time
 
     Parameters
     ----------
+        horizontal_projection (float, km): horizontal projection of the slant path
+        specific_attenuation (float, dBKm-1): the specific attenuation due to rain
+        frequency (float, GHz): the carrier frequency
 
     Returns
     -------
+        horiz_reduction (float, )
     """
     return 1 / (
         1
@@ -261,7 +300,7 @@ def vertical_adjustment(
     """
     return 1 / (
         1
-        + np.sqrt(np.sin(radians(elevation_angle)))
+        + np.sqrt(np.sin(np.radians(elevation_angle)))
         * (
             31
             * (1 - np.exp(-elevation_angle / (1 + chi)))
@@ -282,12 +321,17 @@ def zeta(
 
     Parameters
     ----------
+        rain_altitude (float, km): the rain height
+        station_altitude (float, km): the altitude of the Earth station above sea level
+        horizontal_projection (float, km): horizontal projection of the slant path
+        horizontal_reduction (float, ): the horizontal reduction factor
 
     Returns
     -------
+        zeta (float, deg)
     """
-    return degrees(
-        atan2(
+    return np.degrees(
+        np.arctan2(
             rain_altitude - station_altitude,
             horizontal_projection * horizontal_reduction,
         )
@@ -305,15 +349,29 @@ def rain_attenuation(
     polarization: str = "vertical",
 ) -> float:
     """
+    Calculate the attenuation due to rain exceeded for 0.01% of an average year
+
+    All numeric parameters may be scalars or numpy arrays that broadcast against each
+    other, so many (station, elevation, frequency) combinations are evaluated in a
+    single call.
 
     Parameters
     ----------
+        elevation_angle (float, deg): the angle between the Earth station and the satellite
+        slant_path (float, km): the slant path length below the rain height
+        frequency (float, GHz): the carrier frequency
+        rain_altitude (float, km): the rain height
+        station_altitude (float, km): the altitude of the Earth station above sea level
+        station_latitude (float, deg): the latitude of the Earth station
+        rain_rate (float, mm/h): the rain rate exceeded for 0.01% of an average year
+        polarization (str, ): one of "horizontal", "vertical" or "circular"
 
     Returns
     -------
-
+        rain_attenuation (float, dB): the predicted attenuation
     """
-    elevation_angle_rad = radians(elevation_angle)
+    elevation_angle = np.asarray(elevation_angle)
+    elevation_angle_rad = np.radians(elevation_angle)
     horiz_proj = slant_path * np.cos(elevation_angle_rad)
 
     _, _, specific_att = rain_specific_attenuation(frequency, rain_rate, polarization)
@@ -322,26 +380,375 @@ def rain_attenuation(
 
     zeta_ = zeta(rain_altitude, station_altitude, horiz_proj, horiz_reduction)
 
-    if zeta_ > elevation_angle:
-        d_r = horiz_proj * horiz_reduction / np.cos(elevation_angle_rad)
-    else:
-        d_r = slant_path
+    d_r = np.where(
+        zeta_ > elevation_angle,
+        horiz_proj * horiz_reduction / np.cos(elevation_angle_rad),
+        slant_path,
+    )
 
-    if abs(station_latitude) < 36:
-        chi = 36 - abs(station_latitude)
-    else:
-        chi = 0
+    abs_latitude = np.abs(station_latitude)
+    chi = np.where(abs_latitude < 36, 36 - abs_latitude, 0)
 
     vert_adj = vertical_adjustment(elevation_angle, specific_att, d_r, frequency, chi)
     effective_path = slant_path * vert_adj
 
-    return specific_att * effective_path
+    return (specific_att * effective_path)[()]
+
+
+def rain_attenuation_exceedance(
+    rain_attenuation: float,
+    percentage: float,
+    elevation_angle: float,
+    station_latitude: float,
+) -> np.ndarray:
+    """
+    Scale the attenuation exceeded for 0.01% of an average year to other percentages
+    of time (ITU-R P.618 step 10)
+
+    The percentages are appended as trailing axes, so passing arrays of stations and
+    frequencies returns the full attenuation-vs-time curve for each in one call.
+
+    Parameters
+    ----------
+        rain_attenuation (float, dB): the attenuation exceeded for 0.01% of the time,
+            scalar or array
+        percentage (float, %): percentages of time in the range [0.001, 5]
+        elevation_angle (float, deg): the angle between the Earth station and the
+            satellite, broadcastable with rain_attenuation
+        station_latitude (float, deg): the latitude of the Earth station,
+            broadcastable with rain_attenuation
+
+    Returns
+    -------
+        rain_attenuation (float, dB): the attenuation exceeded for each percentage of
+            time, with shape rain_attenuation.shape + percentage.shape
+    """
+    percentage = np.asarray(percentage)
+    trailing = (...,) + (None,) * percentage.ndim
+    attenuation_001 = np.asarray(rain_attenuation)[trailing]
+    elevation_angle = np.asarray(elevation_angle)[trailing]
+    abs_latitude = np.abs(np.asarray(station_latitude)[trailing])
+
+    sin_elevation = np.sin(np.radians(elevation_angle))
+    beta = np.where(
+        (percentage >= 1) | (abs_latitude >= 36),
+        0,
+        np.where(
+            elevation_angle >= 25,
+            -0.005 * (abs_latitude - 36),
+            -0.005 * (abs_latitude - 36) + 1.8 - 4.25 * sin_elevation,
+        ),
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        exponent = -(
+            0.655
+            + 0.033 * np.log(percentage)
+            - 0.045 * np.log(attenuation_001)
+            - beta * (1 - percentage) * sin_elevation
+        )
+        scaled = attenuation_001 * (percentage / 0.01) ** exponent
+    return np.where(attenuation_001 > 0, scaled, 0.0)[()]
+
+
+def rain_outage_percentage(
+    fade_margin: float,
+    rain_attenuation: float,
+    elevation_angle: float,
+    station_latitude: float,
+    percentages: np.ndarray = None,
+) -> np.ndarray:
+    """
+    Calculate the percentage of time the rain attenuation exceeds the link's fade
+    margin, i.e. the rain outage (100 - availability)
+
+    The exceedance curve is evaluated on a grid of percentages and inverted by
+    log-log interpolation. Results are clipped to the range of the grid.
+
+    Parameters
+    ----------
+        fade_margin (float, dB): the link margin available to absorb rain fades
+        rain_attenuation (float, dB): the attenuation exceeded for 0.01% of the time
+        elevation_angle (float, deg): the angle between the Earth station and the satellite
+        station_latitude (float, deg): the latitude of the Earth station
+        percentages (np.ndarray, %, optional): increasing grid of percentages to
+            evaluate the exceedance curve on
+
+    Returns
+    -------
+        outage (float, %): the percentage of time the fade margin is exceeded
+    """
+    if percentages is None:
+        percentages = EXCEEDANCE_PERCENTAGES
+    percentages = np.asarray(percentages)
+    (
+        fade_margin,
+        rain_attenuation,
+        elevation_angle,
+        station_latitude,
+    ) = np.broadcast_arrays(
+        fade_margin, rain_attenuation, elevation_angle, station_latitude
+    )
+    curve = rain_attenuation_exceedance(
+        rain_attenuation, percentages, elevation_angle, station_latitude
+    )
+    curve = np.broadcast_to(curve, fade_margin.shape + percentages.shape)
+
+    # the curve is decreasing in percentage, so count the points above the margin
+    n_above = np.sum(curve > fade_margin[..., None], axis=-1)
+    upper = np.clip(n_above, 1, len(percentages) - 1)
+    lower = upper - 1
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_curve = np.log(curve)
+        log_lower = np.take_along_axis(log_curve, lower[..., None], axis=-1)[..., 0]
+        log_upper = np.take_along_axis(log_curve, upper[..., None], axis=-1)[..., 0]
+        fraction = (np.log(fade_margin) - log_lower) / (log_upper - log_lower)
+    log_percentages = np.log(percentages)
+    outage = np.exp(
+        log_percentages[lower]
+        + np.nan_to_num(fraction) * (log_percentages[upper] - log_percentages[lower])
+    )
+    return np.clip(outage, percentages[0], percentages[-1])[()]
+
+
+def cloud_specific_attenuation(frequency: float, temperature: float = 0) -> float:
+    """
+    Calculate the specific attenuation coefficient of cloud liquid water using the
+    double-Debye model of the permittivity of water (ITU-R P.840)
+
+    Parameters
+    ----------
+        frequency (float, GHz): the carrier frequency, scalar or array
+        temperature (float, deg C): the cloud liquid water temperature
+
+    Returns
+    -------
+        K_l (float, (dB/km)/(g/m^3)): the specific attenuation coefficient
+    """
+    frequency = np.asarray(frequency)
+    theta = 300 / (273.15 + temperature)
+    epsilon_0 = 77.66 + 103.3 * (theta - 1)
+    epsilon_1 = 0.0671 * epsilon_0
+    epsilon_2 = 3.52
+    f_p = 20.20 - 146 * (theta - 1) + 316 * (theta - 1) ** 2
+    f_s = 39.8 * f_p
+
+    epsilon_imag = frequency * (epsilon_0 - epsilon_1) / (
+        f_p * (1 + (frequency / f_p) ** 2)
+    ) + frequency * (epsilon_1 - epsilon_2) / (f_s * (1 + (frequency / f_s) ** 2))
+    epsilon_real = (
+        (epsilon_0 - epsilon_1) / (1 + (frequency / f_p) ** 2)
+        + (epsilon_1 - epsilon_2) / (1 + (frequency / f_s) ** 2)
+        + epsilon_2
+    )
+    eta = (2 + epsilon_real) / epsilon_imag
+    return 0.819 * frequency / (epsilon_imag * (1 + eta**2))
+
+
+def cloud_attenuation(
+    elevation_angle: float,
+    frequency: float,
+    liquid_water: float,
+    temperature: float = 0,
+) -> float:
+    """
+    Calculate the attenuation due to clouds along the slant path (ITU-R P.840),
+    valid for elevation angles between 5 and 90 deg
+
+    Parameters
+    ----------
+        elevation_angle (float, deg): the angle between the Earth station and the satellite
+        frequency (float, GHz): the carrier frequency
+        liquid_water (float, kg/m^2): the total columnar content of cloud liquid water
+        temperature (float, deg C): the cloud liquid water temperature
+
+    Returns
+    -------
+        cloud_attenuation (float, dB)
+    """
+    return (
+        liquid_water
+        * cloud_specific_attenuation(frequency, temperature)
+        / np.sin(np.radians(elevation_angle))
+    )
+
+
+def scintillation_attenuation(
+    elevation_angle: float,
+    frequency: float,
+    antenna_diameter: float,
+    temperature: float,
+    humidity: float,
+    percentage: float = 0.01,
+    antenna_efficiency: float = 0.5,
+) -> float:
+    """
+    Calculate the tropospheric scintillation fade depth exceeded for a percentage of
+    time (ITU-R P.618 section 2.4.1)
+
+    The model is valid for elevation angles above 5 deg and percentages of time in
+    the range [0.01, 50]. Percentages are appended as trailing axes, as in
+    rain_attenuation_exceedance.
+
+    Parameters
+    ----------
+        elevation_angle (float, deg): the angle between the Earth station and the satellite
+        frequency (float, GHz): the carrier frequency
+        antenna_diameter (float, m): the physical diameter of the Earth station antenna
+        temperature (float, deg C): the average surface ambient temperature
+        humidity (float, %): the average surface relative humidity
+        percentage (float, %): percentages of time
+        antenna_efficiency (float, ): the antenna efficiency
+
+    Returns
+    -------
+        scintillation_attenuation (float, dB)
+    """
+    percentage = np.asarray(percentage)
+    (
+        elevation_angle,
+        frequency,
+        antenna_diameter,
+        temperature,
+        humidity,
+        antenna_efficiency,
+    ) = np.broadcast_arrays(
+        elevation_angle,
+        frequency,
+        antenna_diameter,
+        temperature,
+        humidity,
+        antenna_efficiency,
+    )
+
+    saturation_pressure = 6.1121 * np.exp(17.502 * temperature / (temperature + 240.97))
+    wet_refractivity = 3732 * humidity * saturation_pressure / (273 + temperature) ** 2
+    sigma_ref = 3.6e-3 + 1e-4 * wet_refractivity
+
+    sin_elevation = np.sin(np.radians(elevation_angle))
+    turbulence_height = 1000  # m
+    path_length = (
+        2 * turbulence_height / (np.sqrt(sin_elevation**2 + 2.35e-4) + sin_elevation)
+    )
+    effective_diameter = np.sqrt(antenna_efficiency) * antenna_diameter
+    x = 1.22 * effective_diameter**2 * (frequency / path_length)
+    averaging = 3.86 * (x**2 + 1) ** (11 / 12) * np.sin(
+        11 / 6 * np.arctan(1 / x)
+    ) - 7.08 * x ** (5 / 6)
+    # the fade depth is zero for apertures large enough to average out the turbulence
+    averaging_factor = np.sqrt(np.maximum(averaging, 0))
+    sigma = sigma_ref * frequency ** (7 / 12) * averaging_factor / sin_elevation**1.2
+
+    log_percentage = np.log10(percentage)
+    time_factor = (
+        -0.061 * log_percentage**3
+        + 0.072 * log_percentage**2
+        - 1.71 * log_percentage
+        + 3.0
+    )
+    return (sigma[(...,) + (None,) * percentage.ndim] * time_factor)[()]
+
+
+def total_atmospheric_attenuation(
+    elevation_angle: float,
+    frequency: float,
+    station_latitude: float,
+    station_altitude: float,
+    rain_altitude: float,
+    rain_rate: float,
+    liquid_water: float,
+    humidity: float,
+    antenna_diameter: float,
+    percentage: float = 0.01,
+    temperature: float = STANDARD_TEMPERATURE,
+    water_vapour_density: float = STANDARD_WATER_VAPOUR_DENSITY,
+    antenna_efficiency: float = 0.5,
+    polarization: str = "vertical",
+) -> float:
+    """
+    Calculate the total attenuation due to rain, gases, clouds and scintillation
+    exceeded for a percentage of time (ITU-R P.618 section 2.5)
+
+    The components are combined as A_G + sqrt((A_R + A_C)^2 + A_S^2) rather than
+    summed, since scintillation and rain fades are not fully correlated. The gas and
+    cloud contributions are taken from the supplied mean climate and held constant
+    over percentage. All numeric parameters broadcast against each other and the
+    percentages are appended as trailing axes.
+
+    Parameters
+    ----------
+        elevation_angle (float, deg): the angle between the Earth station and the satellite
+        frequency (float, GHz): the carrier frequency
+        station_latitude (float, deg): the latitude of the Earth station
+        station_altitude (float, km): the altitude of the Earth station above sea level
+        rain_altitude (float, km): the rain height
+        rain_rate (float, mm/h): the rain rate exceeded for 0.01% of an average year
+        liquid_water (float, kg/m^2): the total columnar content of cloud liquid water
+        humidity (float, %): the average surface relative humidity
+        antenna_diameter (float, m): the physical diameter of the Earth station antenna
+        percentage (float, %): percentages of time in the range [0.001, 5]
+        temperature (float, deg C): the average surface ambient temperature
+        water_vapour_density (float, g/m^3): the surface water vapour density
+        antenna_efficiency (float, ): the antenna efficiency
+        polarization (str, ): one of "horizontal", "vertical" or "circular"
+
+    Returns
+    -------
+        total_attenuation (float, dB)
+    """
+    percentage = np.asarray(percentage)
+    trailing = (...,) + (None,) * percentage.ndim
+
+    spath = slant_path(elevation_angle, rain_altitude, station_altitude)
+    rain_att_001 = rain_attenuation(
+        elevation_angle,
+        spath,
+        frequency,
+        rain_altitude,
+        station_altitude,
+        station_latitude,
+        rain_rate,
+        polarization,
+    )
+    rain_att = rain_attenuation_exceedance(
+        rain_att_001, percentage, elevation_angle, station_latitude
+    )
+    gas_att = gaseous_attenuation(
+        frequency,
+        elevation_angle,
+        station_altitude,
+        water_vapour_density,
+        temperature=temperature,
+    )
+    cloud_att = cloud_attenuation(elevation_angle, frequency, liquid_water)
+    scintillation_att = scintillation_attenuation(
+        elevation_angle,
+        frequency,
+        antenna_diameter,
+        temperature,
+        humidity,
+        percentage,
+        antenna_efficiency,
+    )
+    return (
+        np.asarray(gas_att)[trailing]
+        + np.sqrt(
+            (rain_att + np.asarray(cloud_att)[trailing]) ** 2 + scintillation_att**2
+        )
+    )[()]
 
 
 def worst_rain_rate(rain_rate: float) -> float:
-    return (rain_rate / 0.3) ** 0.87
+    """
+    Convert an annual percentage of time to the equivalent worst-month percentage
+    (ITU-R P.841)
 
+    Parameters
+    ----------
+        rain_rate (float, %): annual percentage of time
 
-def polarization_loss(faraday_rotation: float) -> float:
-    rotation_rad = radians(faraday_rotation)
-    return 20 * np.log(cos(rotation_rad))
+    Returns
+    -------
+        worst_month (float, %): worst-month percentage of time
+    """
+    return (rain_rate / 0.3) ** 0.87
@@ -0,0 +1,256 @@
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable
+
+from link_calculator.propagation.attenuation import rain_attenuation, slant_path
+
+# default quantization step of each input
+DEFAULT_TOLERANCES = {
+    "elevation_angle": 0.01,  # deg
+    "frequency": 0.001,  # GHz
+    "rain_altitude": 0.001,  # km
+    "station_altitude": 0.001,  # km
+    "station_latitude": 0.01,  # deg
+    "rain_rate": 0.01,  # mm/h
+}
+
+
+class AttenuationCache:
+    def __init__(
+        self,
+        maxsize: int = 65536,
+        tolerances: dict = None,
+        path: str = None,
+    ):
+        """
+        A bounded, thread-safe memo of slant path and rain attenuation results
+
+        Inputs are snapped to a grid with the given tolerances before evaluation, so
+        nearly identical queries share a single entry and every result is the exact
+        value at the snapped inputs, independent of which query filled the entry.
+        The least recently used entry is evicted once the cache is full.
+
+        Parameters
+        ----------
+            maxsize (int, ): the maximum number of cached results
+            tolerances (dict, optional): quantization steps keyed by parameter name,
+                overriding DEFAULT_TOLERANCES
+            path (str, optional): file the cache is persisted to by save(), and loaded
+                from on creation if it exists
+        """
+        if maxsize < 1:
+            raise ValueError("The cache must hold at least one entry")
+        self._maxsize = maxsize
+        self._tolerances = {**DEFAULT_TOLERANCES, **(tolerances or {})}
+        self._path = path
+        self._entries = OrderedDict()
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+        if path is not None and os.path.exists(path):
+            with open(path) as f:
+                state = json.load(f)
+            if state["tolerances"] == self._tolerances:
+                # entries are saved least recently used first, so only the most
+                # recent ones are kept and loading evicts nothing
+                for key, value in state["entries"][-maxsize:]:
+                    self._entries[tuple(key)] = value
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    @property
+    def tolerances(self) -> dict:
+        return dict(self._tolerances)
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        return self._evictions
+
+    @property
+    def size(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self._hits + self._misses
+        return self._hits / lookups if lookups else 0.0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def _quantize(self, name: str, value: float) -> float:
+        step = self._tolerances[name]
+        return round(round(value / step) * step, 12)
+
+    def _insert(self, key: tuple, value: float):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def _lookup(self, key: tuple, function: Callable, *args) -> float:
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return self._entries[key]
+            self._misses += 1
+        # evaluate outside the lock so concurrent misses do not serialise
+        value = float(function(*args))
+        self._insert(key, value)
+        return value
+
+    def slant_path(
+        self,
+        elevation_angle: float,
+        rain_altitude: float,
+        station_altitude: float,
+    ) -> float:
+        """
+        Calculate the slant path, see attenuation.slant_path
+
+        Parameters
+        ----------
+            elevation_angle (float, deg): the angle between the Earth station and the
+                satellite
+            rain_altitude (float, km): the rain height
+            station_altitude (float, km): the altitude of the Earth station above sea
+                level
+
+        Returns
+        -------
+            d_s (float, km): The slant height
+        """
+        args = (
+            self._quantize("elevation_angle", elevation_angle),
+            self._quantize("rain_altitude", rain_altitude),
+            self._quantize("station_altitude", station_altitude),
+        )
+        return self._lookup(("slant_path",) + args, slant_path, *args)
+
+    def rain_attenuation(
+        self,
+        elevation_angle: float,
+        *,
+        frequency: float,
+        rain_altitude: float,
+        station_altitude: float,
+        station_latitude: float,
+        rain_rate: float = 0.01,
+        polarization: str = "vertical",
+    ) -> float:
+        """
+        Calculate the attenuation due to rain exceeded for 0.01% of an average year,
+        see attenuation.rain_attenuation. The slant path is derived from the
+        (quantized) geometry, so it is not a parameter, and the remaining parameters
+        are keyword only to avoid passing them in the positions that function uses.
+
+        Parameters
+        ----------
+            elevation_angle (float, deg): the angle between the Earth station and the
+                satellite
+            frequency (float, GHz): the carrier frequency
+            rain_altitude (float, km): the rain height
+            station_altitude (float, km): the altitude of the Earth station above sea
+                level
+            station_latitude (float, deg): the latitude of the Earth station
+            rain_rate (float, mm/h): the rain rate exceeded for 0.01% of an average year
+            polarization (str, ): one of "horizontal", "vertical" or "circular"
+
+        Returns
+        -------
+            rain_attenuation (float, dB): the predicted attenuation
+        """
+        elevation_angle = self._quantize("elevation_angle", elevation_angle)
+        frequency = self._quantize("frequency", frequency)
+        rain_altitude = self._quantize("rain_altitude", rain_altitude)
+        station_altitude = self._quantize("station_altitude", station_altitude)
+        station_latitude = self._quantize("station_latitude", station_latitude)
+        rain_rate = self._quantize("rain_rate", rain_rate)
+
+        def evaluate():
+            return rain_attenuation(
+                elevation_angle,
+                slant_path(elevation_angle, rain_altitude, station_altitude),
+                frequency,
+                rain_altitude,
+                station_altitude,
+                station_latitude,
+                rain_rate,
+                polarization,
+            )
+
+        key = (
+            "rain_attenuation",
+            elevation_angle,
+            frequency,
+            rain_altitude,
+            station_altitude,
+            station_latitude,
+            rain_rate,
+            polarization,
+        )
+        return self._lookup(key, evaluate)
+
+    def clear(self):
+        """
+        Remove every entry and reset the statistics
+        """
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def save(self, path: str = None):
+        """
+        Persist the cached results so a later run can reuse them
+
+        The entries are written as JSON, atomically; the file is only loaded back by
+        a cache with the same tolerances.
+
+        Parameters
+        ----------
+            path (str, optional): the file to write, defaults to the cache's path
+        """
+        path = path if path is not None else self._path
+        if path is None:
+            raise ValueError("No path to save the cache to")
+        with self._lock:
+            state = {
+                "tolerances": self._tolerances,
+                "entries": [[list(key), value] for key, value in self._entries.items()],
+            }
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        with open(temporary_path, "w") as f:
+            json.dump(state, f)
+        os.replace(temporary_path, path)
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
@@ -0,0 +1,117 @@
+import numpy as np
+
+from link_calculator.grids import RegularGrid
+
+
+class RainClimate:
+    def __init__(
+        self,
+        rain_rate: RegularGrid,
+        rain_height: RegularGrid,
+        water_vapour_density: RegularGrid = None,
+    ):
+        """
+        Gridded climatology maps indexed by (latitude, longitude)
+
+        Parameters
+        ----------
+            rain_rate (RegularGrid, mm/h): the rain rate exceeded for 0.01% of an
+                average year (R0.01)
+            rain_height (RegularGrid, km): the mean rain height above sea level
+            water_vapour_density (RegularGrid, g/m^3, optional): the surface water
+                vapour density
+        """
+        self._rain_rate = rain_rate
+        self._rain_height = rain_height
+        self._water_vapour_density = water_vapour_density
+
+    @classmethod
+    def from_files(
+        cls,
+        rain_rate_path: str,
+        rain_height_path: str,
+        water_vapour_density_path: str = None,
+        latitude_start: float = -90,
+        latitude_step: float = 1.5,
+        longitude_start: float = -180,
+        longitude_step: float = 1.5,
+        **kwargs,
+    ) -> "RainClimate":
+        """
+        Memory map climatology grids that share the same latitude/longitude layout
+
+        Parameters
+        ----------
+            rain_rate_path (str, ): path to the R0.01 grid
+            rain_height_path (str, ): path to the rain height grid
+            water_vapour_density_path (str, optional): path to the water vapour grid
+            latitude_start (float, deg): the latitude of the first row
+            latitude_step (float, deg): the spacing between rows
+            longitude_start (float, deg): the longitude of the first column
+            longitude_step (float, deg): the spacing between columns
+            kwargs: passed to RegularGrid.from_file (e.g. shape, dtype for raw grids)
+
+        Returns
+        -------
+            climate (RainClimate, )
+        """
+
+        def load(path):
+            if path is None:
+                return None
+            return RegularGrid.from_file(
+                path,
+                latitude_start,
+                latitude_step,
+                longitude_start,
+                longitude_step,
+                column_period=360,
+                **kwargs,
+            )
+
+        return cls(
+            load(rain_rate_path),
+            load(rain_height_path),
+            load(water_vapour_density_path),
+        )
+
+    def rain_rate(self, latitude: float, longitude: float) -> np.ndarray:
+        """
+        Parameters
+        ----------
+            latitude (float, deg): station latitudes, scalar or array
+            longitude (float, deg): station longitudes, broadcastable with latitude
+
+        Returns
+        -------
+            rain_rate (float, mm/h): the rain rate exceeded for 0.01% of the time
+        """
+        return self._rain_rate.interpolate(latitude, longitude)
+
+    def rain_height(self, latitude: float, longitude: float) -> np.ndarray:
+        """
+        Parameters
+        ----------
+            latitude (float, deg): station latitudes, scalar or array
+            longitude (float, deg): station longitudes, broadcastable with latitude
+
+        Returns
+        -------
+            rain_height (float, km): the mean rain height above sea level
+        """
+        return self._rain_height.interpolate(latitude, longitude)
+
+    def water_vapour_density(self, latitude: float, longitude: float) -> np.ndarray:
+        """
+        Parameters
+        ----------
+            latitude (float, deg): station latitudes, scalar or array
+            longitude (float, deg): station longitudes, broadcastable with latitude
+
+        Returns
+        -------
+            water_vapour_density (float, g/m^3): the surface water vapour density
+        """
+        if self._water_vapour_density is None:
+            raise ValueError("No water vapour density grid has been loaded")
+        return self._water_vapour_density.interpolate(latitude, longitude)
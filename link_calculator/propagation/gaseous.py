@@ -0,0 +1,476 @@
+from functools import lru_cache
+
+import numpy as np
+
+from link_calculator.conversions import decibel_to_watt
+
+# Standard sea level atmosphere
+STANDARD_PRESSURE = 1013.25  # hPa
+STANDARD_TEMPERATURE = 15  # deg C
+STANDARD_WATER_VAPOUR_DENSITY = 7.5  # g/m^3
+
+# Effective Earth radius used for low elevation paths
+_EFFECTIVE_EARTH_RADIUS = 8500  # km
+
+
+def _phi(rp, rt, a, b, c, d):
+    return rp**a * rt**b * np.exp(c * (1 - rp) + d * (1 - rt))
+
+
+def _line_shape(frequency, line_frequency):
+    return 1 + ((frequency - line_frequency) / (frequency + line_frequency)) ** 2
+
+
+def _quadratic_log_interpolation(frequency, points, gammas):
+    """
+    Interpolate ln(gamma) through three (frequency, gamma) points
+    """
+    (f_1, f_2, f_3), (g_1, g_2, g_3) = points, gammas
+    return np.exp(
+        np.log(g_1)
+        * (frequency - f_2)
+        * (frequency - f_3)
+        / ((f_1 - f_2) * (f_1 - f_3))
+        + np.log(g_2)
+        * (frequency - f_1)
+        * (frequency - f_3)
+        / ((f_2 - f_1) * (f_2 - f_3))
+        + np.log(g_3)
+        * (frequency - f_1)
+        * (frequency - f_2)
+        / ((f_3 - f_1) * (f_3 - f_2))
+    )
+
+
+def oxygen_specific_attenuation(
+    frequency: float,
+    pressure: float = STANDARD_PRESSURE,
+    temperature: float = STANDARD_TEMPERATURE,
+) -> float:
+    """
+    Calculate the specific attenuation due to dry air (ITU-R P.676 Annex 2),
+    valid for frequencies up to 350 GHz
+
+    Parameters
+    ----------
+        frequency (float, GHz): the carrier frequency, scalar or array
+        pressure (float, hPa): the dry air pressure
+        temperature (float, deg C): the air temperature
+
+    Returns
+    -------
+        gamma_o (float, dB/km): the oxygen specific attenuation
+    """
+    frequency = np.asarray(frequency)
+    if np.any(frequency > 350):
+        raise ValueError("The dry air attenuation model is valid up to 350 GHz")
+    rp = pressure / STANDARD_PRESSURE
+    rt = 288 / (273 + temperature)
+    xi_1 = _phi(rp, rt, 0.0717, -1.8132, 0.0156, -1.6515)
+    xi_2 = _phi(rp, rt, 0.5146, -4.6368, -0.1921, -5.7416)
+    xi_3 = _phi(rp, rt, 0.3414, -6.5851, 0.2130, -8.5854)
+    xi_4 = _phi(rp, rt, -0.0112, 0.0092, -0.1033, -0.0009)
+    xi_5 = _phi(rp, rt, 0.2705, -2.7192, -0.3016, -4.1033)
+    xi_6 = _phi(rp, rt, 0.2445, -5.9191, 0.0422, -8.0719)
+    xi_7 = _phi(rp, rt, -0.1833, 6.5589, -0.2402, 6.131)
+    # the attenuation at the edges of the 60 GHz line complex
+    gamma_54 = 2.192 * _phi(rp, rt, 1.8286, -1.9487, 0.4051, -2.8509)
+    gamma_58 = 12.59 * _phi(rp, rt, 1.0045, 3.5610, 0.1588, 1.2834)
+    gamma_60 = 15.0 * _phi(rp, rt, 0.9003, 4.1335, 0.0427, 1.6088)
+    gamma_62 = 14.28 * _phi(rp, rt, 0.9886, 3.4176, 0.1827, 1.3429)
+    gamma_64 = 6.819 * _phi(rp, rt, 1.4320, 0.6258, 0.3177, -0.5914)
+    gamma_66 = 1.908 * _phi(rp, rt, 2.0717, -4.1404, 0.4910, -4.8718)
+    delta = -0.00306 * _phi(rp, rt, 3.211, -14.94, 1.583, -16.37)
+
+    # every band is evaluated over all frequencies, so ignore the branches outside
+    # their own range
+    with np.errstate(divide="ignore", invalid="ignore"):
+        below_54 = (
+            (
+                7.2 * rt**2.8 / (frequency**2 + 0.34 * rp**2 * rt**1.6)
+                + 0.62 * xi_3 / ((54 - frequency) ** (1.16 * xi_1) + 0.83 * xi_2)
+            )
+            * frequency**2
+            * rp**2
+            * 1e-3
+        )
+        below_60 = _quadratic_log_interpolation(
+            frequency, (54, 58, 60), (gamma_54, gamma_58, gamma_60)
+        )
+        below_62 = gamma_60 + (gamma_62 - gamma_60) * (frequency - 60) / 2
+        below_66 = _quadratic_log_interpolation(
+            frequency, (62, 64, 66), (gamma_62, gamma_64, gamma_66)
+        )
+        below_120 = (
+            (
+                3.02e-4 * rt**3.5
+                + 0.283
+                * rt**3.8
+                / ((frequency - 118.75) ** 2 + 2.91 * rp**2 * rt**1.6)
+                + 0.502
+                * xi_6
+                * (1 - 0.0163 * xi_7 * (frequency - 66))
+                / ((frequency - 66) ** (1.4346 * xi_4) + 1.15 * xi_5)
+            )
+            * frequency**2
+            * rp**2
+            * 1e-3
+        )
+        below_350 = (
+            3.02e-4 / (1 + 1.9e-5 * frequency**1.5)
+            + 0.283
+            * rt**0.3
+            / ((frequency - 118.75) ** 2 + 2.91 * rp**2 * rt**1.6)
+        ) * frequency**2 * rp**2 * rt**3.5 * 1e-3 + delta
+    return np.select(
+        [
+            frequency <= 54,
+            frequency <= 60,
+            frequency <= 62,
+            frequency <= 66,
+            frequency <= 120,
+        ],
+        [below_54, below_60, below_62, below_66, below_120],
+        below_350,
+    )[()]
+
+
+def water_vapour_specific_attenuation(
+    frequency: float,
+    water_vapour_density: float = STANDARD_WATER_VAPOUR_DENSITY,
+    pressure: float = STANDARD_PRESSURE,
+    temperature: float = STANDARD_TEMPERATURE,
+) -> float:
+    """
+    Calculate the specific attenuation due to water vapour (ITU-R P.676 Annex 2)
+
+    Parameters
+    ----------
+        frequency (float, GHz): the carrier frequency, scalar or array
+        water_vapour_density (float, g/m^3): the surface water vapour density
+        pressure (float, hPa): the dry air pressure
+        temperature (float, deg C): the air temperature
+
+    Returns
+    -------
+        gamma_w (float, dB/km): the water vapour specific attenuation
+    """
+    f = np.asarray(frequency)
+    rho = water_vapour_density
+    rp = pressure / STANDARD_PRESSURE
+    rt = 288 / (273 + temperature)
+    eta_1 = 0.955 * rp * rt**0.68 + 0.006 * rho
+    eta_2 = 0.735 * rp * rt**0.5 + 0.0353 * rt**4 * rho
+    lines = (
+        3.98
+        * eta_1
+        * np.exp(2.23 * (1 - rt))
+        / ((f - 22.235) ** 2 + 9.42 * eta_1**2)
+        * _line_shape(f, 22)
+        + 11.96
+        * eta_1
+        * np.exp(0.7 * (1 - rt))
+        / ((f - 183.31) ** 2 + 11.14 * eta_1**2)
+        + 0.081
+        * eta_1
+        * np.exp(6.44 * (1 - rt))
+        / ((f - 321.226) ** 2 + 6.29 * eta_1**2)
+        + 3.66
+        * eta_1
+        * np.exp(1.6 * (1 - rt))
+        / ((f - 325.153) ** 2 + 9.22 * eta_1**2)
+        + 25.37 * eta_1 * np.exp(1.09 * (1 - rt)) / (f - 380) ** 2
+        + 17.4 * eta_1 * np.exp(1.46 * (1 - rt)) / (f - 448) ** 2
+        + 844.6 * eta_1 * np.exp(0.17 * (1 - rt)) / (f - 557) ** 2 * _line_shape(f, 557)
+        + 290 * eta_1 * np.exp(0.41 * (1 - rt)) / (f - 752) ** 2 * _line_shape(f, 752)
+        + 8.3328e4
+        * eta_2
+        * np.exp(0.99 * (1 - rt))
+        / (f - 1780) ** 2
+        * _line_shape(f, 1780)
+    )
+    return lines * f**2 * rt**2.5 * rho * 1e-4
+
+
+def oxygen_equivalent_height(
+    frequency: float, pressure: float = STANDARD_PRESSURE
+) -> float:
+    """
+    Calculate the equivalent height of the dry atmosphere
+
+    Parameters
+    ----------
+        frequency (float, GHz): the carrier frequency, scalar or array
+        pressure (float, hPa): the dry air pressure
+
+    Returns
+    -------
+        h_o (float, km): the oxygen equivalent height
+    """
+    f = np.asarray(frequency)
+    rp = pressure / STANDARD_PRESSURE
+    t_1 = (
+        4.64
+        / (1 + 0.066 * rp**-2.3)
+        * np.exp(-(((f - 59.7) / (2.87 + 12.4 * np.exp(-7.9 * rp))) ** 2))
+    )
+    t_2 = 0.14 * np.exp(2.12 * rp) / ((f - 118.75) ** 2 + 0.031 * np.exp(2.2 * rp))
+    t_3 = (
+        0.0114
+        / (1 + 0.14 * rp**-2.6)
+        * f
+        * (-0.0247 + 0.0001 * f + 1.61e-6 * f**2)
+        / (1 - 0.0169 * f + 4.1e-5 * f**2 + 3.2e-7 * f**3)
+    )
+    h_o = 6.1 / (1 + 0.17 * rp**-1.1) * (1 + t_1 + t_2 + t_3)
+    return np.where(f < 70, np.minimum(h_o, 10.7 * rp**0.3), h_o)[()]
+
+
+def water_vapour_equivalent_height(
+    frequency: float, pressure: float = STANDARD_PRESSURE
+) -> float:
+    """
+    Calculate the equivalent height of water vapour in the atmosphere
+
+    Parameters
+    ----------
+        frequency (float, GHz): the carrier frequency, scalar or array
+        pressure (float, hPa): the dry air pressure
+
+    Returns
+    -------
+        h_w (float, km): the water vapour equivalent height
+    """
+    f = np.asarray(frequency)
+    rp = pressure / STANDARD_PRESSURE
+    sigma_w = 1.013 / (1 + np.exp(-8.6 * (rp - 0.57)))
+    return 1.66 * (
+        1
+        + 1.39 * sigma_w / ((f - 22.235) ** 2 + 2.56 * sigma_w)
+        + 3.37 * sigma_w / ((f - 183.31) ** 2 + 4.69 * sigma_w)
+        + 1.58 * sigma_w / ((f - 325.1) ** 2 + 2.89 * sigma_w)
+    )
+
+
+def _slant_path_attenuation(
+    gamma_o: float,
+    gamma_w: float,
+    h_o: float,
+    h_w: float,
+    elevation_angle: float,
+    station_altitude: float,
+) -> float:
+    """
+    Combine the specific attenuations and equivalent heights into the attenuation
+    along the slant path, using the cosecant law above 5 deg and the curved Earth
+    approximation below
+    """
+    elevation_angle = np.asarray(elevation_angle)
+    elevation_rad = np.radians(elevation_angle)
+    # reduce the equivalent columns for stations above sea level
+    gamma_o = gamma_o * np.exp(-station_altitude / h_o)
+    gamma_w = gamma_w * np.exp(-station_altitude / h_w)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        high_elevation = (gamma_o * h_o + gamma_w * h_w) / np.sin(elevation_rad)
+
+        def F(x):
+            return 1 / (0.661 * x + 0.339 * np.sqrt(x**2 + 5.51))
+
+        re = _EFFECTIVE_EARTH_RADIUS
+        tan_elevation = np.tan(elevation_rad)
+        low_elevation = (
+            gamma_o * np.sqrt(re * h_o) * F(tan_elevation * np.sqrt(re / h_o))
+            + gamma_w * np.sqrt(re * h_w) * F(tan_elevation * np.sqrt(re / h_w))
+        ) / np.cos(elevation_rad)
+    return np.where(elevation_angle < 5, low_elevation, high_elevation)[()]
+
+
+def zenith_gaseous_attenuation(
+    frequency: float,
+    station_altitude: float = 0,
+    water_vapour_density: float = STANDARD_WATER_VAPOUR_DENSITY,
+    pressure: float = STANDARD_PRESSURE,
+    temperature: float = STANDARD_TEMPERATURE,
+) -> float:
+    """
+    Calculate the attenuation due to atmospheric gases along the zenith path
+
+    Parameters
+    ----------
+        frequency (float, GHz): the carrier frequency, scalar or array
+        station_altitude (float, km): the altitude of the Earth station above sea level
+        water_vapour_density (float, g/m^3): the surface water vapour density
+        pressure (float, hPa): the dry air pressure
+        temperature (float, deg C): the air temperature
+
+    Returns
+    -------
+        attenuation (float, dB): the zenith attenuation due to oxygen and water vapour
+    """
+    return gaseous_attenuation(
+        frequency, 90, station_altitude, water_vapour_density, pressure, temperature
+    )
+
+
+def gaseous_attenuation(
+    frequency: float,
+    elevation_angle: float,
+    station_altitude: float = 0,
+    water_vapour_density: float = STANDARD_WATER_VAPOUR_DENSITY,
+    pressure: float = STANDARD_PRESSURE,
+    temperature: float = STANDARD_TEMPERATURE,
+) -> float:
+    """
+    Calculate the attenuation due to atmospheric gases along the slant path
+    (ITU-R P.676 Annex 2)
+
+    All parameters may be scalars or numpy arrays that broadcast against each other.
+
+    Parameters
+    ----------
+        frequency (float, GHz): the carrier frequency
+        elevation_angle (float, deg): the angle between the Earth station and the satellite
+        station_altitude (float, km): the altitude of the Earth station above sea level
+        water_vapour_density (float, g/m^3): the surface water vapour density
+        pressure (float, hPa): the dry air pressure
+        temperature (float, deg C): the air temperature
+
+    Returns
+    -------
+        attenuation (float, dB): the slant path attenuation due to oxygen and water vapour
+    """
+    return _slant_path_attenuation(
+        oxygen_specific_attenuation(frequency, pressure, temperature),
+        water_vapour_specific_attenuation(
+            frequency, water_vapour_density, pressure, temperature
+        ),
+        oxygen_equivalent_height(frequency, pressure),
+        water_vapour_equivalent_height(frequency, pressure),
+        elevation_angle,
+        station_altitude,
+    )
+
+
+@lru_cache(maxsize=256)
+def _profile_components(
+    frequency: float,
+    water_vapour_density: float,
+    pressure: float,
+    temperature: float,
+) -> tuple:
+    return (
+        float(oxygen_specific_attenuation(frequency, pressure, temperature)),
+        float(
+            water_vapour_specific_attenuation(
+                frequency, water_vapour_density, pressure, temperature
+            )
+        ),
+        float(oxygen_equivalent_height(frequency, pressure)),
+        float(water_vapour_equivalent_height(frequency, pressure)),
+    )
+
+
+class AtmosphereProfile:
+    def __init__(
+        self,
+        station_altitude: float = 0,
+        water_vapour_density: float = STANDARD_WATER_VAPOUR_DENSITY,
+        pressure: float = STANDARD_PRESSURE,
+        temperature: float = STANDARD_TEMPERATURE,
+    ):
+        """
+        A fixed atmosphere above an Earth station. The frequency dependent terms of
+        the gaseous attenuation model are cached per frequency, so repeated
+        evaluation over elevation angles only recomputes the path geometry.
+
+        Parameters
+        ----------
+            station_altitude (float, km): the altitude of the Earth station above sea level
+            water_vapour_density (float, g/m^3): the surface water vapour density
+            pressure (float, hPa): the dry air pressure
+            temperature (float, deg C): the air temperature
+        """
+        self._station_altitude = station_altitude
+        self._water_vapour_density = water_vapour_density
+        self._pressure = pressure
+        self._temperature = temperature
+
+    @property
+    def station_altitude(self) -> float:
+        return self._station_altitude
+
+    @property
+    def water_vapour_density(self) -> float:
+        return self._water_vapour_density
+
+    @property
+    def pressure(self) -> float:
+        return self._pressure
+
+    @property
+    def temperature(self) -> float:
+        return self._temperature
+
+    def _components(self, frequency: float) -> tuple:
+        frequency = np.asarray(frequency, dtype=float)
+        # a frequency plan has few distinct carriers, so each is cached on its own
+        unique, inverse = np.unique(frequency, return_inverse=True)
+        components = np.array(
+            [
+                _profile_components(
+                    f, self.water_vapour_density, self.pressure, self.temperature
+                )
+                for f in unique.tolist()
+            ]
+        ).reshape(-1, 4)
+        return tuple(c[inverse].reshape(frequency.shape) for c in components.T)
+
+    def zenith_attenuation(self, frequency: float) -> float:
+        """
+        Calculate the attenuation due to atmospheric gases along the zenith path
+
+        Parameters
+        ----------
+            frequency (float, GHz): the carrier frequency, scalar or array
+
+        Returns
+        -------
+            attenuation (float, dB): the zenith attenuation
+        """
+        return self.slant_attenuation(frequency, 90)
+
+    def slant_attenuation(self, frequency: float, elevation_angle: float) -> float:
+        """
+        Calculate the attenuation due to atmospheric gases along the slant path
+
+        Parameters
+        ----------
+            frequency (float, GHz): the carrier frequency, scalar or array
+            elevation_angle (float, deg): the angle between the Earth station and the
+                satellite, broadcastable with frequency
+
+        Returns
+        -------
+            attenuation (float, dB): the slant path attenuation
+        """
+        return _slant_path_attenuation(
+            *self._components(frequency), elevation_angle, self.station_altitude
+        )
+
+    def atmospheric_loss(self, frequency: float, elevation_angle: float) -> float:
+        """
+        Calculate the gaseous absorption as a loss factor, suitable for
+        Link(atmospheric_loss=...)
+
+        Parameters
+        ----------
+            frequency (float, GHz): the carrier frequency, scalar or array
+            elevation_angle (float, deg): the angle between the Earth station and the
+                satellite, broadcastable with frequency
+
+        Returns
+        -------
+            atmospheric_loss (float, ): the loss in the range [0, 1]
+        """
+        return decibel_to_watt(-self.slant_attenuation(frequency, elevation_angle))
@@ -0,0 +1,126 @@
+import numpy as np
+
+from link_calculator.constants import SPEED_OF_LIGHT
+
+TEC_UNIT = 1e16  # electrons / m^2
+# ITU-R P.531 constants relating the total electron content to the path effects
+FARADAY_ROTATION_CONSTANT = 2.36e4  # rad Hz^2 m^2 / (T electron)
+GROUP_DELAY_CONSTANT = 40.3  # m^3 / s^2
+MAGNETIC_FIELD = 5e-5  # T, the average Earth magnetic field along the path
+
+
+def faraday_rotation(
+    total_electron_content: float,
+    frequency: float,
+    magnetic_field: float = MAGNETIC_FIELD,
+) -> float:
+    """
+    Calculate the rotation of the plane of a linearly polarized wave crossing the
+    ionosphere (ITU-R P.531 section 4.3)
+
+    All parameters may be scalars or broadcastable numpy arrays, e.g. a TEC time
+    series against a column of carrier frequencies.
+
+    Parameters
+    ----------
+        total_electron_content (float, TECU): the slant total electron content
+            (1 TECU = 10^16 electrons / m^2)
+        frequency (float, GHz): the carrier frequency
+        magnetic_field (float, T): the average component of the Earth's magnetic
+            field along the propagation path
+
+    Returns
+    -------
+        faraday_rotation (float, deg): the rotation angle
+    """
+    electrons = np.asarray(total_electron_content) * TEC_UNIT
+    frequency_hz = np.asarray(frequency) * 1e9
+    return np.degrees(
+        FARADAY_ROTATION_CONSTANT * magnetic_field * electrons / frequency_hz**2
+    )[()]
+
+
+def group_delay(total_electron_content: float, frequency: float) -> float:
+    """
+    Calculate the excess delay of a signal crossing the ionosphere relative to
+    propagation in a vacuum (ITU-R P.531 section 4.4)
+
+    Parameters
+    ----------
+        total_electron_content (float, TECU): the slant total electron content
+        frequency (float, GHz): the carrier frequency
+
+    Returns
+    -------
+        group_delay (float, s)
+    """
+    return (excess_path_length(total_electron_content, frequency) / SPEED_OF_LIGHT)[()]
+
+
+def excess_path_length(total_electron_content: float, frequency: float) -> float:
+    """
+    Calculate the apparent increase in range caused by the ionospheric group delay
+
+    Parameters
+    ----------
+        total_electron_content (float, TECU): the slant total electron content
+        frequency (float, GHz): the carrier frequency
+
+    Returns
+    -------
+        excess_path_length (float, m)
+    """
+    electrons = np.asarray(total_electron_content) * TEC_UNIT
+    frequency_hz = np.asarray(frequency) * 1e9
+    return (GROUP_DELAY_CONSTANT * electrons / frequency_hz**2)[()]
+
+
+def polarization_loss(faraday_rotation: float, misalignment: float = 0) -> float:
+    """
+    Calculate the polarization mismatch between a linearly polarized wave and the
+    receiving antenna, in decibels
+
+    Parameters
+    ----------
+        faraday_rotation (float, deg): the rotation of the wave's polarization,
+            scalar or array
+        misalignment (float, deg): the angle between the transmitted polarization
+            and the receiving antenna
+
+    Returns
+    -------
+        polarization_loss (float, dB): 20 log10|cos(theta)|, zero when aligned and
+            increasingly negative as the wave rotates out of alignment
+    """
+    mismatch = np.radians(np.asarray(faraday_rotation) + misalignment)
+    with np.errstate(divide="ignore"):
+        return (20 * np.log10(np.abs(np.cos(mismatch))))[()]
+
+
+def ionospheric_polarization_loss(
+    total_electron_content: float,
+    frequency: float,
+    magnetic_field: float = MAGNETIC_FIELD,
+    misalignment: float = 0,
+) -> float:
+    """
+    Calculate the polarization mismatch caused by Faraday rotation for a linearly
+    polarized link
+
+    Parameters
+    ----------
+        total_electron_content (float, TECU): the slant total electron content
+        frequency (float, GHz): the carrier frequency
+        magnetic_field (float, T): the average component of the Earth's magnetic
+            field along the propagation path
+        misalignment (float, deg): the angle between the transmitted polarization
+            and the receiving antenna
+
+    Returns
+    -------
+        polarization_loss (float, dB)
+    """
+    return polarization_loss(
+        faraday_rotation(total_electron_content, frequency, magnetic_field),
+        misalignment,
+    )
@@ -0,0 +1,251 @@
+import numpy as np
+import pandas as pd
+from scipy.special import ndtr, ndtri, owens_t
+
+from link_calculator.components.communicators import GroundStation
+from link_calculator.constants import EARTH_RADIUS
+from link_calculator.orbits.utils import GeodeticCoordinate
+from link_calculator.propagation.time_series import lognormal_fade_parameters
+
+
+def diversity_gain(
+    separation: float,
+    rain_attenuation: float,
+    frequency: float,
+    elevation_angle: float,
+    baseline_angle: float = 90,
+) -> float:
+    """
+    Calculate the site diversity gain of a pair of Earth stations (ITU-R P.618
+    section 2.2.4.2)
+
+    All parameters may be scalars or broadcastable numpy arrays.
+
+    Parameters
+    ----------
+        separation (float, km): the distance between the two sites
+        rain_attenuation (float, dB): the single site rain attenuation
+        frequency (float, GHz): the carrier frequency
+        elevation_angle (float, deg): the angle between the Earth stations and the
+            satellite
+        baseline_angle (float, deg): the angle between the baseline joining the sites
+            and the azimuth of the propagation path, in the range [0, 90]
+
+    Returns
+    -------
+        diversity_gain (float, dB): the reduction in attenuation from switching to the
+            least faded site
+    """
+    a = 0.78 * rain_attenuation - 1.94 * (1 - np.exp(-0.11 * rain_attenuation))
+    b = 0.59 * (1 - np.exp(-0.1 * rain_attenuation))
+    separation_gain = a * (1 - np.exp(-b * separation))
+    frequency_gain = np.exp(-0.025 * frequency)
+    elevation_gain = 1 + 0.006 * np.asarray(elevation_angle)
+    baseline_gain = 1 + 0.002 * np.asarray(baseline_angle)
+    return separation_gain * frequency_gain * elevation_gain * baseline_gain
+
+
+def _bivariate_normal_sf(h: float, k: float, rho: float) -> float:
+    """
+    Calculate P(X > h, Y > k) for standard normal variables X, Y with correlation rho
+    using Owen's T function
+    """
+    # the upper orthant probability is the CDF evaluated at (-h, -k)
+    h, k, rho = np.broadcast_arrays(-np.asarray(h), -np.asarray(k), rho)
+    # fully correlated variables reduce to the tail of the larger threshold
+    rho = np.clip(rho, -1 + 1e-12, 1 - 1e-12)
+    # nudge zeros off the axes so the T function arguments stay finite
+    h = np.where(h == 0, 1e-12, h)
+    k = np.where(k == 0, 1e-12, k)
+    root = np.sqrt(1 - rho**2)
+    correction = np.where((h * k > 0) | ((h * k == 0) & (h + k >= 0)), 0, 0.5)
+    return (
+        0.5 * ndtr(h)
+        + 0.5 * ndtr(k)
+        - owens_t(h, (k - rho * h) / (h * root))
+        - owens_t(k, (h - rho * k) / (k * root))
+        - correction
+    )
+
+
+def joint_exceedance_probability(
+    separation: float,
+    attenuation_1: float,
+    attenuation_2: float,
+    m_1: float,
+    sigma_1: float,
+    m_2: float,
+    sigma_2: float,
+    rain_probability_1: float,
+    rain_probability_2: float,
+) -> float:
+    """
+    Calculate the percentage of time both sites of a diversity pair simultaneously
+    exceed their attenuation thresholds (ITU-R P.618 section 2.2.4.1)
+
+    Parameters
+    ----------
+        separation (float, km): the distance between the two sites
+        attenuation_1, attenuation_2 (float, dB): the attenuation threshold at each site
+        m_1, m_2 (float, ): the mean of ln(A) while raining at each site
+        sigma_1, sigma_2 (float, ): the standard deviation of ln(A) while raining
+        rain_probability_1, rain_probability_2 (float, %): the percentage of time it is
+            raining at each site
+
+    Returns
+    -------
+        joint_probability (float, %)
+    """
+    rain_correlation = 0.7 * np.exp(-separation / 60) + 0.3 * np.exp(
+        -((separation / 700) ** 2)
+    )
+    attenuation_correlation = 0.94 * np.exp(-separation / 30) + 0.06 * np.exp(
+        -((separation / 500) ** 2)
+    )
+    both_raining = _bivariate_normal_sf(
+        -ndtri(np.asarray(rain_probability_1) / 100),
+        -ndtri(np.asarray(rain_probability_2) / 100),
+        rain_correlation,
+    )
+    both_exceeded = _bivariate_normal_sf(
+        (np.log(attenuation_1) - m_1) / sigma_1,
+        (np.log(attenuation_2) - m_2) / sigma_2,
+        attenuation_correlation,
+    )
+    return (100 * both_raining * both_exceeded)[()]
+
+
+def _candidate_pairs(
+    latitude: np.ndarray, longitude: np.ndarray, max_central_angle: float
+) -> tuple:
+    """
+    Find the station pairs that may lie within a central angle of each other, without
+    forming every pair
+
+    The stations are sorted by latitude and each is paired only with the stations
+    that follow it within a latitude window, which bounds the central angle from
+    below. Pairs whose longitude gap, scaled by the cosine of their latitudes,
+    already exceeds the angle are then dropped.
+
+    Returns
+    -------
+        i, j (np.ndarray, ): the indices of each candidate pair, with i < j, in
+            lexicographic order
+    """
+    order = np.argsort(latitude, kind="stable")
+    sorted_latitude = latitude[order]
+    first = np.arange(len(order))
+    end = np.searchsorted(sorted_latitude, sorted_latitude + max_central_angle, "right")
+    counts = end - first - 1
+    a = np.repeat(first, counts)
+    # the position of each pair within its window, starting at the next station
+    offset = np.arange(len(a)) - np.repeat(np.cumsum(counts) - counts, counts)
+    b = a + 1 + offset
+    i, j = order[a], order[b]
+
+    # hav(c) >= cos(lat_i) cos(lat_j) hav(d_long), so a wide longitude gap alone
+    # rules a pair out
+    half_gap = np.radians(np.abs(longitude[i] - longitude[j]) % 360) / 2
+    scale = np.cos(np.radians(latitude[i])) * np.cos(np.radians(latitude[j]))
+    near = (
+        scale * np.sin(half_gap) ** 2 <= np.sin(np.radians(max_central_angle) / 2) ** 2
+    )
+    i, j = i[near], j[near]
+
+    i, j = np.minimum(i, j), np.maximum(i, j)
+    pairs = np.lexsort((j, i))
+    return i[pairs], j[pairs]
+
+
+def site_diversity(
+    stations: list[GroundStation],
+    rain_attenuation: np.ndarray,
+    frequency: float,
+    elevation_angle: np.ndarray,
+    fade_margin: np.ndarray,
+    rain_probability: np.ndarray,
+    max_separation: float = 50,
+    baseline_angle: float = 90,
+) -> pd.DataFrame:
+    """
+    Evaluate site diversity for every pair of Earth stations within a separation
+    threshold
+
+    Candidate pairs are found by sweeping a latitude window over the stations sorted
+    by latitude and pruned by their longitude gap, both of which bound the great
+    circle distance from below, so distant pairs are never formed. Only the
+    remaining pairs are evaluated, in a single vectorized pass.
+
+    Parameters
+    ----------
+        stations (list[GroundStation], ): the Earth stations, each with a
+            ground_coordinate
+        rain_attenuation (np.ndarray, dB): the attenuation exceeded for 0.01% of the
+            time at each station
+        frequency (float, GHz): the carrier frequency
+        elevation_angle (np.ndarray, deg): the elevation angle at each station
+        fade_margin (np.ndarray, dB): the rain fade margin at each station
+        rain_probability (np.ndarray, %): the percentage of time it is raining at
+            each station
+        max_separation (float, km): pairs further apart than this are not evaluated
+        baseline_angle (float, deg): the angle between the pair baseline and the
+            azimuth of the propagation path
+
+    Returns
+    -------
+        pairs (pd.DataFrame, ): one row per station pair with the separation (km),
+            diversity gain (dB), single site outages and joint outage (%)
+    """
+    n_stations = len(stations)
+    latitude = np.array([s.ground_coordinate.latitude for s in stations], dtype=float)
+    longitude = np.array([s.ground_coordinate.longitude for s in stations], dtype=float)
+    rain_attenuation, elevation_angle, fade_margin, rain_probability = (
+        np.broadcast_to(np.asarray(x, dtype=float), (n_stations,))
+        for x in (rain_attenuation, elevation_angle, fade_margin, rain_probability)
+    )
+
+    max_central_angle = np.degrees(max_separation / EARTH_RADIUS)
+    i, j = _candidate_pairs(latitude, longitude, max_central_angle)
+
+    central_angle = GeodeticCoordinate(latitude[i], longitude[i]).central_angle(
+        GeodeticCoordinate(latitude[j], longitude[j])
+    )
+    separation = np.radians(central_angle) * EARTH_RADIUS
+    within = separation <= max_separation
+    i, j, separation = i[within], j[within], separation[within]
+
+    m, sigma = lognormal_fade_parameters(
+        rain_attenuation, elevation_angle, latitude, rain_probability
+    )
+    single_outage = rain_probability * ndtr(-(np.log(fade_margin) - m) / sigma)
+
+    gain = diversity_gain(
+        separation,
+        0.5 * (rain_attenuation[i] + rain_attenuation[j]),
+        frequency,
+        0.5 * (elevation_angle[i] + elevation_angle[j]),
+        baseline_angle,
+    )
+    joint_outage = joint_exceedance_probability(
+        separation,
+        fade_margin[i],
+        fade_margin[j],
+        m[i],
+        sigma[i],
+        m[j],
+        sigma[j],
+        rain_probability[i],
+        rain_probability[j],
+    )
+
+    return pd.DataFrame(
+        {
+            "station_a": [stations[k].name for k in i],
+            "station_b": [stations[k].name for k in j],
+            "separation": separation,
+            "diversity_gain": gain,
+            "outage_a": single_outage[i],
+            "outage_b": single_outage[j],
+            "joint_outage": np.atleast_1d(joint_outage),
+        }
+    )
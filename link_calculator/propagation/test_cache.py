@@ -0,0 +1,73 @@
+from concurrent.futures import ThreadPoolExecutor
+from math import isclose
+
+import pytest
+
+from link_calculator.propagation.attenuation import rain_attenuation, slant_path
+from link_calculator.propagation.cache import AttenuationCache
+
+RAIN = dict(
+    frequency=20, rain_altitude=3, station_altitude=0, station_latitude=45, rain_rate=42
+)
+
+
+def test_quantized_lookup():
+    cache = AttenuationCache()
+    rain = {**RAIN, "station_altitude": 0.5}
+    att = cache.rain_attenuation(30.001, **rain)
+    d_s = slant_path(30, 3, 0.5)
+    assert isclose(att, rain_attenuation(30, d_s, 20, 3, 0.5, 45, 42), rel_tol=1e-12)
+
+    # inputs within the tolerances share the entry
+    assert (
+        cache.rain_attenuation(
+            29.998, **{**rain, "frequency": 20.0001, "station_latitude": 45.001}
+        )
+        == att
+    )
+    assert cache.rain_attenuation(30, **rain, polarization="horizontal") != att
+    assert (cache.hits, cache.misses, cache.size) == (1, 2, 2)
+    assert isclose(cache.hit_rate, 1 / 3)
+
+    # the slant path is derived, so the positions of attenuation.rain_attenuation
+    # must not be usable
+    with pytest.raises(TypeError):
+        cache.rain_attenuation(30, 20, 3, 0.5, 45, 42)
+
+
+def test_lru_eviction():
+    cache = AttenuationCache(maxsize=2)
+    cache.slant_path(10, 3, 0)
+    cache.slant_path(20, 3, 0)
+    cache.slant_path(10, 3, 0)
+    cache.slant_path(30, 3, 0)
+
+    assert cache.size == 2 and cache.evictions == 1
+    cache.slant_path(10, 3, 0)
+    assert cache.hits == 2
+    cache.slant_path(20, 3, 0)
+    assert cache.misses == 4
+
+
+def test_threads_and_persistence(tmp_path):
+    path = tmp_path / "attenuation.json"
+    cache = AttenuationCache(maxsize=100, path=path)
+    elevations = [10 + i % 50 for i in range(1000)]
+    with ThreadPoolExecutor(8) as pool:
+        list(pool.map(lambda e: cache.rain_attenuation(e, **RAIN), elevations))
+    assert cache.hits + cache.misses == 1000
+    assert cache.size == 50
+    cache.save()
+
+    reloaded = AttenuationCache(maxsize=100, path=path)
+    assert reloaded.size == 50
+    assert reloaded.rain_attenuation(25, **RAIN) == cache.rain_attenuation(25, **RAIN)
+    assert reloaded.misses == 0
+
+    # a smaller cache keeps the most recent entries without counting evictions
+    smaller = AttenuationCache(maxsize=10, path=path)
+    assert smaller.size == 10 and smaller.evictions == 0
+    assert smaller.rain_attenuation(25, **RAIN) == cache.rain_attenuation(25, **RAIN)
+
+    # results quantized differently are not reused
+    assert AttenuationCache(path=path, tolerances={"frequency": 0.1}).size == 0
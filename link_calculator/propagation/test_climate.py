@@ -0,0 +1,26 @@
+import numpy as np
+
+from link_calculator.propagation.attenuation import rain_attenuation, slant_path
+from link_calculator.propagation.climate import RainClimate
+
+
+def test_rain_climate(tmp_path):
+    latitudes = np.arange(-90, 90.1, 1.5)
+    longitudes = np.arange(-180, 180.1, 1.5)
+    rain_rates = 100 * np.cos(np.radians(latitudes))[:, None] * np.ones_like(longitudes)
+    rain_heights = 5 - 3 * np.abs(latitudes / 90)[:, None] * np.ones_like(longitudes)
+    np.save(tmp_path / "r001.npy", rain_rates)
+    np.savetxt(tmp_path / "hr.csv", rain_heights, delimiter=",")
+
+    climate = RainClimate.from_files(tmp_path / "r001.npy", tmp_path / "hr.csv")
+
+    station_lats = np.array([-35.3, 1.35, 51.5])
+    station_longs = np.array([149.1, 103.8, -0.1])
+    rain_rate = climate.rain_rate(station_lats, station_longs)
+    rain_height = climate.rain_height(station_lats, station_longs)
+    assert np.allclose(rain_rate, 100 * np.cos(np.radians(station_lats)), rtol=1e-3)
+    assert np.allclose(rain_height, 5 - 3 * np.abs(station_lats / 90))
+
+    spath = slant_path(30, rain_height, 0.1)
+    atts = rain_attenuation(30, spath, 20, rain_height, 0.1, station_lats, rain_rate)
+    assert atts.shape == (3,)
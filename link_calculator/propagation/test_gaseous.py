@@ -0,0 +1,106 @@
+from math import isclose
+
+import numpy as np
+import pytest
+
+from link_calculator.conversions import decibel_to_watt
+from link_calculator.propagation.gaseous import (
+    AtmosphereProfile,
+    gaseous_attenuation,
+    oxygen_equivalent_height,
+    oxygen_specific_attenuation,
+    water_vapour_equivalent_height,
+    water_vapour_specific_attenuation,
+    zenith_gaseous_attenuation,
+)
+
+
+def test_specific_attenuation():
+    frequencies = [12, 22.235, 30]  # GHz
+    oxygen_atts = [0.0083, 0.0127, 0.0209]  # dB / km
+    vapour_atts = [0.0105, 0.179, 0.080]  # dB / km
+
+    for f, gamma_o, gamma_w in zip(frequencies, oxygen_atts, vapour_atts):
+        assert isclose(oxygen_specific_attenuation(f), gamma_o, rel_tol=0.05)
+        assert isclose(water_vapour_specific_attenuation(f), gamma_w, rel_tol=0.05)
+
+
+def test_oxygen_attenuation_bands():
+    # the 60 GHz line complex and the 118.75 GHz line
+    assert isclose(oxygen_specific_attenuation(60), 15.0, rel_tol=0.01)
+    assert isclose(oxygen_specific_attenuation(118.75), 1.38, rel_tol=0.05)
+
+    # the bands of the model join continuously
+    edges = np.array([54, 60, 62, 66, 120])
+    assert np.allclose(
+        oxygen_specific_attenuation(edges - 1e-6),
+        oxygen_specific_attenuation(edges + 1e-6),
+        rtol=0.01,
+    )
+    assert np.all(np.isfinite(gaseous_attenuation(np.linspace(1, 350, 500), 30)))
+
+    with pytest.raises(ValueError):
+        oxygen_specific_attenuation(400)
+
+
+def test_zenith_gaseous_attenuation():
+    frequencies = np.array([4, 12, 20, 30])  # GHz
+    zenith_atts = [0.039, 0.061, 0.257, 0.243]  # dB
+
+    assert np.allclose(zenith_gaseous_attenuation(frequencies), zenith_atts, rtol=0.05)
+    assert np.all(
+        zenith_gaseous_attenuation(frequencies, station_altitude=1.5)
+        < zenith_gaseous_attenuation(frequencies)
+    )
+
+
+def test_gaseous_attenuation_vectorized():
+    frequencies = np.array([4, 12, 20, 30])  # GHz
+    elevations = np.array([2, 5, 10, 30, 90])  # deg
+
+    atts = gaseous_attenuation(frequencies[:, None], elevations[None, :], 0.5)
+    assert atts.shape == (4, 5)
+    assert np.all(np.diff(atts, axis=-1) < 0)
+
+    for i, f in enumerate(frequencies):
+        for j, elevation in enumerate(elevations):
+            assert isclose(
+                atts[i, j], gaseous_attenuation(f, elevation, 0.5), rel_tol=1e-12
+            )
+
+
+def test_gaseous_attenuation_low_elevation():
+    # the curved Earth approximation below 5 deg meets the cosecant law to within
+    # the error of its F(x) fit
+    frequencies = np.array([12, 20, 30, 50])
+    below = gaseous_attenuation(frequencies, 5 - 1e-9)
+    above = gaseous_attenuation(frequencies, 5)
+    assert np.allclose(below, above, rtol=0.08)
+    assert np.all(below < above)
+
+    # P.676 Annex 2 at 3 deg, including the 1 / cos factor
+    elevation = np.radians(3)
+    attenuation = 0
+    for gamma, height in [
+        (oxygen_specific_attenuation(20), oxygen_equivalent_height(20)),
+        (water_vapour_specific_attenuation(20), water_vapour_equivalent_height(20)),
+    ]:
+        x = np.tan(elevation) * np.sqrt(8500 / height)
+        F = 1 / (0.661 * x + 0.339 * np.sqrt(x**2 + 5.51))
+        attenuation += gamma * np.sqrt(8500 * height) * F / np.cos(elevation)
+    assert isclose(gaseous_attenuation(20, 3), attenuation, rel_tol=1e-12)
+
+
+def test_atmosphere_profile():
+    frequencies = np.array([4, 12, 20, 30])  # GHz
+    elevations = np.array([[10], [30]])  # deg
+
+    profile = AtmosphereProfile(station_altitude=0.5, water_vapour_density=10)
+    atts = profile.slant_attenuation(frequencies, elevations)
+    assert np.allclose(
+        atts, gaseous_attenuation(frequencies, elevations, 0.5, 10), rtol=1e-12
+    )
+    assert np.allclose(profile.slant_attenuation(frequencies, elevations), atts)
+    assert np.allclose(
+        profile.atmospheric_loss(frequencies, elevations), decibel_to_watt(-atts)
+    )
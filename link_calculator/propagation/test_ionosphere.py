@@ -0,0 +1,41 @@
+from math import isclose
+
+import numpy as np
+
+from link_calculator.propagation.ionosphere import (
+    excess_path_length,
+    faraday_rotation,
+    group_delay,
+    ionospheric_polarization_loss,
+    polarization_loss,
+)
+
+
+def test_faraday_rotation_and_delay():
+    # 100 TECU at 1 GHz
+    assert isclose(np.radians(faraday_rotation(100, 1)), 1.18, rel_tol=1e-9)
+    assert isclose(group_delay(100, 1), 1.345e-7, rel_tol=1e-3)
+    assert isclose(excess_path_length(100, 1), 40.3, rel_tol=1e-9)
+
+    tec = np.array([5, 20, 50, 120])  # TECU
+    frequencies = np.array([1.2, 1.575, 2.2])  # GHz
+    rotations = faraday_rotation(tec[:, None], frequencies[None, :])
+    assert rotations.shape == (4, 3)
+    assert np.allclose(rotations[:, 0] / rotations[:, 1], (1.575 / 1.2) ** 2)
+    assert np.allclose(
+        group_delay(tec, 1.575) / group_delay(tec, 2.2), (2.2 / 1.575) ** 2
+    )
+
+
+def test_polarization_loss():
+    assert polarization_loss(0) == 0
+    assert isclose(polarization_loss(45), 20 * np.log10(np.sqrt(0.5)))
+    assert isclose(polarization_loss(60), polarization_loss(-60))
+    assert isclose(polarization_loss(150), polarization_loss(30))
+    assert polarization_loss(90) < -200
+
+    tec = np.linspace(0, 50, 11)
+    losses = ionospheric_polarization_loss(tec, 4)
+    assert losses.shape == (11,)
+    assert np.allclose(losses, polarization_loss(faraday_rotation(tec, 4)))
+    assert np.all(np.diff(losses) < 0)
@@ -11,12 +11,19 @@ from link_calculator.conversions import (
 )
 from link_calculator.orbits.utils import central_angle_orbital_radius, slant_range
 from link_calculator.propagation.attenuation import (
+    cloud_attenuation,
+    cloud_specific_attenuation,
     horizontal_reduction,
     rain_attenuation,
+    rain_attenuation_exceedance,
+    rain_outage_percentage,
     rain_specific_attenuation,
+    scintillation_attenuation,
     slant_path,
+    total_atmospheric_attenuation,
     zeta,
 )
+from link_calculator.propagation.gaseous import gaseous_attenuation
 
 
 def test_rain_specific_attenuation_vertical():
@@ -131,3 +138,151 @@ def test_rain_attenuation_2():
         "horizontal",
     )
     assert isclose(rain_att, 1.241, rel_tol=0.1)
+
+
+def test_rain_attenuation_vectorized():
+    elevations = np.array([2, 4.9, 5, 20, 42, 50, 80])
+    latitudes = np.array([-60, -36, -35.9, 0, 20, 30, 45])
+    frequencies = np.array([4, 8, 12, 14, 20, 30, 40])
+    gs_altitudes = np.array([0.0, 0.5, 0.99, 1.0, 1.5, 0.6, 0.2])
+    rain_height = 3  # km
+    rain_rate = 10  # mm / h
+
+    spaths = slant_path(elevations[:, None], rain_height, gs_altitudes[None, :])
+    rain_atts = rain_attenuation(
+        elevations[:, None, None],
+        spaths[:, :, None],
+        frequencies[None, None, :],
+        rain_height,
+        gs_altitudes[None, :, None],
+        latitudes[None, :, None],
+        rain_rate,
+        "circular",
+    )
+    assert rain_atts.shape == (7, 7, 7)
+
+    for i, elevation in enumerate(elevations):
+        for j, (gs_altitude, gs_lat) in enumerate(zip(gs_altitudes, latitudes)):
+            spath = slant_path(elevation, rain_height, gs_altitude)
+            assert isclose(spaths[i, j], spath, rel_tol=1e-12)
+            for k, freq in enumerate(frequencies):
+                rain_att = rain_attenuation(
+                    elevation,
+                    spath,
+                    freq,
+                    rain_height,
+                    gs_altitude,
+                    gs_lat,
+                    rain_rate,
+                    "circular",
+                )
+                assert isclose(rain_atts[i, j, k], rain_att, rel_tol=1e-12)
+
+    # values from the scalar implementation the vectorized one replaced, across
+    # the elevation, altitude and latitude branches
+    diagonal = np.arange(7)
+    baseline_spaths = [136.793, 56.3104, 23.0622, 5.84761, 2.24171, 3.13298, 2.84319]
+    baseline_rain_atts = [
+        0.860573,
+        4.2158,
+        6.54295,
+        3.03488,
+        2.74222,
+        8.39074,
+        13.2646,
+    ]
+    assert np.allclose(spaths[diagonal, diagonal], baseline_spaths, rtol=1e-5)
+    assert np.allclose(
+        rain_atts[diagonal, diagonal, diagonal], baseline_rain_atts, rtol=1e-5
+    )
+
+
+def test_rain_attenuation_exceedance():
+    rain_atts = np.array([1.241, 10, 25])  # dB
+    elevations = np.array([50, 20, 10])  # deg
+    latitudes = np.array([20, 30, 50])  # deg
+    percentages = np.array([0.001, 0.01, 0.1, 1, 5])
+
+    curves = rain_attenuation_exceedance(rain_atts, percentages, elevations, latitudes)
+    assert curves.shape == (3, 5)
+    assert np.allclose(curves[:, 1], rain_atts)
+    assert np.all(np.diff(curves, axis=-1) < 0)
+
+    for i in range(len(rain_atts)):
+        for j, p in enumerate(percentages):
+            att = rain_attenuation_exceedance(
+                rain_atts[i], p, elevations[i], latitudes[i]
+            )
+            assert isclose(curves[i, j], att, rel_tol=1e-12)
+
+
+def test_rain_outage_percentage():
+    rain_atts = np.array([1.241, 10, 25])  # dB
+    elevations = np.array([50, 20, 10])  # deg
+    latitudes = np.array([20, 30, 50])  # deg
+    percentages = np.array([0.003, 0.05, 0.5, 2])
+
+    margins = rain_attenuation_exceedance(rain_atts, percentages, elevations, latitudes)
+    outages = rain_outage_percentage(
+        margins, rain_atts[:, None], elevations[:, None], latitudes[:, None]
+    )
+    assert np.allclose(outages, percentages, rtol=0.01)
+
+
+def test_cloud_attenuation():
+    frequencies = np.array([12, 20, 30])  # GHz
+    coefficients = [0.133, 0.359, 0.771]  # (dB / km) / (g / m^3)
+
+    assert np.allclose(cloud_specific_attenuation(frequencies), coefficients, rtol=0.01)
+    assert np.allclose(
+        cloud_attenuation(30, frequencies, 0.5), 2 * 0.5 * np.array(coefficients), 0.01
+    )
+
+
+def test_scintillation_attenuation():
+    percentages = np.array([0.01, 0.1, 1, 10])
+    atts = scintillation_attenuation(31.07, 14.25, 1.2, 15, 75, percentages)
+    assert atts.shape == (4,)
+    assert np.all(np.diff(atts) < 0)
+
+    # large apertures average out the turbulence
+    assert scintillation_attenuation(31.07, 30, 30, 15, 75) == 0
+
+
+def test_total_atmospheric_attenuation():
+    elevations = np.array([[10], [30], [60]])  # deg
+    frequencies = np.array([12, 20, 30])  # GHz
+    percentages = np.array([0.01, 0.1, 1])
+    gs_lat = 20
+    gs_altitude = 0.5  # km
+    rain_height = 3.5  # km
+    rain_rate = 50  # mm / h
+
+    total = total_atmospheric_attenuation(
+        elevations,
+        frequencies,
+        gs_lat,
+        gs_altitude,
+        rain_height,
+        rain_rate,
+        liquid_water=0.5,
+        humidity=75,
+        antenna_diameter=1.2,
+        percentage=percentages,
+    )
+    assert total.shape == (3, 3, 3)
+
+    spath = slant_path(30, rain_height, gs_altitude)
+    rain_att = rain_attenuation(
+        30, spath, 20, rain_height, gs_altitude, gs_lat, rain_rate
+    )
+    for k, p in enumerate(percentages):
+        expected = gaseous_attenuation(20, 30, gs_altitude) + np.sqrt(
+            (
+                rain_attenuation_exceedance(rain_att, p, 30, gs_lat)
+                + cloud_attenuation(30, 20, 0.5)
+            )
+            ** 2
+            + scintillation_attenuation(30, 20, 1.2, 15, 75, p) ** 2
+        )
+        assert isclose(total[1, 1, k], expected, rel_tol=1e-9)
@@ -0,0 +1,103 @@
+from math import isclose
+
+import numpy as np
+from scipy.special import ndtr
+
+from link_calculator.components.antennas import Antenna
+from link_calculator.components.communicators import GroundStation
+from link_calculator.orbits.utils import GeodeticCoordinate
+from link_calculator.propagation.site_diversity import (
+    _candidate_pairs,
+    diversity_gain,
+    joint_exceedance_probability,
+    site_diversity,
+)
+
+
+def _ground_station(name, latitude, longitude):
+    return GroundStation(
+        name=name,
+        transmit=Antenna(gain=1),
+        receive=Antenna(gain=1),
+        ground_coordinate=GeodeticCoordinate(latitude, longitude),
+    )
+
+
+def test_diversity_gain():
+    separations = np.array([0, 5, 10, 20, 50])  # km
+    gains = diversity_gain(separations, 20, 20, 30)
+
+    assert gains[0] == 0
+    assert np.all(np.diff(gains) > 0)
+    for d, gain in zip(separations, gains):
+        assert isclose(diversity_gain(d, 20, 20, 30), gain)
+
+
+def test_joint_exceedance_probability():
+    # co-located sites are fully correlated
+    single = 5 * ndtr(-np.log(5))
+    assert np.isclose(
+        joint_exceedance_probability(0, 5, 5, 0, 1, 0, 1, 5, 5), single, rtol=1e-3
+    )
+
+    joints = joint_exceedance_probability(
+        np.array([1, 10, 100, 3000]), 5, 5, 0, 1, 0, 1, 5, 5
+    )
+    assert np.all(np.diff(joints) < 0)
+    # distant sites fade independently
+    assert np.isclose(joints[-1], single**2 / 100, rtol=0.1)
+
+
+def test_site_diversity():
+    stations = [
+        _ground_station("a", -35.30, 149.10),
+        _ground_station("b", -35.40, 149.25),
+        _ground_station("c", -35.20, 149.00),
+        _ground_station("d", -33.87, 151.21),
+    ]
+    pairs = site_diversity(
+        stations,
+        rain_attenuation=np.array([20, 22, 18, 25]),
+        frequency=20,
+        elevation_angle=40,
+        fade_margin=8,
+        rain_probability=5,
+        max_separation=50,
+    )
+
+    assert list(zip(pairs.station_a, pairs.station_b)) == [
+        ("a", "b"),
+        ("a", "c"),
+        ("b", "c"),
+    ]
+    a = stations[0].ground_coordinate
+    b = stations[1].ground_coordinate
+    assert np.isclose(
+        pairs.separation[0], np.radians(a.central_angle(b)) * 6378.14, rtol=1e-9
+    )
+    assert np.all(pairs.diversity_gain > 0)
+    assert np.all(pairs.joint_outage < np.minimum(pairs.outage_a, pairs.outage_b))
+    assert np.all(pairs.joint_outage > pairs.outage_a * pairs.outage_b / 100)
+
+
+def test_candidate_pairs():
+    rng = np.random.default_rng(0)
+    # clustered stations, including repeated latitudes and the antimeridian
+    latitude = np.round(rng.uniform(-5, 5, 300), 1)
+    longitude = rng.choice([-179.9, 0, 179.9], 300) + rng.uniform(-2, 2, 300)
+    max_central_angle = 1.5
+
+    i, j = _candidate_pairs(latitude, longitude, max_central_angle)
+    assert np.all(i < j)
+    assert np.all(np.diff(i * len(latitude) + j) > 0)
+
+    # every pair within the angle is a candidate, and far fewer than all pairs are
+    all_i, all_j = np.triu_indices(len(latitude), k=1)
+    angle = GeodeticCoordinate(latitude[all_i], longitude[all_i]).central_angle(
+        GeodeticCoordinate(latitude[all_j], longitude[all_j])
+    )
+    within = set(
+        zip(all_i[angle <= max_central_angle], all_j[angle <= max_central_angle])
+    )
+    assert within <= set(zip(i, j))
+    assert len(i) < len(all_i) / 10
@@ -0,0 +1,39 @@
+import numpy as np
+
+from link_calculator.propagation.attenuation import rain_attenuation_exceedance
+from link_calculator.propagation.time_series import (
+    RainFadeTimeSeries,
+    lognormal_fade_parameters,
+)
+
+
+def test_lognormal_fade_parameters():
+    percentages = np.array([0.01, 0.1, 1])
+    rain_atts = np.array([5, 20])  # dB
+
+    m, sigma = lognormal_fade_parameters(rain_atts, 30, 20, rain_probability=5)
+    assert m.shape == sigma.shape == (2,)
+
+    for i, att in enumerate(rain_atts):
+        series = RainFadeTimeSeries(m[i], sigma[i], 5)
+        curve = rain_attenuation_exceedance(att, percentages, 30, 20)
+        assert np.allclose(series.exceedance(curve), percentages, rtol=0.35)
+
+
+def test_rain_fade_time_series():
+    series = RainFadeTimeSeries.from_station(20, 30, 20, rain_probability=5)
+    chunks = list(series.generate(3 * 365 * 86400, sample_period=10, seed=1))
+    assert len(chunks[0]) == 86400
+
+    atts = np.concatenate(chunks)
+    assert np.isclose(np.mean(atts > 0) * 100, 5, rtol=0.1)
+    for att in [0.5, 1, 5]:
+        assert np.isclose(np.mean(atts > att) * 100, series.exceedance(att), rtol=0.2)
+
+
+def test_rain_fade_time_series_chunks():
+    series = RainFadeTimeSeries(m=0, sigma=1, rain_probability=5)
+    atts = np.concatenate(list(series.generate(86400, chunk_size=1000, seed=3)))
+    atts_ = np.concatenate(list(series.generate(86400, chunk_size=7777, seed=3)))
+    assert len(atts) == 86400
+    assert np.array_equal(atts, atts_)
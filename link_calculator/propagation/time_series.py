@@ -0,0 +1,204 @@
+from typing import Iterator
+
+import numpy as np
+from scipy.signal import lfilter
+from scipy.special import ndtr, ndtri
+
+from link_calculator.propagation.attenuation import (
+    EXCEEDANCE_PERCENTAGES,
+    rain_attenuation_exceedance,
+)
+
+
+def lognormal_fade_parameters(
+    rain_attenuation: float,
+    elevation_angle: float,
+    station_latitude: float,
+    rain_probability: float,
+    percentages: np.ndarray = None,
+) -> tuple:
+    """
+    Fit the conditional lognormal distribution of rain attenuation to the station's
+    exceedance curve (ITU-R P.1853)
+
+    ln(A(p)) is regressed against Q^-1(p / P_rain) over the percentages below the
+    probability of rain, giving P(A > a | rain) = Q((ln(a) - m) / sigma).
+
+    Parameters
+    ----------
+        rain_attenuation (float, dB): the attenuation exceeded for 0.01% of the time,
+            scalar or array
+        elevation_angle (float, deg): the angle between the Earth station and the satellite
+        station_latitude (float, deg): the latitude of the Earth station
+        rain_probability (float, %): the percentage of time it is raining at the
+            station, broadcastable with rain_attenuation
+        percentages (np.ndarray, %, optional): percentages of time to fit over
+
+    Returns
+    -------
+        m (float, ): the mean of ln(A) while raining
+        sigma (float, ): the standard deviation of ln(A) while raining
+    """
+    if percentages is None:
+        percentages = EXCEEDANCE_PERCENTAGES
+    percentages = np.asarray(percentages)
+    rain_probability = np.asarray(rain_probability)[..., None]
+    fitted = percentages < rain_probability
+    n_fitted = np.sum(fitted, axis=-1)
+    if np.any(n_fitted < 2):
+        raise ValueError("The probability of rain is below the fitted percentages")
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_attenuation = np.log(
+            rain_attenuation_exceedance(
+                rain_attenuation, percentages, elevation_angle, station_latitude
+            )
+        )
+        z = -ndtri(percentages / rain_probability)
+    log_attenuation = np.where(fitted, log_attenuation, 0)
+    z = np.where(fitted, z, 0)
+
+    z_mean = np.sum(z, axis=-1) / n_fitted
+    log_attenuation_mean = np.sum(log_attenuation, axis=-1) / n_fitted
+    z_centred = np.where(fitted, z - z_mean[..., None], 0)
+    sigma = np.sum(z_centred * log_attenuation, axis=-1) / np.sum(
+        z_centred**2, axis=-1
+    )
+    m = log_attenuation_mean - sigma * z_mean
+    return m[()], sigma[()]
+
+
+class RainFadeTimeSeries:
+    def __init__(
+        self,
+        m: float,
+        sigma: float,
+        rain_probability: float,
+        beta: float = 2e-4,
+    ):
+        """
+        Synthesise temporally correlated rain fades with a lognormal, first-order
+        filtered model (ITU-R P.1853)
+
+        A unit Gaussian process X(t) is generated by low-pass filtering white noise
+        with time constant 1 / beta. It rains while X(t) exceeds Q^-1(P_rain), and the
+        excess is mapped onto the conditional lognormal distribution of attenuation,
+        so the long term statistics of the series reproduce the fitted distribution.
+
+        Parameters
+        ----------
+            m (float, ): the mean of ln(A) while raining
+            sigma (float, ): the standard deviation of ln(A) while raining
+            rain_probability (float, %): the percentage of time it is raining
+            beta (float, s^-1): the rate of change of the underlying Gaussian process
+        """
+        self._m = m
+        self._sigma = sigma
+        self._rain_probability = rain_probability
+        self._beta = beta
+
+    @classmethod
+    def from_station(
+        cls,
+        rain_attenuation: float,
+        elevation_angle: float,
+        station_latitude: float,
+        rain_probability: float,
+        beta: float = 2e-4,
+    ) -> "RainFadeTimeSeries":
+        """
+        Fit the time series model to a station's rain attenuation statistics
+
+        Parameters
+        ----------
+            rain_attenuation (float, dB): the attenuation exceeded for 0.01% of the time
+            elevation_angle (float, deg): the angle between the Earth station and the
+                satellite
+            station_latitude (float, deg): the latitude of the Earth station
+            rain_probability (float, %): the percentage of time it is raining
+            beta (float, s^-1): the rate of change of the underlying Gaussian process
+
+        Returns
+        -------
+            time_series (RainFadeTimeSeries, )
+        """
+        m, sigma = lognormal_fade_parameters(
+            rain_attenuation, elevation_angle, station_latitude, rain_probability
+        )
+        return cls(m, sigma, rain_probability, beta)
+
+    @property
+    def m(self) -> float:
+        return self._m
+
+    @property
+    def sigma(self) -> float:
+        return self._sigma
+
+    @property
+    def rain_probability(self) -> float:
+        return self._rain_probability
+
+    @property
+    def beta(self) -> float:
+        return self._beta
+
+    def exceedance(self, attenuation: float) -> float:
+        """
+        Calculate the percentage of time the attenuation is exceeded
+
+        Parameters
+        ----------
+            attenuation (float, dB): attenuation values, scalar or array
+
+        Returns
+        -------
+            percentage (float, %)
+        """
+        with np.errstate(divide="ignore"):
+            return (
+                self.rain_probability
+                * ndtr(-(np.log(attenuation) - self.m) / self.sigma)
+            )[()]
+
+    def generate(
+        self,
+        duration: float,
+        sample_period: float = 1,
+        chunk_size: int = 86400,
+        seed: int = None,
+    ) -> Iterator[np.ndarray]:
+        """
+        Generate the rain attenuation time series in chunks
+
+        Only one chunk is held in memory at a time; the filter state is carried
+        between chunks so the concatenated series is continuous.
+
+        Parameters
+        ----------
+            duration (float, s): the length of the time series
+            sample_period (float, s): the time between samples
+            chunk_size (int, ): the number of samples per chunk
+            seed (int, optional): seed for the random number generator
+
+        Returns
+        -------
+            attenuation (Iterator[np.ndarray], dB): successive chunks of the series
+        """
+        rng = np.random.default_rng(seed)
+        rho = np.exp(-self.beta * sample_period)
+        rain_threshold = -ndtri(self.rain_probability / 100)
+        rain_scale = 100 / self.rain_probability
+
+        n_samples = int(round(duration / sample_period))
+        state = np.array([rho * rng.standard_normal()])
+        for start in range(0, n_samples, chunk_size):
+            noise = rng.standard_normal(min(chunk_size, n_samples - start))
+            x, state = lfilter([np.sqrt(1 - rho**2)], [1, -rho], noise, zi=state)
+
+            attenuation = np.zeros_like(x)
+            raining = x > rain_threshold
+            # map the tail of X above the rain threshold onto the conditional lognormal
+            z = -ndtri(ndtr(-x[raining]) * rain_scale)
+            attenuation[raining] = np.exp(self.m + self.sigma * z)
+            yield attenuation
@@ -0,0 +1,261 @@
+import numpy as np
+import pandas as pd
+
+from link_calculator.conversions import GHz_to_Hz, decibel_to_watt
+
+# DVB-S2 normal frame MODCODs: (levels, code rate, ideal Es/No in dB)
+DVB_S2_MODCODS = [
+    (4, 1 / 4, -2.35),
+    (4, 1 / 3, -1.24),
+    (4, 2 / 5, -0.30),
+    (4, 1 / 2, 1.00),
+    (4, 3 / 5, 2.23),
+    (4, 2 / 3, 3.10),
+    (4, 3 / 4, 4.03),
+    (4, 4 / 5, 4.68),
+    (4, 5 / 6, 5.18),
+    (4, 8 / 9, 6.20),
+    (4, 9 / 10, 6.42),
+    (8, 3 / 5, 5.50),
+    (8, 2 / 3, 6.62),
+    (8, 3 / 4, 7.91),
+    (8, 5 / 6, 9.35),
+    (8, 8 / 9, 10.69),
+    (8, 9 / 10, 10.98),
+    (16, 2 / 3, 8.97),
+    (16, 3 / 4, 10.21),
+    (16, 4 / 5, 11.03),
+    (16, 5 / 6, 11.61),
+    (16, 8 / 9, 12.89),
+    (16, 9 / 10, 13.13),
+    (32, 3 / 4, 12.73),
+    (32, 4 / 5, 13.64),
+    (32, 5 / 6, 14.28),
+    (32, 8 / 9, 15.69),
+    (32, 9 / 10, 16.05),
+]
+
+OUTAGE = -1
+
+
+class AdaptiveCodingModulation:
+    def __init__(
+        self,
+        levels: np.ndarray,
+        coding_rate: np.ndarray,
+        required_es_no: np.ndarray,
+        symbol_rate: float,
+        bandwidth: float = None,
+        margin: float = 0,
+    ):
+        """
+        Select the modulation and coding (MODCOD) with the highest throughput that
+        closes the link at each epoch of a C/N time series
+
+        Parameters
+        ----------
+            levels (np.ndarray, ): the modulation order of each MODCOD
+            coding_rate (np.ndarray, ): the code rate of each MODCOD
+            required_es_no (np.ndarray, ): the Es/No each MODCOD needs to meet its
+                target error rate
+            symbol_rate (float, symbols/s): the symbol rate of the carrier
+            bandwidth (float, GHz, optional): the noise bandwidth of the C/N, defaults
+                to the symbol rate
+            margin (float, dB): the margin held above each MODCOD's required Es/No
+        """
+        self._levels = np.asarray(levels)
+        self._coding_rate = np.asarray(coding_rate, dtype=float)
+        self._required_es_no = np.asarray(required_es_no, dtype=float)
+        self._symbol_rate = symbol_rate
+        self._bandwidth = bandwidth
+        self._margin = margin
+        self._spectral_efficiency = None
+        self._thresholds = None
+        self._best = None
+
+    @classmethod
+    def from_decibel_table(
+        cls,
+        symbol_rate: float,
+        modcods: list = DVB_S2_MODCODS,
+        bandwidth: float = None,
+        margin: float = 0,
+    ) -> "AdaptiveCodingModulation":
+        """
+        Build the engine from a table of (levels, coding rate, required Es/No in dB)
+
+        Parameters
+        ----------
+            symbol_rate (float, symbols/s): the symbol rate of the carrier
+            modcods (list, ): the MODCOD table, defaults to DVB-S2
+            bandwidth (float, GHz, optional): the noise bandwidth of the C/N
+            margin (float, dB): the margin held above each MODCOD's required Es/No
+
+        Returns
+        -------
+            acm (AdaptiveCodingModulation, )
+        """
+        levels, coding_rate, required_es_no = zip(*modcods)
+        return cls(
+            levels,
+            coding_rate,
+            decibel_to_watt(np.array(required_es_no)),
+            symbol_rate,
+            bandwidth,
+            margin,
+        )
+
+    @property
+    def levels(self) -> np.ndarray:
+        return self._levels
+
+    @property
+    def coding_rate(self) -> np.ndarray:
+        return self._coding_rate
+
+    @property
+    def required_es_no(self) -> np.ndarray:
+        return self._required_es_no
+
+    @property
+    def symbol_rate(self) -> float:
+        return self._symbol_rate
+
+    @property
+    def bandwidth(self) -> float:
+        return self._bandwidth
+
+    @property
+    def margin(self) -> float:
+        return self._margin
+
+    @property
+    def spectral_efficiency(self) -> np.ndarray:
+        """
+        Returns
+        -------
+            spectral_efficiency (np.ndarray, bits/symbol): information bits carried
+                by a symbol of each MODCOD
+        """
+        if self._spectral_efficiency is None:
+            self._spectral_efficiency = np.log2(self.levels) * self.coding_rate
+        return self._spectral_efficiency
+
+    def _build_thresholds(self):
+        order = np.argsort(self.required_es_no, kind="stable")
+        self._thresholds = self.required_es_no[order] * decibel_to_watt(self.margin)
+        # the best MODCOD available once the i-th threshold is met
+        efficiency = self.spectral_efficiency[order]
+        running_best = np.maximum.accumulate(efficiency)
+        first_best = np.array(
+            [np.flatnonzero(efficiency == e)[0] for e in running_best]
+        )
+        self._best = order[first_best]
+
+    def es_no(self, carrier_to_noise: np.ndarray) -> np.ndarray:
+        """
+        Convert C/N to Es/No
+
+        Parameters
+        ----------
+            carrier_to_noise (np.ndarray, ): the carrier to noise ratio
+
+        Returns
+        -------
+            es_no (np.ndarray, )
+        """
+        carrier_to_noise = np.asarray(carrier_to_noise)
+        if self.bandwidth is None:
+            return carrier_to_noise
+        return carrier_to_noise * GHz_to_Hz(self.bandwidth) / self.symbol_rate
+
+    def select(self, carrier_to_noise: np.ndarray) -> np.ndarray:
+        """
+        Select the MODCOD used at each epoch
+
+        Parameters
+        ----------
+            carrier_to_noise (np.ndarray, ): the carrier to noise ratio at each epoch
+
+        Returns
+        -------
+            modcod (np.ndarray, ): the index of the selected MODCOD, or OUTAGE when
+                no MODCOD closes the link or the C/N is nan
+        """
+        if self._thresholds is None:
+            self._build_thresholds()
+        es_no = self.es_no(carrier_to_noise)
+        met = np.searchsorted(self._thresholds, es_no, "right") - 1
+        # searchsorted places nan after every threshold
+        met = np.where(np.isnan(es_no), -1, met)
+        return np.where(met >= 0, self._best[met], OUTAGE)
+
+    def throughput(self, carrier_to_noise: np.ndarray) -> np.ndarray:
+        """
+        Calculate the information rate at each epoch
+
+        Parameters
+        ----------
+            carrier_to_noise (np.ndarray, ): the carrier to noise ratio at each epoch
+
+        Returns
+        -------
+            throughput (np.ndarray, bits/s): zero during outages
+        """
+        modcod = self.select(carrier_to_noise)
+        efficiency = np.append(self.spectral_efficiency, 0)
+        return self.symbol_rate * efficiency[modcod]
+
+    def data_volume(
+        self,
+        carrier_to_noise: np.ndarray,
+        sample_period: float,
+        passes: np.ndarray = None,
+    ) -> np.ndarray:
+        """
+        Calculate the data delivered over the time series, or within each pass
+
+        Parameters
+        ----------
+            carrier_to_noise (np.ndarray, ): the carrier to noise ratio at each epoch
+            sample_period (float, s): the time between epochs
+            passes (np.ndarray, optional): a non-negative integer pass label for each
+                epoch
+
+        Returns
+        -------
+            data_volume (np.ndarray, bits): the total, or the volume of each pass
+                indexed by its label
+        """
+        bits = self.throughput(carrier_to_noise) * sample_period
+        if passes is None:
+            return np.sum(bits)
+        return np.bincount(passes, weights=bits)
+
+    def occupancy(self, carrier_to_noise: np.ndarray) -> pd.DataFrame:
+        """
+        Calculate the fraction of epochs spent on each MODCOD
+
+        Parameters
+        ----------
+            carrier_to_noise (np.ndarray, ): the carrier to noise ratio at each epoch
+
+        Returns
+        -------
+            occupancy (pd.DataFrame, ): one row per MODCOD, then a final outage row,
+                with the number and fraction of epochs
+        """
+        modcod = self.select(carrier_to_noise)
+        counts = np.bincount(modcod.ravel() + 1, minlength=len(self.levels) + 1)
+        counts = np.append(counts[1:], counts[0])
+        occupancy = pd.DataFrame(
+            {
+                "levels": np.append(self.levels, 0),
+                "coding_rate": np.append(self.coding_rate, 0),
+                "spectral_efficiency": np.append(self.spectral_efficiency, 0),
+                "epochs": counts,
+                "fraction": counts / max(modcod.size, 1),
+            }
+        )
+        occupancy.index = [*range(len(self.levels)), "outage"]
+        return occupancy
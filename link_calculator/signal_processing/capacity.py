@@ -0,0 +1,159 @@
+import numpy as np
+import pandas as pd
+
+from link_calculator.conversions import GHz_to_Hz
+from link_calculator.signal_processing.modulation import DigitalModulation
+
+
+def shannon_capacity(bandwidth: float, carrier_to_noise: float) -> float:
+    """
+    Calculate the Shannon capacity of an additive white Gaussian noise channel
+
+    All parameters may be scalars or broadcastable numpy arrays, so a
+    bandwidth x C/N surface is bandwidth[:, None] against carrier_to_noise[None, :].
+
+    Parameters
+    ----------
+        bandwidth (float, GHz): the channel bandwidth
+        carrier_to_noise (float, ): the carrier to noise ratio
+
+    Returns
+    -------
+        capacity (float, bits/s)
+    """
+    return (
+        GHz_to_Hz(np.asarray(bandwidth)) * np.log2(1 + np.asarray(carrier_to_noise))
+    )[()]
+
+
+def shannon_spectral_efficiency(carrier_to_noise: float) -> float:
+    """
+    Calculate the largest spectral efficiency an AWGN channel supports
+
+    Parameters
+    ----------
+        carrier_to_noise (float, ): the carrier to noise ratio, scalar or array
+
+    Returns
+    -------
+        spectral_efficiency (float, bits/s/Hz)
+    """
+    return np.log2(1 + np.asarray(carrier_to_noise))[()]
+
+
+def shannon_eb_no(spectral_efficiency: float) -> float:
+    """
+    Calculate the minimum Eb/No for error free transmission at a spectral efficiency
+
+    The limit tends to ln(2) (-1.59 dB) as the spectral efficiency tends to zero.
+
+    Parameters
+    ----------
+        spectral_efficiency (float, bits/s/Hz): scalar or array
+
+    Returns
+    -------
+        eb_no (float, )
+    """
+    spectral_efficiency = np.asarray(spectral_efficiency, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        eb_no = np.expm1(spectral_efficiency * np.log(2)) / spectral_efficiency
+    return np.where(spectral_efficiency == 0, np.log(2), eb_no)[()]
+
+
+def gap_to_shannon(eb_no: float, spectral_efficiency: float) -> float:
+    """
+    Calculate how far an operating point is from the Shannon limit
+
+    Parameters
+    ----------
+        eb_no (float, ): the Eb/No of the operating point, scalar or array
+        spectral_efficiency (float, bits/s/Hz): the spectral efficiency of the
+            operating point, broadcastable with eb_no
+
+    Returns
+    -------
+        gap (float, ): the ratio of the Eb/No to the Shannon limit, below 1 for
+            points that no code can reach
+    """
+    return (np.asarray(eb_no) / shannon_eb_no(spectral_efficiency))[()]
+
+
+def capacity_surface(bandwidth: np.ndarray, carrier_to_noise: np.ndarray) -> dict:
+    """
+    Evaluate capacity and spectral efficiency over a bandwidth x C/N grid
+
+    Parameters
+    ----------
+        bandwidth (np.ndarray, GHz): the bandwidths, one per row
+        carrier_to_noise (np.ndarray, ): the carrier to noise ratios, one per column
+
+    Returns
+    -------
+        surface (dict, ): "capacity" (bits/s), "spectral_efficiency" (bits/s/Hz) and
+            "eb_no", the Eb/No at capacity, each with shape
+            (len(bandwidth), len(carrier_to_noise))
+    """
+    bandwidth = np.asarray(bandwidth, dtype=float)[:, None]
+    carrier_to_noise = np.asarray(carrier_to_noise, dtype=float)[None, :]
+    spectral_efficiency = np.broadcast_to(
+        shannon_spectral_efficiency(carrier_to_noise),
+        (bandwidth.shape[0], carrier_to_noise.shape[1]),
+    )
+    return {
+        "capacity": shannon_capacity(bandwidth, carrier_to_noise),
+        "spectral_efficiency": spectral_efficiency,
+        "eb_no": shannon_eb_no(spectral_efficiency),
+    }
+
+
+def efficiency_map(eb_no: np.ndarray, spectral_efficiency: np.ndarray) -> dict:
+    """
+    Evaluate the gap to Shannon over an Eb/No x spectral efficiency grid
+
+    Parameters
+    ----------
+        eb_no (np.ndarray, ): the Eb/No values, one per row
+        spectral_efficiency (np.ndarray, bits/s/Hz): the spectral efficiencies, one
+            per column
+
+    Returns
+    -------
+        map (dict, ): "gap", the ratio of each Eb/No to the Shannon limit, and
+            "achievable", whether the point lies above the limit, each with shape
+            (len(eb_no), len(spectral_efficiency))
+    """
+    gap = gap_to_shannon(
+        np.asarray(eb_no, dtype=float)[:, None],
+        np.asarray(spectral_efficiency, dtype=float)[None, :],
+    )
+    return {"gap": gap, "achievable": gap >= 1}
+
+
+def operating_points(modulations: list[DigitalModulation]) -> pd.DataFrame:
+    """
+    Place modulation schemes on the Eb/No x spectral efficiency plane
+
+    Parameters
+    ----------
+        modulations (list[DigitalModulation], ): configured schemes with an Eb/No,
+            bit rate and bandwidth
+
+    Returns
+    -------
+        points (pd.DataFrame, ): one row per scheme with its levels, spectral
+            efficiency (bits/s/Hz), Eb/No, the Shannon limit at that efficiency and
+            the gap to it
+    """
+    levels = np.array([m.levels for m in modulations])
+    spectral_efficiency = np.array([m.spectral_efficiency for m in modulations])
+    eb_no = np.array([m.eb_no for m in modulations])
+    return pd.DataFrame(
+        {
+            "levels": levels,
+            "spectral_efficiency": spectral_efficiency,
+            "eb_no": eb_no,
+            "shannon_eb_no": shannon_eb_no(spectral_efficiency),
+            "gap": gap_to_shannon(eb_no, spectral_efficiency),
+        }
+    )
@@ -1,6 +1,8 @@
-from math import comb, factorial, log2, log10
+from typing import Iterable, Iterator
 
+import numpy as np
 import pandas as pd
+from scipy.special import bdtr, bdtrc, gammaln, xlog1py, xlogy
 
 from link_calculator.conversions import watt_to_decibel
 
@@ -11,19 +13,154 @@ class ConvolutionalCode:
         coding_rate: float = None,
         coding_gain: float = None,
         min_distance: float = None,
+        generators: tuple = None,
     ):
         """
         coding_rate (float, bps):
         coding_gain (float, W):
+        generators (tuple, optional): the generator polynomials of a rate 1/n code in
+            octal notation, most significant bit applied to the current input, e.g.
+            (0o171, 0o133) for the K = 7 NASA standard code
         """
         self._coding_rate = coding_rate
         self._coding_gain = coding_gain
         self._min_distance = min_distance
+        self._generators = generators
+        self._constraint_length = None
+        self._trellis = None
 
     @property
     def coding_rate(self) -> float:
+        if self._coding_rate is None:
+            if self._generators is not None:
+                self._coding_rate = 1 / len(self._generators)
         return self._coding_rate
 
+    @property
+    def generators(self) -> tuple:
+        return self._generators
+
+    @property
+    def constraint_length(self) -> int:
+        if self._constraint_length is None:
+            if self._generators is not None:
+                self._constraint_length = max(g.bit_length() for g in self.generators)
+        return self._constraint_length
+
+    @property
+    def n_states(self) -> int:
+        return 2 ** (self.constraint_length - 1)
+
+    def _generator_taps(self) -> np.ndarray:
+        # taps[i, j] is set when generator i applies the input delayed by j bits
+        delays = np.arange(self.constraint_length)
+        generators = np.array(self.generators)[:, None]
+        return (generators >> (self.constraint_length - 1 - delays)) & 1
+
+    def _build_trellis(self):
+        """
+        Tabulate, for every state and each of its two predecessors, the predecessor
+        state and the index of the branch's output bit pattern
+        """
+        memory = self.constraint_length - 1
+        states = np.arange(self.n_states)
+        # the state holds the previous K - 1 inputs, the latest in the top bit
+        predecessors = ((states[:, None] << 1) & (self.n_states - 1)) | np.arange(2)
+        registers = (states[:, None] >> (memory - 1) << memory) | predecessors
+        register_bits = (registers[..., None] >> np.arange(memory + 1)) & 1
+        parity = np.zeros(registers.shape, dtype=int)
+        for taps in self._generator_taps():
+            # the top register bit is the current input, matching taps[0]
+            outputs = np.sum(register_bits * taps[::-1], axis=-1) & 1
+            parity = (parity << 1) | outputs
+        self._trellis = predecessors, parity
+
+    def encode(self, bits: np.ndarray) -> np.ndarray:
+        """
+        Encode blocks of bits, terminating each block with K - 1 zeros so the encoder
+        returns to the all zero state
+
+        Parameters
+        ----------
+            bits (np.ndarray, ): the information bits, with shape (..., block_size)
+
+        Returns
+        -------
+            coded_bits (np.ndarray, ): shape (..., (block_size + K - 1) * n), the
+                n output bits of each step interleaved
+        """
+        bits = np.asarray(bits, dtype=np.uint8)
+        memory = self.constraint_length - 1
+        padded = np.concatenate(
+            [
+                np.zeros(bits.shape[:-1] + (memory,), np.uint8),
+                bits,
+                np.zeros(bits.shape[:-1] + (memory,), np.uint8),
+            ],
+            axis=-1,
+        )
+        n_steps = bits.shape[-1] + memory
+        coded = np.zeros(bits.shape[:-1] + (n_steps, len(self.generators)), np.uint8)
+        for i, taps in enumerate(self._generator_taps()):
+            for delay in np.flatnonzero(taps):
+                coded[..., i] ^= padded[..., memory - delay : memory - delay + n_steps]
+        return coded.reshape(bits.shape[:-1] + (-1,))
+
+    def decode(self, received: np.ndarray, soft: bool = False) -> np.ndarray:
+        """
+        Decode terminated blocks with the Viterbi algorithm
+
+        The add-compare-select step is vectorized across the trellis states and a
+        batch of blocks, so many blocks are decoded together.
+
+        Parameters
+        ----------
+            received (np.ndarray, ): shape (..., n_steps * n). Hard decision bits
+                (0 or 1), or soft decision BPSK samples where +1 is a 0 bit and -1 a
+                1 bit
+            soft (bool, ): whether the received values are soft decisions
+
+        Returns
+        -------
+            bits (np.ndarray, ): the decoded information bits, with shape
+                (..., n_steps - K + 1)
+        """
+        if self._trellis is None:
+            self._build_trellis()
+        predecessors, parity = self._trellis
+        n_outputs = len(self.generators)
+        memory = self.constraint_length - 1
+
+        received = np.asarray(received, dtype=float)
+        batch_shape = received.shape[:-1]
+        samples = received.reshape(-1, received.shape[-1] // n_outputs, n_outputs)
+        if not soft:
+            samples = 1 - 2 * samples
+        n_blocks, n_steps, _ = samples.shape
+
+        # correlation of the received samples with every output bit pattern
+        patterns = np.arange(2**n_outputs)[:, None] >> np.arange(n_outputs)[::-1] & 1
+        branch_metrics = samples @ (1 - 2 * patterns).T
+
+        path_metrics = np.full((n_blocks, self.n_states), -np.inf)
+        path_metrics[:, 0] = 0
+        decisions = np.empty((n_steps, n_blocks, self.n_states), dtype=np.uint8)
+        for step in range(n_steps):
+            candidates = (
+                path_metrics[:, predecessors] + branch_metrics[:, step][:, parity]
+            )
+            decisions[step] = candidates[..., 1] > candidates[..., 0]
+            path_metrics = np.maximum(candidates[..., 0], candidates[..., 1])
+
+        # trace back from the terminating all zero state
+        bits = np.empty((n_blocks, n_steps), dtype=np.uint8)
+        state = np.zeros(n_blocks, dtype=int)
+        blocks = np.arange(n_blocks)
+        for step in range(n_steps - 1, -1, -1):
+            bits[:, step] = state >> (memory - 1)
+            state = predecessors[state, decisions[step, blocks, state]]
+        return bits[:, : n_steps - memory].reshape(batch_shape + (-1,))
+
     @property
     def coding_gain(self) -> float:
         if self._coding_gain is None:
@@ -73,46 +210,53 @@ def information_content(message_probability: float) -> float:
 
     Parameters
     ----------
-        message_probability (float, ): the probability  of occurrence of the message
+        message_probability (float, ): the probability  of occurrence of the message,
+            scalar or array
 
     return
       information (float, bits)
     """
-    return log2(1 / message_probability)
+    return (-np.log2(message_probability))[()]
 
 
-def total_information(message_probabilities: list[float]) -> float:
+def total_information(message_probabilities: np.ndarray) -> float:
     """
     Total information in a set of M messages
 
     Parameters
     ----------
-      message_probabilities (list, ): proability of occurence of a set of messages
+      message_probabilities (np.ndarray, ): proability of occurence of a set of
+          messages, along the last axis
     Return
     ------
         total_info (float, bits)
     """
-    M = len(message_probabilities)
-    return M * sum([prob * information_content(prob) for prob in message_probabilities])
+    message_probabilities = np.asarray(message_probabilities, dtype=float)
+    M = message_probabilities.shape[-1]
+    return M * entropy(message_probabilities)
 
 
-def entropy(message_probabilities: list[float]) -> float:
+def entropy(message_probabilities: np.ndarray) -> float:
     """
     Average information content per message
 
+    Messages with zero probability contribute no information.
+
     Parameters
     ----------
-      message_probabilities (list, ): proability of occurence of a set of messages
+      message_probabilities (np.ndarray, ): proability of occurence of a set of
+          messages, along the last axis
     Return
     ------
         entropy (float, bits per message)
     """
-    M = len(message_probabilities)
-    return total_information(message_probabilities) / M
+    message_probabilities = np.asarray(message_probabilities, dtype=float)
+    information = -xlogy(message_probabilities, message_probabilities) / np.log(2)
+    return np.sum(information, axis=-1)[()]
 
 
 def average_information_rate(
-    n_transmitted: int, message_probabilities: list[float]
+    n_transmitted: int, message_probabilities: np.ndarray
 ) -> float:
     """
     Average information rate per second
@@ -120,7 +264,8 @@ def average_information_rate(
     Parameters
     ----------
       n_transmitted (int, ): number of messages send per second
-      message_probabilities (list, ): proability of occurence of a set of messages
+      message_probabilities (np.ndarray, ): proability of occurence of a set of
+          messages, along the last axis
     Return
     ------
         average information rate (float, bits per second)
@@ -128,9 +273,232 @@ def average_information_rate(
     return n_transmitted * entropy(message_probabilities)
 
 
-def error_probability(block_size, n_errors, error_probability) -> float:
-    return (
-        comb(block_size, n_errors)
-        * (error_probability**n_errors)
-        * (1 - error_probability) ** (block_size - n_errors)
+class EntropyEstimator:
+    def __init__(self, n_symbols: int = 256):
+        """
+        Estimate the entropy of a source from a stream of symbols, one chunk at a
+        time, so arbitrarily long captures never have to be held in memory
+
+        Parameters
+        ----------
+            n_symbols (int, ): the size of the source alphabet, 256 for bytes
+        """
+        self._n_symbols = n_symbols
+        self._counts = np.zeros(n_symbols, dtype=np.int64)
+
+    @classmethod
+    def from_file(
+        cls,
+        path: str,
+        chunk_size: int = 2**24,
+        dtype: str = "uint8",
+        n_symbols: int = None,
+    ) -> "EntropyEstimator":
+        """
+        Estimate the entropy of the symbols stored in a binary file
+
+        Parameters
+        ----------
+            path (str, ): the file to read
+            chunk_size (int, ): the number of symbols read at a time
+            dtype (str, ): the unsigned integer type of each symbol, uint8 for bytes
+            n_symbols (int, optional): the size of the source alphabet, defaults to
+                every value of dtype, which must then be uint8 or uint16
+
+        Returns
+        -------
+            estimator (EntropyEstimator, )
+        """
+        dtype = np.dtype(dtype)
+        if dtype.kind != "u":
+            raise ValueError("Symbols must be stored as unsigned integers")
+        if n_symbols is None:
+            if dtype.itemsize > 2:
+                raise ValueError(
+                    "n_symbols must be given for symbols wider than 16 bits"
+                )
+            n_symbols = 2 ** (8 * dtype.itemsize)
+        estimator = cls(n_symbols)
+        with open(path, "rb") as f:
+            while True:
+                chunk = np.fromfile(f, dtype=dtype, count=chunk_size)
+                if chunk.size == 0:
+                    break
+                estimator.update(chunk)
+        return estimator
+
+    @property
+    def n_symbols(self) -> int:
+        return self._n_symbols
+
+    @property
+    def counts(self) -> np.ndarray:
+        return self._counts
+
+    @property
+    def n_observed(self) -> int:
+        return int(np.sum(self._counts))
+
+    @property
+    def probabilities(self) -> np.ndarray:
+        return self._counts / max(self.n_observed, 1)
+
+    @property
+    def entropy(self) -> float:
+        """
+        Returns
+        -------
+            entropy (float, bits per symbol): the empirical entropy of the symbols
+                observed so far
+        """
+        return entropy(self.probabilities)
+
+    def information_rate(self, symbol_rate: float) -> float:
+        """
+        Average information rate of the source
+
+        Parameters
+        ----------
+            symbol_rate (float, symbols/s): number of symbols sent per second
+
+        Returns
+        -------
+            information_rate (float, bits per second)
+        """
+        return average_information_rate(symbol_rate, self.probabilities)
+
+    def update(self, symbols) -> float:
+        """
+        Add a chunk of symbols to the counts
+
+        Parameters
+        ----------
+            symbols (np.ndarray | bytes, ): integer symbols in [0, n_symbols), or raw
+                bytes
+
+        Returns
+        -------
+            entropy (float, bits per symbol): the running entropy estimate
+        """
+        if isinstance(symbols, (bytes, bytearray, memoryview)):
+            symbols = np.frombuffer(symbols, dtype=np.uint8)
+        symbols = np.asarray(symbols).ravel()
+        if symbols.size and (symbols.min() < 0 or symbols.max() >= self.n_symbols):
+            raise ValueError(f"Symbols must be in [0, {self.n_symbols})")
+        self._counts += np.bincount(symbols, minlength=self.n_symbols)
+        return self.entropy
+
+    def consume(self, chunks: Iterable) -> Iterator[float]:
+        """
+        Update the estimate from an iterable of chunks, e.g. a generator or an open
+        binary file
+
+        Parameters
+        ----------
+            chunks (Iterable, ): successive chunks of symbols or bytes
+
+        Returns
+        -------
+            entropy (Iterator[float], bits per symbol): the running estimate after
+                each chunk
+        """
+        for chunk in chunks:
+            yield self.update(chunk)
+
+
+def error_probability(
+    block_size: int, n_errors: int, error_probability: float
+) -> float:
+    """
+    Probability of exactly n_errors bit errors in a block
+
+    Evaluated in the log domain with log-gamma, so it is stable for large blocks.
+    All parameters may be scalars or broadcastable numpy arrays.
+
+    Parameters
+    ----------
+        block_size (int, ): the number of bits in the block
+        n_errors (int, ): the number of bit errors
+        error_probability (float, ): the bit error rate
+
+    Return
+    ------
+        probability (float, )
+    """
+    block_size = np.asarray(block_size)
+    n_errors = np.asarray(n_errors)
+    log_combinations = (
+        gammaln(block_size + 1)
+        - gammaln(n_errors + 1)
+        - gammaln(block_size - n_errors + 1)
     )
+    return np.exp(
+        log_combinations
+        + xlogy(n_errors, error_probability)
+        + xlog1py(block_size - n_errors, -np.asarray(error_probability))
+    )[()]
+
+
+def correct_block_probability(
+    block_size: int, correctable: int, error_probability: float
+) -> float:
+    """
+    Probability of at most `correctable` bit errors in a block, i.e. the probability
+    a t-error correcting code decodes the block correctly
+
+    The binomial sum is evaluated as a regularized incomplete beta function, so it is
+    stable for large blocks. All parameters may be scalars or broadcastable numpy
+    arrays.
+
+    Parameters
+    ----------
+        block_size (int, ): the number of bits in the block
+        correctable (int, ): the number of bit errors the code corrects
+        error_probability (float, ): the bit error rate
+
+    Return
+    ------
+        probability (float, )
+    """
+    return bdtr(correctable, block_size, error_probability)[()]
+
+
+def block_error_rate(
+    block_size: int, correctable: int, error_probability: float
+) -> float:
+    """
+    Probability of more than `correctable` bit errors in a block, i.e. the block
+    error rate of a t-error correcting code
+
+    Computed directly from the upper tail rather than as 1 - P(correct), so very
+    small block error rates keep their precision.
+
+    Parameters
+    ----------
+        block_size (int, ): the number of bits in the block
+        correctable (int, ): the number of bit errors the code corrects
+        error_probability (float, ): the bit error rate
+
+    Return
+    ------
+        block_error_rate (float, )
+    """
+    return bdtrc(correctable, block_size, error_probability)[()]
+
+
+def packet_error_rate(packet_size: int, error_probability: float) -> float:
+    """
+    Probability that an uncoded packet contains at least one bit error
+
+    Parameters
+    ----------
+        packet_size (int, bits): the number of bits in the packet
+        error_probability (float, ): the bit error rate, scalar or array
+
+    Return
+    ------
+        packet_error_rate (float, )
+    """
+    return -np.expm1(
+        np.asarray(packet_size) * np.log1p(-np.asarray(error_probability))
+    )[()]
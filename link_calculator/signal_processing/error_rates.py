@@ -0,0 +1,458 @@
+from typing import Callable
+
+import numpy as np
+from scipy.special import erfc, erfcinv
+
+
+def psk_symbol_error_probability(
+    es_no: float, levels: int, coding_gain: float = 1
+) -> float:
+    """
+    Calculate the probability of a symbol error for M-ary phase shift keying in
+    additive white Gaussian noise
+
+    BPSK uses the exact expression 0.5 erfc(sqrt(Es/No)); higher orders use the
+    nearest neighbour approximation erfc(sqrt(Es/No) sin(pi/M)).
+
+    Parameters
+    ----------
+        es_no (float, ): the energy per symbol to noise power density ratio, scalar
+            or array
+        levels (int, ): the number of symbols M, scalar or array broadcastable with
+            es_no
+        coding_gain (float, ): the improvement in Es/No from coding, 1 for an
+            uncoded link
+
+    Returns
+    -------
+        noise_probability (float, ): the symbol error probability
+    """
+    es_no = np.asarray(es_no) * coding_gain
+    levels = np.asarray(levels)
+    return np.where(
+        levels == 2,
+        0.5 * erfc(np.sqrt(es_no)),
+        erfc(np.sqrt(es_no) * np.sin(np.pi / levels)),
+    )[()]
+
+
+def psk_bit_error_rate(eb_no: float, levels: int, coding_gain: float = 1) -> float:
+    """
+    Calculate the bit error rate of Gray coded M-ary phase shift keying in additive
+    white Gaussian noise
+
+    Parameters
+    ----------
+        eb_no (float, ): the energy per bit to noise power density ratio, scalar or
+            array
+        levels (int, ): the number of symbols M, scalar or array broadcastable with
+            eb_no
+        coding_gain (float, ): the improvement in Eb/No from coding, 1 for an
+            uncoded link
+
+    Returns
+    -------
+        bit_error_rate (float, )
+    """
+    bits_per_symbol = np.log2(levels)
+    return (
+        psk_symbol_error_probability(
+            np.asarray(eb_no) * bits_per_symbol, levels, coding_gain
+        )
+        / bits_per_symbol
+    )[()]
+
+
+def psk_eb_no(bit_error_rate: float, levels: int, coding_gain: float = 1) -> float:
+    """
+    Calculate the Eb/No required for M-ary phase shift keying to reach a bit error
+    rate, the exact inverse of psk_bit_error_rate
+
+    Parameters
+    ----------
+        bit_error_rate (float, ): the target bit error rate, scalar or array
+        levels (int, ): the number of symbols M
+        coding_gain (float, ): the improvement in Eb/No from coding, 1 for an
+            uncoded link
+
+    Returns
+    -------
+        eb_no (float, ): the required energy per bit to noise power density ratio
+    """
+    bit_error_rate = np.asarray(bit_error_rate)
+    levels = np.asarray(levels)
+    bits_per_symbol = np.log2(levels)
+    symbol_error_probability = bit_error_rate * bits_per_symbol
+    root_es_no = np.where(
+        levels == 2,
+        erfcinv(2 * symbol_error_probability),
+        erfcinv(symbol_error_probability) / np.sin(np.pi / levels),
+    )
+    return (root_es_no**2 / bits_per_symbol / coding_gain)[()]
+
+
+def qam_symbol_error_probability(
+    es_no: float, levels: int, coding_gain: float = 1
+) -> float:
+    """
+    Calculate the probability of a symbol error for M-ary quadrature amplitude
+    modulation in additive white Gaussian noise
+
+    Exact for square constellations (M = 4, 16, 64, ...); for other orders the same
+    expression is a close approximation.
+
+    Parameters
+    ----------
+        es_no (float, ): the energy per symbol to noise power density ratio, scalar
+            or array
+        levels (int, ): the number of symbols M, scalar or array broadcastable with
+            es_no
+        coding_gain (float, ): the improvement in Es/No from coding, 1 for an
+            uncoded link
+
+    Returns
+    -------
+        noise_probability (float, ): the symbol error probability
+    """
+    es_no = np.asarray(es_no) * coding_gain
+    levels = np.asarray(levels)
+    # error probability of each of the two sqrt(M)-ary amplitude rails
+    rail = (1 - 1 / np.sqrt(levels)) * erfc(np.sqrt(1.5 * es_no / (levels - 1)))
+    return (1 - (1 - rail) ** 2)[()]
+
+
+def qam_bit_error_rate(eb_no: float, levels: int, coding_gain: float = 1) -> float:
+    """
+    Calculate the bit error rate of Gray coded M-ary quadrature amplitude modulation
+    in additive white Gaussian noise
+
+    Parameters
+    ----------
+        eb_no (float, ): the energy per bit to noise power density ratio, scalar or
+            array
+        levels (int, ): the number of symbols M, scalar or array broadcastable with
+            eb_no
+        coding_gain (float, ): the improvement in Eb/No from coding, 1 for an
+            uncoded link
+
+    Returns
+    -------
+        bit_error_rate (float, )
+    """
+    bits_per_symbol = np.log2(levels)
+    return (
+        qam_symbol_error_probability(
+            np.asarray(eb_no) * bits_per_symbol, levels, coding_gain
+        )
+        / bits_per_symbol
+    )[()]
+
+
+def qam_eb_no(bit_error_rate: float, levels: int, coding_gain: float = 1) -> float:
+    """
+    Calculate the Eb/No required for M-ary quadrature amplitude modulation to reach a
+    bit error rate, the exact inverse of qam_bit_error_rate
+
+    Parameters
+    ----------
+        bit_error_rate (float, ): the target bit error rate, scalar or array
+        levels (int, ): the number of symbols M
+        coding_gain (float, ): the improvement in Eb/No from coding, 1 for an
+            uncoded link
+
+    Returns
+    -------
+        eb_no (float, ): the required energy per bit to noise power density ratio
+    """
+    levels = np.asarray(levels)
+    bits_per_symbol = np.log2(levels)
+    symbol_error_probability = np.asarray(bit_error_rate) * bits_per_symbol
+    rail = -np.expm1(0.5 * np.log1p(-symbol_error_probability))
+    root = erfcinv(rail / (1 - 1 / np.sqrt(levels)))
+    return (root**2 * (levels - 1) / 1.5 / bits_per_symbol / coding_gain)[()]
+
+
+# DVB-S2 APSK rings (EN 302 307 section 5.4.3 and 5.4.4): the number of points on
+# each ring, the ring radii relative to the innermost ring and the phase of the
+# first point on each ring. The 32APSK outer ring starts on the real axis, every
+# other ring half a point spacing off it
+APSK_RINGS = {
+    16: ((4, 12), (1, 2.7), (np.pi / 4, np.pi / 12)),
+    32: ((4, 12, 16), (1, 2.84, 5.27), (np.pi / 4, np.pi / 12, 0)),
+}
+
+
+def apsk_constellation(
+    ring_sizes: tuple, ring_ratios: tuple, ring_phases: tuple = None
+) -> np.ndarray:
+    """
+    Build an amplitude and phase shift keying constellation of concentric rings,
+    normalised to unit average symbol energy
+
+    Parameters
+    ----------
+        ring_sizes (tuple, ): the number of points on each ring, innermost first
+        ring_ratios (tuple, ): the radius of each ring relative to the innermost
+        ring_phases (tuple, rad, optional): the phase of the first point on each
+            ring, defaults to half the point spacing of each ring
+
+    Returns
+    -------
+        constellation (np.ndarray, ): the complex symbol positions
+    """
+    if ring_phases is None:
+        ring_phases = [np.pi / size for size in ring_sizes]
+    points = np.concatenate(
+        [
+            ratio * np.exp(1j * (phase + 2 * np.pi * np.arange(size) / size))
+            for size, ratio, phase in zip(ring_sizes, ring_ratios, ring_phases)
+        ]
+    )
+    return points / np.sqrt(np.mean(np.abs(points) ** 2))
+
+
+def _union_bound_terms(constellation: np.ndarray, reach: float = 2) -> tuple:
+    """
+    Group the pairwise distances of a unit energy constellation that lie within
+    `reach` minimum distances, with the average number of neighbours at each
+    """
+    distances = np.abs(constellation[:, None] - constellation[None, :])
+    distances = distances[~np.eye(len(constellation), dtype=bool)]
+    distances = np.round(distances[distances <= reach * distances.min()], 9)
+    unique, counts = np.unique(distances, return_counts=True)
+    return unique, counts / len(constellation)
+
+
+def apsk_symbol_error_probability(
+    es_no: float,
+    levels: int,
+    coding_gain: float = 1,
+    ring_sizes: tuple = None,
+    ring_ratios: tuple = None,
+    ring_phases: tuple = None,
+) -> float:
+    """
+    Calculate the probability of a symbol error for amplitude and phase shift keying
+    in additive white Gaussian noise
+
+    The probability is the union bound over neighbouring symbols, which is tight at
+    the error rates links operate at.
+
+    Parameters
+    ----------
+        es_no (float, ): the energy per symbol to noise power density ratio, scalar
+            or array
+        levels (int, ): the number of symbols M, 16 or 32 unless rings are given
+        coding_gain (float, ): the improvement in Es/No from coding, 1 for an
+            uncoded link
+        ring_sizes (tuple, optional): the number of points on each ring, defaults to
+            the DVB-S2 constellation
+        ring_ratios (tuple, optional): the radius of each ring relative to the
+            innermost, defaults to the DVB-S2 constellation
+        ring_phases (tuple, rad, optional): the phase of the first point on each
+            ring, see apsk_constellation
+
+    Returns
+    -------
+        noise_probability (float, ): the symbol error probability
+    """
+    if ring_sizes is None:
+        ring_sizes, ring_ratios, ring_phases = APSK_RINGS[int(levels)]
+    if sum(ring_sizes) != levels:
+        raise ValueError("The rings must hold one point per symbol")
+    distances, neighbours = _union_bound_terms(
+        apsk_constellation(ring_sizes, ring_ratios, ring_phases)
+    )
+    es_no = np.asarray(es_no)[..., None] * coding_gain
+    pairwise = 0.5 * erfc(distances * np.sqrt(es_no) / 2)
+    return np.minimum(np.sum(neighbours * pairwise, axis=-1), 1 - 1 / levels)[()]
+
+
+def apsk_bit_error_rate(
+    eb_no: float,
+    levels: int,
+    coding_gain: float = 1,
+    ring_sizes: tuple = None,
+    ring_ratios: tuple = None,
+    ring_phases: tuple = None,
+) -> float:
+    """
+    Calculate the bit error rate of Gray coded amplitude and phase shift keying in
+    additive white Gaussian noise
+
+    Parameters
+    ----------
+        eb_no (float, ): the energy per bit to noise power density ratio, scalar or
+            array
+        levels (int, ): the number of symbols M, 16 or 32 unless rings are given
+        coding_gain (float, ): the improvement in Eb/No from coding, 1 for an
+            uncoded link
+        ring_sizes (tuple, optional): the number of points on each ring
+        ring_ratios (tuple, optional): the radius of each ring relative to the
+            innermost
+        ring_phases (tuple, rad, optional): the phase of the first point on each
+            ring
+
+    Returns
+    -------
+        bit_error_rate (float, )
+    """
+    bits_per_symbol = np.log2(levels)
+    return (
+        apsk_symbol_error_probability(
+            np.asarray(eb_no) * bits_per_symbol,
+            levels,
+            coding_gain,
+            ring_sizes,
+            ring_ratios,
+            ring_phases,
+        )
+        / bits_per_symbol
+    )[()]
+
+
+def apsk_eb_no(
+    bit_error_rate: float,
+    levels: int,
+    coding_gain: float = 1,
+    ring_sizes: tuple = None,
+    ring_ratios: tuple = None,
+    ring_phases: tuple = None,
+) -> float:
+    """
+    Calculate the Eb/No required for amplitude and phase shift keying to reach a bit
+    error rate, inverting apsk_bit_error_rate by bisection
+
+    Parameters
+    ----------
+        bit_error_rate (float, ): the target bit error rate, scalar or array
+        levels (int, ): the number of symbols M, 16 or 32 unless rings are given
+        coding_gain (float, ): the improvement in Eb/No from coding, 1 for an
+            uncoded link
+        ring_sizes (tuple, optional): the number of points on each ring
+        ring_ratios (tuple, optional): the radius of each ring relative to the
+            innermost
+        ring_phases (tuple, rad, optional): the phase of the first point on each
+            ring
+
+    Returns
+    -------
+        eb_no (float, ): the required energy per bit to noise power density ratio
+    """
+    log_target = np.log(np.asarray(bit_error_rate, dtype=float))
+    lower = np.full(log_target.shape, -20.0)  # dB
+    upper = np.full(log_target.shape, 80.0)  # dB
+    # bisect in dB down to well below floating point resolution of the result
+    for _ in range(60):
+        middle = 0.5 * (lower + upper)
+        with np.errstate(divide="ignore"):
+            log_ber = np.log(
+                apsk_bit_error_rate(
+                    10 ** (middle / 10),
+                    levels,
+                    coding_gain,
+                    ring_sizes,
+                    ring_ratios,
+                    ring_phases,
+                )
+            )
+        above = log_ber > log_target
+        lower = np.where(above, middle, lower)
+        upper = np.where(above, upper, middle)
+    return (10 ** (0.5 * (lower + upper) / 10))[()]
+
+
+class InverseErrorRateTable:
+    def __init__(
+        self,
+        bit_error_rate: Callable = psk_bit_error_rate,
+        exact_eb_no: Callable = psk_eb_no,
+        levels: tuple = (2, 4, 8, 16, 32),
+        eb_no_range: tuple = (-2, 40),
+        step: float = 0.05,
+        min_bit_error_rate: float = 1e-300,
+    ):
+        """
+        A precomputed lookup of the Eb/No required to reach a bit error rate, for
+        every modulation order of a family
+
+        The forward error rate curve is tabulated on a regular Eb/No grid (dB) and
+        inverted by monotone linear interpolation of Eb/No against log10(BER). The
+        largest interpolation error, measured at the midpoint of every table interval
+        when the table is built, is reported as the accuracy. Queries outside the
+        tabulated range fall back to the exact inverse.
+
+        Parameters
+        ----------
+            bit_error_rate (Callable, ): the family's forward function,
+                bit_error_rate(eb_no, levels)
+            exact_eb_no (Callable, ): the family's exact inverse,
+                exact_eb_no(bit_error_rate, levels)
+            levels (tuple, ): the modulation orders to tabulate
+            eb_no_range (tuple, dB): the range of Eb/No to tabulate
+            step (float, dB): the spacing of the table
+            min_bit_error_rate (float, ): the smallest bit error rate tabulated
+        """
+        self._exact_eb_no = exact_eb_no
+        self._tables = {}
+        self._accuracy = 0.0
+
+        eb_no_db = np.arange(eb_no_range[0], eb_no_range[1] + step / 2, step)
+        for m in levels:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                log_ber = np.log10(bit_error_rate(10 ** (eb_no_db / 10), m))
+                # keep the strictly decreasing part of the curve above underflow
+                valid = (log_ber > np.log10(min_bit_error_rate)) & np.append(
+                    np.diff(log_ber) < 0, True
+                )
+            x, y = log_ber[valid][::-1], eb_no_db[valid][::-1]
+            self._tables[m] = (x, y)
+
+            midpoints = y[:-1] + np.diff(y) / 2
+            midpoint_log_ber = np.log10(bit_error_rate(10 ** (midpoints / 10), m))
+            error = np.abs(np.interp(midpoint_log_ber, x, y) - midpoints)
+            self._accuracy = max(self._accuracy, float(np.max(error)))
+
+    @property
+    def levels(self) -> list:
+        return list(self._tables)
+
+    @property
+    def accuracy(self) -> float:
+        """
+        Returns
+        -------
+            accuracy (float, dB): the largest Eb/No error of an in-table lookup
+        """
+        return self._accuracy
+
+    def eb_no(self, bit_error_rate: float, levels: int) -> float:
+        """
+        Look up the Eb/No required to reach a bit error rate
+
+        Parameters
+        ----------
+            bit_error_rate (float, ): the target bit error rate, scalar or array
+            levels (int, ): the modulation order, scalar or array broadcastable with
+                bit_error_rate
+
+        Returns
+        -------
+            eb_no (float, ): the required energy per bit to noise power density ratio
+        """
+        bit_error_rate, levels = np.broadcast_arrays(
+            np.asarray(bit_error_rate, dtype=float), levels
+        )
+        eb_no = np.full(bit_error_rate.shape, np.nan)
+        log_ber = np.log10(bit_error_rate)
+
+        for m in np.unique(levels):
+            selected = levels == m
+            if m in self._tables:
+                x, y = self._tables[m]
+                in_table = selected & (log_ber >= x[0]) & (log_ber <= x[-1])
+                eb_no[in_table] = 10 ** (np.interp(log_ber[in_table], x, y) / 10)
+                selected = selected & ~in_table
+            if np.any(selected):
+                eb_no[selected] = self._exact_eb_no(bit_error_rate[selected], m)
+        return eb_no[()]
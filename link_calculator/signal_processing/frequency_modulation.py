@@ -4,6 +4,18 @@ from link_calculator.signal_processing.modulation import Modulation
 
 
 class FrequencyModulation(Modulation):
+    __slots__ = (
+        "_baseband_bandwidth",
+        "_signal_to_noise",
+        "_deviation_ratio",
+        "_frequency_deviation",
+        "_deemphasis_improvement",
+        "_preemphasis_improvement",
+        "_threshold",
+        "_link_margin",
+        "_threshold_signal_to_noise",
+    )
+
     def __init__(
         self,
         bandwidth: float = None,
@@ -35,6 +47,47 @@ class FrequencyModulation(Modulation):
         self._preemphasis_improvement = preemphasis_improvement
         self._threshold = threshold
         self._link_margin = link_margin
+        self._threshold_signal_to_noise = None
+
+    @classmethod
+    def grid(
+        cls,
+        baseband_bandwidth: np.ndarray,
+        frequency_deviation: np.ndarray,
+        carrier_to_noise: np.ndarray,
+        **kwargs,
+    ) -> "FrequencyModulation":
+        """
+        Build a FrequencyModulation evaluated over every combination of baseband
+        bandwidth, frequency deviation and C/N
+
+        Each input is placed on its own axis, so every derived property is a
+        surface with shape (len(baseband_bandwidth), len(frequency_deviation),
+        len(carrier_to_noise)).
+
+        Parameters
+        ----------
+            baseband_bandwidth (np.ndarray, GHz): the baseband bandwidths
+            frequency_deviation (np.ndarray, GHz): the peak frequency deviations
+            carrier_to_noise (np.ndarray, W): the carrier to noise ratios in the
+                Carson bandwidth
+            kwargs: the remaining FrequencyModulation parameters
+
+        Returns
+        -------
+            fm (FrequencyModulation, )
+        """
+        baseband_bandwidth, frequency_deviation, carrier_to_noise = np.ix_(
+            np.atleast_1d(baseband_bandwidth),
+            np.atleast_1d(frequency_deviation),
+            np.atleast_1d(carrier_to_noise),
+        )
+        return cls(
+            baseband_bandwidth=baseband_bandwidth,
+            frequency_deviation=frequency_deviation,
+            carrier_to_noise=carrier_to_noise,
+            **kwargs,
+        )
 
     @property
     def bandwidth(self) -> float:
@@ -67,6 +120,31 @@ class FrequencyModulation(Modulation):
             )
         return self._signal_to_noise
 
+    @property
+    def threshold_signal_to_noise(self) -> float:
+        """
+        The output S/N including the click noise that appears as the C/N approaches
+        the FM threshold, reproducing the threshold knee (Taub and Schilling)
+
+        Well above threshold this equals signal_to_noise; below it the S/N collapses.
+
+        Returns
+        -------
+            signal_to_noise (float, W)
+        """
+        if self._threshold_signal_to_noise is None:
+            baseband_carrier_to_noise = (
+                self.carrier_to_noise * self.bandwidth / self.baseband_bandwidth
+            )
+            click_noise = (
+                (12 / np.pi)
+                * self.deviation_ratio
+                * baseband_carrier_to_noise
+                * np.exp(-self.carrier_to_noise)
+            )
+            self._threshold_signal_to_noise = self.signal_to_noise / (1 + click_noise)
+        return self._threshold_signal_to_noise
+
     @property
     def link_margin(self) -> float:
         if self._link_margin is None:
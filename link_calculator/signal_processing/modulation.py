@@ -1,7 +1,6 @@
-from math import erfc, log2, log10, pi, sin, sqrt
+from math import log2, log10
 
 import pandas as pd
-from scipy.special import erfcinv
 
 from link_calculator.conversions import (
     GHz_to_Hz,
@@ -12,9 +11,24 @@ from link_calculator.conversions import (
     watt_to_decibel,
 )
 from link_calculator.signal_processing.coding import ConvolutionalCode
+from link_calculator.signal_processing.error_rates import (
+    apsk_eb_no,
+    apsk_symbol_error_probability,
+    psk_bit_error_rate,
+    psk_eb_no,
+    psk_symbol_error_probability,
+    qam_eb_no,
+    qam_symbol_error_probability,
+)
 
 
 class Waveform:
+    __slots__ = (
+        "frequency",
+        "amplitude",
+        "phase",
+    )
+
     def __init__(
         self, frequency: float = None, amplitude: float = None, phase: float = None
     ):
@@ -24,6 +38,13 @@ class Waveform:
 
 
 class Modulation:
+    # sweeps hold many instances, so subclasses declare their attributes in
+    # __slots__ rather than carrying a per-instance __dict__
+    __slots__ = (
+        "_bandwidth",
+        "_carrier_to_noise",
+    )
+
     def __init__(
         self,
         bandwidth: float = None,
@@ -51,7 +72,40 @@ class Modulation:
         )
 
 
-class MPhaseShiftKeying(Modulation):
+class DigitalModulation(Modulation):
+    # the link parameters shared by every M-ary scheme; subclasses supply the error
+    # probability of their constellation through _symbol_error_probability and
+    # _required_eb_no
+    __slots__ = (
+        "_levels",
+        "_energy_per_symbol",
+        "_energy_per_bit",
+        "_symbol_rate",
+        "_symbol_period",
+        "_bits_per_symbol",
+        "_bit_rate",
+        "_bit_error_rate",
+        "_bit_period",
+        "_carrier_power",
+        "_eb_no",
+        "_es_no",
+        "_rolloff_rate",
+        "_carrier_signal",
+        "_modulating_signal",
+        "_frequency_range",
+        "_spectral_efficiency",
+        "_noise_probability",
+        "_code",
+        "_data_rate",
+        "_bit_error_rate_coded",
+        "_carrier_to_noise_coded",
+        "_eb_no_coded",
+        "_noise_power_density_coded",
+        "_noise_power_density",
+        "_noise_probability_coded",
+        "_es_no_coded",
+    )
+
     def __init__(
         self,
         levels: int,
@@ -160,10 +214,7 @@ class MPhaseShiftKeying(Modulation):
     def eb_no(self) -> float:
         if self._eb_no is None:
             if self._isset(self._bit_error_rate):
-                self._eb_no = (
-                    erfcinv(self.bit_error_rate * self.bits_per_symbol)
-                    / sin(pi / self.levels)
-                ) ** 2 / self.bits_per_symbol
+                self._eb_no = self._required_eb_no(self.bit_error_rate)
             elif self._isset(self._es_no):
                 self._eb_no = self.es_no / self.bits_per_symbol
             elif self._isset(self._energy_per_bit, self._noise_power_density):
@@ -295,16 +346,15 @@ class MPhaseShiftKeying(Modulation):
     def noise_probability(self) -> float:
         if self._noise_probability is None:
             if self._isset(self._es_no):
-                self._noise_probability = erfc(sqrt(self.es_no) * sin(pi / self.levels))
+                self._noise_probability = self._symbol_error_probability(self.es_no)
         return self._noise_probability
 
     @property
     def noise_probability_coded(self) -> float:
         if self._noise_probability_coded is None:
             if self._isset(self._eb_no_coded):
-                self._noise_probability_coded = erfc(
-                    sqrt(self.bits_per_symbol * self.eb_no_coded)
-                    * sin(pi / self.levels)
+                self._noise_probability_coded = self._symbol_error_probability(
+                    self.bits_per_symbol * self.eb_no_coded
                 )
         return self._noise_probability_coded
 
@@ -436,16 +486,41 @@ class MPhaseShiftKeying(Modulation):
 
         return summary
 
+    def _symbol_error_probability(self, es_no: float) -> float:
+        raise NotImplementedError
+
+    def _required_eb_no(self, bit_error_rate: float) -> float:
+        raise NotImplementedError
+
     def propagate_calculations(self) -> float:
+        # include the attributes inherited from DigitalModulation by subclasses
+        attributes = dict.fromkeys(
+            var
+            for cls in type(self).__mro__
+            if issubclass(cls, DigitalModulation)
+            for var in cls.__dict__
+        )
         for _ in range(4):
-            for var in type(self).__dict__:
+            for var in attributes:
                 getattr(self, var, None)
 
     def _isset(self, *args) -> bool:
-        return not (None in args)
+        return all(arg is not None for arg in args)
+
+
+class MPhaseShiftKeying(DigitalModulation):
+    __slots__ = ()
+
+    def _symbol_error_probability(self, es_no: float) -> float:
+        return psk_symbol_error_probability(es_no, self.levels)
+
+    def _required_eb_no(self, bit_error_rate: float) -> float:
+        return psk_eb_no(bit_error_rate, self.levels)
 
 
 class BinaryPhaseShiftKeying(MPhaseShiftKeying):
+    __slots__ = ()
+
     def __init__(
         self,
         bandwidth: float = None,
@@ -482,14 +557,18 @@ class BinaryPhaseShiftKeying(MPhaseShiftKeying):
     def noise_probability(self) -> float:
         if self._noise_probability is None:
             if self._isset(self._carrier_to_noise):
-                self._noise_probability = 0.5 * erfc(sqrt(self.carrier_to_noise))
+                self._noise_probability = psk_symbol_error_probability(
+                    self.carrier_to_noise, 2
+                )
         return self._noise_probability
 
     def _isset(self, *args) -> bool:
-        return not (None in args)
+        return all(arg is not None for arg in args)
 
 
 class QuadraturePhaseShiftKeying(MPhaseShiftKeying):
+    __slots__ = ()
+
     def __init__(
         self,
         bandwidth: float = None,
@@ -522,5 +601,94 @@ class QuadraturePhaseShiftKeying(MPhaseShiftKeying):
     def noise_probability(self) -> float:
         if self._noise_probability is None:
             if self._carrier_to_noise is not None:
-                self._noise_probability = 0.5 * erfc(sqrt(self.carrier_to_noise * 0.5))
+                self._noise_probability = psk_bit_error_rate(
+                    self.carrier_to_noise * 0.5, 4
+                )
         return self._noise_probability
+
+
+class QuadratureAmplitudeModulation(DigitalModulation):
+    __slots__ = ()
+
+    def __init__(self, levels: int, **kwargs):
+        """
+        M-ary quadrature amplitude modulation with Gray coding, e.g. 16-QAM or
+        64-QAM. Takes the same parameters as DigitalModulation.
+
+        Parameters
+        ----------
+            levels (int,): number of levels in the waveform (equivalent to number of symbols)
+        """
+        super().__init__(levels=levels, **kwargs)
+
+    def _symbol_error_probability(self, es_no: float) -> float:
+        return qam_symbol_error_probability(es_no, self.levels)
+
+    def _required_eb_no(self, bit_error_rate: float) -> float:
+        return qam_eb_no(bit_error_rate, self.levels)
+
+
+class AmplitudePhaseShiftKeying(DigitalModulation):
+    __slots__ = (
+        "_ring_sizes",
+        "_ring_ratios",
+        "_ring_phases",
+    )
+
+    def __init__(
+        self,
+        levels: int,
+        ring_sizes: tuple = None,
+        ring_ratios: tuple = None,
+        ring_phases: tuple = None,
+        **kwargs,
+    ):
+        """
+        Amplitude and phase shift keying on concentric rings, e.g. DVB-S2 16-APSK or
+        32-APSK. Takes the same parameters as DigitalModulation.
+
+        Parameters
+        ----------
+            levels (int,): number of levels in the waveform (equivalent to number of symbols)
+            ring_sizes (tuple, optional): the number of points on each ring, defaults
+                to the DVB-S2 constellation
+            ring_ratios (tuple, optional): the radius of each ring relative to the
+                innermost, defaults to the DVB-S2 constellation
+            ring_phases (tuple, rad, optional): the phase of the first point on each
+                ring, defaults to half the point spacing of each ring for given
+                rings, and to the DVB-S2 phases otherwise
+        """
+        self._ring_sizes = ring_sizes
+        self._ring_ratios = ring_ratios
+        self._ring_phases = ring_phases
+        super().__init__(levels=levels, **kwargs)
+
+    @property
+    def ring_sizes(self) -> tuple:
+        return self._ring_sizes
+
+    @property
+    def ring_ratios(self) -> tuple:
+        return self._ring_ratios
+
+    @property
+    def ring_phases(self) -> tuple:
+        return self._ring_phases
+
+    def _symbol_error_probability(self, es_no: float) -> float:
+        return apsk_symbol_error_probability(
+            es_no,
+            self.levels,
+            ring_sizes=self.ring_sizes,
+            ring_ratios=self.ring_ratios,
+            ring_phases=self.ring_phases,
+        )
+
+    def _required_eb_no(self, bit_error_rate: float) -> float:
+        return apsk_eb_no(
+            bit_error_rate,
+            self.levels,
+            ring_sizes=self.ring_sizes,
+            ring_ratios=self.ring_ratios,
+            ring_phases=self.ring_phases,
+        )
@@ -0,0 +1,244 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+from link_calculator.signal_processing.coding import ConvolutionalCode
+
+
+def gray_code(levels: int) -> np.ndarray:
+    """
+    Calculate the Gray code label of each symbol, so neighbouring symbols differ in a
+    single bit
+
+    Parameters
+    ----------
+        levels (int, ): the number of symbols M, a power of two
+
+    Returns
+    -------
+        labels (np.ndarray, ): the label of each symbol index
+    """
+    index = np.arange(levels)
+    return index ^ (index >> 1)
+
+
+def bit_error_table(levels: int) -> np.ndarray:
+    """
+    Count the bit errors made when each symbol is detected as each other symbol
+
+    Parameters
+    ----------
+        levels (int, ): the number of symbols M
+
+    Returns
+    -------
+        bit_errors (np.ndarray, ): (M, M) table indexed by [sent, detected]
+    """
+    labels = gray_code(levels)
+    differences = labels[:, None] ^ labels[None, :]
+    bits = np.arange(int(np.log2(levels)))
+    return np.sum((differences[..., None] >> bits) & 1, axis=-1)
+
+
+def _simulate_psk_point(
+    eb_no: float,
+    levels: int,
+    target_errors: int,
+    max_bits: int,
+    chunk_size: int,
+    seed: np.random.SeedSequence,
+    impairment: Callable = None,
+    symmetric: bool = False,
+) -> tuple:
+    rng = np.random.default_rng(seed)
+    bits_per_symbol = int(np.log2(levels))
+    bit_errors_table = bit_error_table(levels)
+    # unit energy symbols, with noise of variance No / 2 in each dimension
+    noise_deviation = np.sqrt(1 / (2 * bits_per_symbol * eb_no))
+    sector = 2 * np.pi / levels
+    # symbol k sits at angle k * sector and carries the Gray label of k
+    constellation = np.exp(1j * sector * np.arange(levels))
+
+    bit_errors = symbol_errors = n_bits = 0
+    while bit_errors < target_errors and n_bits < max_bits:
+        if symmetric:
+            sent, detected = _symmetric_psk_errors(
+                rng, levels, chunk_size, noise_deviation
+            )
+        else:
+            sent = rng.integers(levels, size=chunk_size)
+            transmitted = constellation[sent]
+            if impairment is not None:
+                transmitted = impairment(transmitted)
+            received = transmitted + noise_deviation * (
+                rng.standard_normal(chunk_size) + 1j * rng.standard_normal(chunk_size)
+            )
+            # the nearest symbol is the one whose angle is nearest
+            detected = np.rint(np.angle(received) / sector).astype(int) % levels
+        bit_errors += int(np.sum(bit_errors_table[sent, detected]))
+        symbol_errors += int(np.count_nonzero(sent != detected))
+        n_bits += chunk_size * bits_per_symbol
+    return bit_errors, symbol_errors, n_bits
+
+
+def _symmetric_psk_errors(
+    rng: np.random.Generator, levels: int, chunk_size: int, noise_deviation: float
+) -> tuple:
+    # the noise is circularly symmetric, so the received point relative to the sent
+    # symbol is distributed as if symbol 0 was sent
+    sector = 2 * np.pi / levels
+    in_phase = 1 + rng.standard_normal(chunk_size) * noise_deviation
+    if levels == 2:
+        offset = np.ones(np.count_nonzero(in_phase < 0), dtype=int)
+    else:
+        quadrature = rng.standard_normal(chunk_size) * noise_deviation
+        # cheap test for the received point leaving the decision sector
+        wrong = ~(np.abs(quadrature) < np.tan(sector / 2) * in_phase)
+        offset = (
+            np.rint(np.arctan2(quadrature[wrong], in_phase[wrong]) / sector).astype(int)
+            % levels
+        )
+        offset = offset[offset != 0]
+    # only the erroneous symbols need a transmitted symbol to count bit errors
+    sent = rng.integers(levels, size=len(offset))
+    return sent, (sent + offset) % levels
+
+
+def simulate_psk_error_rate(
+    eb_no: np.ndarray,
+    levels: int,
+    target_errors: int = 100,
+    max_bits: int = 10**10,
+    chunk_size: int = 2**18,
+    processes: int = 1,
+    seed: int = None,
+    impairment: Callable = None,
+    symmetric: bool = None,
+) -> pd.DataFrame:
+    """
+    Measure the error rates of Gray coded M-ary phase shift keying in additive white
+    Gaussian noise by Monte Carlo simulation
+
+    Each Eb/No point transmits chunks of random Gray mapped symbols, adds noise and
+    detects the nearest symbol, until target_errors bit errors are counted or
+    max_bits are sent, so low error rates only cost the bits needed to resolve them.
+    Points are independent and can be spread across a process pool.
+
+    Without an impairment the constellation is rotationally symmetric, so by default
+    the noise is applied to a single reference symbol and a transmitted symbol is only
+    drawn for the detection errors, which is two to five times faster. Resolving a
+    bit error rate of 1e-7 with the default 100 errors sends about 1e9 bits, which
+    took 16-30 s per point for BPSK, QPSK and 8-PSK on one core this way and 29-89 s
+    through the full demapper, see benchmarks/psk_simulation.py. The default
+    max_bits leaves room for such a point to reach its target errors.
+
+    Parameters
+    ----------
+        eb_no (np.ndarray, ): the energy per bit to noise power density ratios
+        levels (int, ): the number of symbols M, a power of two
+        target_errors (int, ): the number of bit errors that ends a point
+        max_bits (int, ): the maximum number of bits sent for a point
+        chunk_size (int, ): the number of symbols generated at a time
+        processes (int, ): the number of worker processes, 1 to run in this process
+        seed (int, optional): seed for the random number generator
+        impairment (Callable, optional): maps the complex unit energy symbols sent
+            to the impaired symbols before noise is added, e.g. a phase offset or an
+            amplifier model, and must be picklable to run in worker processes
+        symmetric (bool, optional): whether to use the reference symbol shortcut,
+            which cannot be combined with an impairment, defaults to using it when
+            there is no impairment
+
+    Returns
+    -------
+        results (pd.DataFrame, ): the bit and symbol error rates of each point, with
+            the error and bit counts they were measured from
+    """
+    if symmetric is None:
+        symmetric = impairment is None
+    if symmetric and impairment is not None:
+        raise ValueError("An impaired constellation is not rotationally symmetric")
+    eb_no = np.atleast_1d(np.asarray(eb_no, dtype=float))
+    seeds = np.random.SeedSequence(seed).spawn(len(eb_no))
+    arguments = [
+        (e, levels, target_errors, max_bits, chunk_size, s, impairment, symmetric)
+        for e, s in zip(eb_no, seeds)
+    ]
+    if processes == 1:
+        counts = [_simulate_psk_point(*args) for args in arguments]
+    else:
+        with ProcessPoolExecutor(processes) as pool:
+            counts = list(pool.map(_simulate_psk_point, *zip(*arguments)))
+
+    bit_errors, symbol_errors, n_bits = np.array(counts).T
+    n_symbols = n_bits // int(np.log2(levels))
+    return pd.DataFrame(
+        {
+            "eb_no": eb_no,
+            "bit_error_rate": bit_errors / n_bits,
+            "symbol_error_rate": symbol_errors / n_symbols,
+            "bit_errors": bit_errors,
+            "bits": n_bits,
+        }
+    )
+
+
+def simulate_convolutional_error_rate(
+    code: ConvolutionalCode,
+    eb_no: np.ndarray,
+    soft: bool = True,
+    block_size: int = 1000,
+    batch_size: int = 64,
+    target_errors: int = 100,
+    max_bits: int = 10**7,
+    seed: int = None,
+) -> pd.DataFrame:
+    """
+    Measure the decoded bit error rate of a convolutional code over BPSK in additive
+    white Gaussian noise by Monte Carlo simulation
+
+    Batches of terminated blocks are encoded, transmitted and Viterbi decoded until
+    target_errors bit errors are counted or max_bits are sent.
+
+    Parameters
+    ----------
+        code (ConvolutionalCode, ): a code with generator polynomials
+        eb_no (np.ndarray, ): the energy per information bit to noise power density
+            ratios
+        soft (bool, ): whether to decode soft decisions rather than hard decisions
+        block_size (int, ): the number of information bits per block
+        batch_size (int, ): the number of blocks decoded together
+        target_errors (int, ): the number of bit errors that ends a point
+        max_bits (int, ): the maximum number of information bits sent for a point
+        seed (int, optional): seed for the random number generator
+
+    Returns
+    -------
+        results (pd.DataFrame, ): the decoded bit error rate of each point, with the
+            error and bit counts it was measured from
+    """
+    rng = np.random.default_rng(seed)
+    eb_no = np.atleast_1d(np.asarray(eb_no, dtype=float))
+    bit_errors = np.zeros(len(eb_no), dtype=int)
+    n_bits = np.zeros(len(eb_no), dtype=int)
+
+    for i, point in enumerate(eb_no):
+        noise_deviation = np.sqrt(1 / (2 * code.coding_rate * point))
+        while bit_errors[i] < target_errors and n_bits[i] < max_bits:
+            bits = rng.integers(2, size=(batch_size, block_size), dtype=np.uint8)
+            symbols = 1 - 2.0 * code.encode(bits)
+            received = symbols + noise_deviation * rng.standard_normal(symbols.shape)
+            if not soft:
+                received = received < 0
+            bit_errors[i] += np.count_nonzero(code.decode(received, soft) != bits)
+            n_bits[i] += bits.size
+
+    return pd.DataFrame(
+        {
+            "eb_no": eb_no,
+            "bit_error_rate": bit_errors / n_bits,
+            "bit_errors": bit_errors,
+            "bits": n_bits,
+        }
+    )
@@ -0,0 +1,182 @@
+from functools import lru_cache
+
+import numpy as np
+
+from link_calculator.conversions import Hz_to_GHz
+
+
+@lru_cache(maxsize=64)
+def raised_cosine_taps(
+    rolloff_rate: float,
+    samples_per_symbol: int = 8,
+    span: int = 16,
+    root: bool = True,
+) -> np.ndarray:
+    """
+    Calculate the taps of a (root) raised cosine pulse shaping filter
+
+    Taps are cached per configuration; the returned array is read only.
+
+    Parameters
+    ----------
+        rolloff_rate (float, ): the excess bandwidth factor, in (0, 1]
+        samples_per_symbol (int, ): the oversampling factor
+        span (int, symbols): the filter length
+        root (bool, ): whether to return the root raised cosine, as used for the
+            transmit filter, rather than the overall raised cosine response
+
+    Returns
+    -------
+        taps (np.ndarray, ): the filter taps, normalised to unit energy
+    """
+    t = np.arange(-span * samples_per_symbol // 2, span * samples_per_symbol // 2 + 1)
+    t = t / samples_per_symbol
+    beta = rolloff_rate
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if root:
+            taps = (
+                np.sin(np.pi * t * (1 - beta))
+                + 4 * beta * t * np.cos(np.pi * t * (1 + beta))
+            ) / (np.pi * t * (1 - (4 * beta * t) ** 2))
+            taps[t == 0] = 1 - beta + 4 * beta / np.pi
+            singular = np.isclose(np.abs(t), 1 / (4 * beta))
+            taps[singular] = (beta / np.sqrt(2)) * (
+                (1 + 2 / np.pi) * np.sin(np.pi / (4 * beta))
+                + (1 - 2 / np.pi) * np.cos(np.pi / (4 * beta))
+            )
+        else:
+            taps = np.sinc(t) * np.cos(np.pi * beta * t) / (1 - (2 * beta * t) ** 2)
+            singular = np.isclose(np.abs(t), 1 / (2 * beta))
+            taps[singular] = np.pi / 4 * np.sinc(1 / (2 * beta))
+    taps = taps / np.sqrt(np.sum(taps**2))
+    taps.setflags(write=False)
+    return taps
+
+
+@lru_cache(maxsize=64)
+def power_spectral_density(
+    rolloff_rate: float,
+    samples_per_symbol: int = 8,
+    span: int = 16,
+    n_fft: int = 8192,
+) -> tuple:
+    """
+    Calculate the one-sided power spectral density of a root raised cosine shaped
+    signal carrying independent symbols, from the FFT of the transmit filter
+
+    Spectra are cached per configuration; the returned arrays are read only.
+
+    Parameters
+    ----------
+        rolloff_rate (float, ): the excess bandwidth factor
+        samples_per_symbol (int, ): the oversampling factor
+        span (int, symbols): the filter length
+        n_fft (int, ): the FFT length
+
+    Returns
+    -------
+        frequency (np.ndarray, ): frequencies normalised to the symbol rate, from 0
+            to samples_per_symbol / 2
+        psd (np.ndarray, ): the power spectral density, normalised to unit total
+            power
+    """
+    taps = raised_cosine_taps(rolloff_rate, samples_per_symbol, span, root=True)
+    psd = np.abs(np.fft.rfft(taps, n_fft)) ** 2
+    # fold the negative frequencies onto the positive half; DC and, for an even
+    # length, the Nyquist bin have no negative counterpart
+    psd[1 : (n_fft + 1) // 2] *= 2
+    psd /= np.sum(psd)
+    frequency = np.fft.rfftfreq(n_fft, 1 / samples_per_symbol)
+    frequency.setflags(write=False)
+    psd.setflags(write=False)
+    return frequency, psd
+
+
+def _cumulative_power(rolloff_rate: float) -> tuple:
+    """
+    Tabulate the fraction of power within +/- f of the carrier against f, normalised
+    to the symbol rate
+    """
+    frequency, psd = power_spectral_density(float(rolloff_rate))
+    # each FFT bin extends half a bin either side of its frequency
+    edges = np.concatenate([[0], frequency + frequency[1] / 2])
+    cumulative = np.concatenate([[0], np.cumsum(psd)])
+    return edges, cumulative
+
+
+def occupied_bandwidth(
+    rolloff_rate: np.ndarray, symbol_rate: np.ndarray, fraction: float = 0.99
+) -> np.ndarray:
+    """
+    Calculate the bandwidth containing a fraction of the transmitted power of a root
+    raised cosine shaped carrier
+
+    Parameters
+    ----------
+        rolloff_rate (np.ndarray, ): the excess bandwidth factors, scalar or array
+        symbol_rate (np.ndarray, symbols/s): the symbol rates, broadcastable with
+            rolloff_rate
+        fraction (float, ): the fraction of power, 0.99 for the ITU occupied
+            bandwidth
+
+    Returns
+    -------
+        bandwidth (np.ndarray, GHz)
+    """
+    rolloff_rate, symbol_rate = np.broadcast_arrays(rolloff_rate, symbol_rate)
+    normalised = np.empty(rolloff_rate.shape)
+    for beta in np.unique(rolloff_rate):
+        edges, cumulative = _cumulative_power(beta)
+        normalised[rolloff_rate == beta] = 2 * np.interp(fraction, cumulative, edges)
+    return Hz_to_GHz(normalised * symbol_rate)[()]
+
+
+def adjacent_channel_leakage(
+    rolloff_rate: np.ndarray,
+    channel_spacing: np.ndarray,
+    symbol_rate: np.ndarray,
+    channel_bandwidth: np.ndarray = None,
+) -> np.ndarray:
+    """
+    Calculate the adjacent channel leakage ratio (ACLR) of a root raised cosine
+    shaped carrier: the power falling in the neighbouring channel relative to the
+    power in its own channel
+
+    Parameters
+    ----------
+        rolloff_rate (np.ndarray, ): the excess bandwidth factors, scalar or array
+        channel_spacing (np.ndarray, GHz): the distance between channel centres
+        symbol_rate (np.ndarray, symbols/s): the symbol rates
+        channel_bandwidth (np.ndarray, GHz, optional): the measurement bandwidth of
+            each channel, defaults to symbol_rate * (1 + rolloff_rate)
+
+    Returns
+    -------
+        aclr (np.ndarray, ): the leakage ratio, broadcast over the inputs
+    """
+    rolloff_rate, channel_spacing, symbol_rate = np.broadcast_arrays(
+        rolloff_rate, channel_spacing, symbol_rate
+    )
+    symbol_rate_ghz = Hz_to_GHz(np.asarray(symbol_rate, dtype=float))
+    if channel_bandwidth is None:
+        half_width = (1 + rolloff_rate) / 2
+    else:
+        half_width = np.broadcast_to(channel_bandwidth, rolloff_rate.shape) / (
+            2 * symbol_rate_ghz
+        )
+    spacing = channel_spacing / symbol_rate_ghz
+
+    aclr = np.empty(rolloff_rate.shape)
+    for beta in np.unique(rolloff_rate):
+        edges, cumulative = _cumulative_power(beta)
+        selected = rolloff_rate == beta
+        in_channel = np.interp(half_width[selected], edges, cumulative)
+        upper = np.interp(spacing[selected] + half_width[selected], edges, cumulative)
+        # the lower edge lies below the carrier when the channels overlap, where the
+        # power up to it counts negatively
+        lower_edge = spacing[selected] - half_width[selected]
+        lower = np.sign(lower_edge) * np.interp(np.abs(lower_edge), edges, cumulative)
+        # the spectrum is symmetric, so half the power within +/- f lies above the
+        # carrier
+        aclr[selected] = 0.5 * (upper - lower) / in_channel
+    return aclr[()]
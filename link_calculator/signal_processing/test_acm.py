@@ -0,0 +1,59 @@
+import numpy as np
+
+from link_calculator.conversions import decibel_to_watt
+from link_calculator.signal_processing.acm import (
+    DVB_S2_MODCODS,
+    OUTAGE,
+    AdaptiveCodingModulation,
+)
+
+
+def test_select():
+    # the 8-PSK MODCOD needs more Es/No but carries less than the 16-APSK one
+    acm = AdaptiveCodingModulation(
+        levels=[4, 8, 16],
+        coding_rate=[1 / 2, 1 / 2, 3 / 4],
+        required_es_no=decibel_to_watt(np.array([1, 10, 8])),
+        symbol_rate=1e6,
+    )
+    es_no_db = np.array([0, 1, 5, 8.5, 12])
+    assert acm.select(decibel_to_watt(es_no_db)).tolist() == [OUTAGE, 0, 0, 2, 2]
+
+    acm = AdaptiveCodingModulation.from_decibel_table(symbol_rate=1e6, margin=2)
+    modcods = acm.select(decibel_to_watt(np.linspace(-5, 25, 1000)))
+    efficiency = np.append(acm.spectral_efficiency, 0)[modcods]
+    assert np.all(np.diff(efficiency) >= 0)
+    for es_no_db, modcod in [(3.01, 3), (4.3, 4), (18.1, 27)]:
+        assert acm.select(decibel_to_watt(es_no_db)) == modcod
+
+    # a missing sample is an outage, not the best MODCOD, while an unbounded C/N
+    # closes every MODCOD
+    carrier_to_noise = np.array([np.nan, np.inf, decibel_to_watt(4.3)])
+    assert acm.select(carrier_to_noise).tolist() == [OUTAGE, 27, 4]
+    assert acm.throughput(np.nan) == 0
+
+    # both constructors take the margin in dB
+    levels, coding_rate, es_no_db = zip(*DVB_S2_MODCODS)
+    linear = AdaptiveCodingModulation(
+        levels, coding_rate, decibel_to_watt(np.array(es_no_db)), 1e6, margin=2
+    )
+    carrier_to_noise = decibel_to_watt(np.linspace(-5, 25, 100))
+    assert np.array_equal(linear.select(carrier_to_noise), acm.select(carrier_to_noise))
+
+
+def test_throughput_and_occupancy():
+    acm = AdaptiveCodingModulation.from_decibel_table(symbol_rate=1e6)
+    carrier_to_noise = decibel_to_watt(np.array([-5, 1.5, 1.5, 7, 20, 20]))
+    passes = np.array([0, 0, 0, 1, 1, 1])
+
+    throughput = acm.throughput(carrier_to_noise)
+    assert np.allclose(throughput, 1e6 * np.array([0, 1, 1, 2, 4.5, 4.5]))
+    assert np.allclose(acm.data_volume(carrier_to_noise, 10, passes), [2e7, 1.1e8])
+    assert acm.data_volume(carrier_to_noise, 10) == np.sum(throughput) * 10
+
+    occupancy = acm.occupancy(carrier_to_noise)
+    assert occupancy.epochs.sum() == 6
+    assert occupancy.loc["outage", "fraction"] == 1 / 6
+    assert occupancy.loc[3, "epochs"] == 2
+    assert occupancy.loc[12, "epochs"] == 1
+    assert occupancy.loc[27, "epochs"] == 2
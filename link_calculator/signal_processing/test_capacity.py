@@ -0,0 +1,52 @@
+import numpy as np
+
+from link_calculator.conversions import decibel_to_watt, watt_to_decibel
+from link_calculator.signal_processing.capacity import (
+    capacity_surface,
+    efficiency_map,
+    gap_to_shannon,
+    operating_points,
+    shannon_capacity,
+    shannon_eb_no,
+)
+from link_calculator.signal_processing.modulation import MPhaseShiftKeying
+
+
+def test_shannon_limits():
+    assert np.isclose(shannon_capacity(0.001, 3), 2e6)
+    assert np.isclose(watt_to_decibel(shannon_eb_no(0)), -1.59, atol=0.01)
+    assert np.isclose(shannon_eb_no(1), 1)
+    assert np.isclose(shannon_eb_no(2), 1.5)
+    assert np.isclose(gap_to_shannon(3, 2), 2)
+
+
+def test_capacity_surface():
+    bandwidths = np.linspace(0.001, 0.5, 200)  # GHz
+    carrier_to_noise = decibel_to_watt(np.linspace(-10, 30, 300))
+    surface = capacity_surface(bandwidths, carrier_to_noise)
+
+    assert surface["capacity"].shape == (200, 300)
+    assert np.allclose(
+        surface["capacity"][17, 42],
+        shannon_capacity(bandwidths[17], carrier_to_noise[42]),
+    )
+    # operating at capacity is exactly on the Shannon limit
+    eb_no = carrier_to_noise / surface["spectral_efficiency"][0]
+    assert np.allclose(surface["eb_no"][0], eb_no)
+
+    efficiency = efficiency_map(decibel_to_watt(np.linspace(-2, 20, 50)), [0.5, 2, 6])
+    assert efficiency["gap"].shape == (50, 3)
+    assert np.all(np.diff(efficiency["achievable"].sum(axis=0)) < 0)
+
+
+def test_operating_points():
+    modulations = [
+        MPhaseShiftKeying(
+            levels=levels, bandwidth=0.05, rolloff_rate=0.25, bit_error_rate=1e-6
+        )
+        for levels in [2, 4, 8]
+    ]
+    points = operating_points(modulations)
+    assert np.allclose(points.spectral_efficiency, [0.8, 1.6, 2.4])
+    assert np.all(points.gap > 1)
+    assert np.allclose(points.eb_no, [m.eb_no for m in modulations])
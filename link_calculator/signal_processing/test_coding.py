@@ -1,7 +1,24 @@
+from math import comb
+
 import numpy as np
+import pytest
 
 from link_calculator.conversions import decibel_to_watt, watt_to_decibel
+from link_calculator.signal_processing.coding import (
+    EntropyEstimator,
+    average_information_rate,
+    block_error_rate,
+    correct_block_probability,
+    entropy,
+    error_probability,
+    packet_error_rate,
+    total_information,
+)
+from link_calculator.signal_processing.error_rates import psk_bit_error_rate
 from link_calculator.signal_processing.modulation import ConvolutionalCode
+from link_calculator.signal_processing.simulation import (
+    simulate_convolutional_error_rate,
+)
 
 
 def test_coding_gain():
@@ -38,3 +55,104 @@ def test_coding_gain_2():
         2.5,
         rtol=0.2,
     )
+
+
+def test_convolutional_encode():
+    code = ConvolutionalCode(generators=(0o7, 0o5))
+    assert code.coding_rate == 0.5 and code.constraint_length == 3
+    coded = code.encode(np.array([1, 0, 1, 1]))
+    assert coded.tolist() == [1, 1, 1, 0, 0, 0, 0, 1, 0, 1, 1, 1]
+
+
+def test_viterbi_decode():
+    rng = np.random.default_rng(0)
+    for generators in [(0o7, 0o5), (0o171, 0o133), (0o25, 0o33, 0o37)]:
+        code = ConvolutionalCode(generators=generators)
+        bits = rng.integers(2, size=(8, 200))
+        coded = code.encode(bits)
+
+        # isolated hard errors are corrected
+        corrupted = coded.copy()
+        corrupted[:, [5, 150, 300]] ^= 1
+        assert np.array_equal(code.decode(corrupted), bits)
+
+        soft = 1 - 2.0 * coded + 0.5 * rng.standard_normal(coded.shape)
+        assert np.array_equal(code.decode(soft, soft=True), bits)
+
+
+def test_simulated_coding_gain():
+    code = ConvolutionalCode(generators=(0o7, 0o5))
+    eb_no = decibel_to_watt(5)
+    soft = simulate_convolutional_error_rate(code, eb_no, soft=True, seed=1)
+    hard = simulate_convolutional_error_rate(code, eb_no, soft=False, seed=1)
+    uncoded = psk_bit_error_rate(eb_no, 2)
+    assert soft.bit_error_rate[0] < hard.bit_error_rate[0] < uncoded
+
+
+def test_block_error_probability():
+    # exact binomial terms for a small block
+    assert np.isclose(error_probability(10, 2, 0.1), comb(10, 2) * 0.1**2 * 0.9**8)
+    terms = error_probability(10, np.arange(11), 0.1)
+    assert np.isclose(np.sum(terms), 1)
+    assert np.isclose(correct_block_probability(10, 2, 0.1), np.sum(terms[:3]))
+    assert np.isclose(block_error_rate(10, 2, 0.1), np.sum(terms[3:]))
+
+    # large blocks and tiny error rates stay finite and precise
+    bers = np.logspace(-12, -3, 10)
+    blocks = np.array([[255], [8160], [10**6]])
+    rates = block_error_rate(blocks, 8, bers)
+    assert rates.shape == (3, 10)
+    assert np.all(np.isfinite(rates)) and np.all(rates > 0)
+    assert np.all(np.diff(rates, axis=1) >= 0)
+    assert np.isfinite(error_probability(10**6, 500, 1e-3))
+    assert np.isclose(packet_error_rate(1000, 1e-12), 1e-9, rtol=1e-6)
+    assert np.isclose(packet_error_rate(1000, 1e-12), block_error_rate(1000, 0, 1e-12))
+
+
+def test_entropy_arrays():
+    probabilities = np.array([0.5, 0.25, 0.125, 0.125])
+    assert entropy(probabilities) == 1.75
+    assert entropy([0.5, 0.25, 0.125, 0.125]) == 1.75
+    assert total_information(probabilities) == 7
+    assert average_information_rate(1000, probabilities) == 1750
+    assert np.allclose(
+        entropy(np.array([[0.5, 0.5, 0, 0], [0.25, 0.25, 0.25, 0.25]])), [1, 2]
+    )
+
+
+def test_entropy_estimator(tmp_path):
+    rng = np.random.default_rng(0)
+    probabilities = np.array([0.5, 0.25, 0.125, 0.125])
+    symbols = rng.choice(4, size=10**6, p=probabilities).astype(np.uint8)
+
+    estimator = EntropyEstimator(n_symbols=4)
+    estimates = list(estimator.consume(np.array_split(symbols, 10)))
+    assert len(estimates) == 10
+    assert estimator.n_observed == 10**6
+    assert np.isclose(estimates[-1], entropy(probabilities), rtol=1e-3)
+    assert np.isclose(estimator.information_rate(100), 100 * estimates[-1])
+
+    path = tmp_path / "capture.bin"
+    symbols.tofile(path)
+    from_file = EntropyEstimator.from_file(path, chunk_size=12345)
+    assert np.array_equal(from_file.counts[:4], estimator.counts)
+    assert from_file.entropy == estimator.entropy
+    with open(path, "rb") as f:
+        streamed = EntropyEstimator()
+        list(streamed.consume(iter(lambda: f.read(2**16), b"")))
+    assert np.array_equal(streamed.counts, from_file.counts)
+
+    # symbols outside the alphabet are rejected rather than dropped
+    with pytest.raises(ValueError):
+        estimator.update(np.array([0, 4]))
+    with pytest.raises(ValueError):
+        estimator.update(np.array([-1]))
+    assert estimator.n_observed == 10**6
+
+    symbols.astype(np.uint32).tofile(path)
+    with pytest.raises(ValueError):
+        EntropyEstimator.from_file(path, dtype="uint32")
+    with pytest.raises(ValueError):
+        EntropyEstimator.from_file(path, dtype="int32", n_symbols=4)
+    wide = EntropyEstimator.from_file(path, dtype="uint32", n_symbols=4)
+    assert np.array_equal(wide.counts, estimator.counts)
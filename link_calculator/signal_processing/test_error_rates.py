@@ -0,0 +1,116 @@
+import numpy as np
+
+from link_calculator.conversions import decibel_to_watt
+from link_calculator.signal_processing.error_rates import (
+    APSK_RINGS,
+    InverseErrorRateTable,
+    apsk_bit_error_rate,
+    apsk_constellation,
+    apsk_eb_no,
+    apsk_symbol_error_probability,
+    psk_bit_error_rate,
+    psk_eb_no,
+    psk_symbol_error_probability,
+    qam_bit_error_rate,
+    qam_eb_no,
+)
+from link_calculator.signal_processing.modulation import MPhaseShiftKeying
+
+
+def test_psk_bit_error_rate():
+    # BPSK and Gray coded QPSK reach 1e-5 at 9.6 dB
+    assert np.isclose(psk_bit_error_rate(decibel_to_watt(9.6), 2), 1e-5, rtol=0.1)
+    assert np.isclose(
+        psk_bit_error_rate(decibel_to_watt(9.6), 4),
+        psk_bit_error_rate(decibel_to_watt(9.6), 2),
+    )
+
+    eb_no = decibel_to_watt(np.linspace(0, 20, 10**6))
+    bers = psk_bit_error_rate(eb_no[:, None], np.array([2, 4, 8, 16]))
+    assert bers.shape == (10**6, 4)
+    assert np.all(np.diff(bers, axis=0) <= 0)
+    assert np.all(np.diff(bers[-1, 1:]) > 0)
+    assert np.array_equal(
+        psk_bit_error_rate(eb_no, 8, coding_gain=2), psk_bit_error_rate(2 * eb_no, 8)
+    )
+
+
+def test_psk_matches_modulation():
+    for levels in [4, 8, 16]:
+        mod = MPhaseShiftKeying(
+            levels=levels, bandwidth=0.05, rolloff_rate=0.3, eb_no=decibel_to_watt(12)
+        )
+        assert np.isclose(
+            psk_symbol_error_probability(mod.es_no, levels), mod.noise_probability
+        )
+        assert np.isclose(
+            psk_bit_error_rate(decibel_to_watt(12), levels), mod.bit_error_rate
+        )
+
+
+def test_psk_eb_no():
+    bers = np.logspace(-12, -2, 50)
+    for levels in [2, 4, 8, 32]:
+        assert np.allclose(psk_bit_error_rate(psk_eb_no(bers, levels), levels), bers)
+
+
+def test_inverse_error_rate_table():
+    table = InverseErrorRateTable(levels=(2, 4, 8))
+    assert table.accuracy < 1e-3
+
+    bers = np.logspace(-14, -1, 1000)
+    levels = np.array([2, 4, 8])[:, None]
+    exact = psk_eb_no(bers, levels)
+    assert np.all(
+        np.abs(10 * np.log10(table.eb_no(bers, levels) / exact)) <= table.accuracy
+    )
+
+    # orders and error rates outside the table use the exact inverse
+    assert table.eb_no(1e-320, 2) == psk_eb_no(1e-320, 2)
+    assert table.eb_no(1e-6, 16) == psk_eb_no(1e-6, 16)
+
+
+def test_qam_bit_error_rate():
+    # 4-QAM is QPSK
+    eb_no = decibel_to_watt(np.linspace(6, 12, 25))
+    assert np.allclose(
+        qam_bit_error_rate(eb_no, 4), psk_bit_error_rate(eb_no, 4), rtol=1e-2
+    )
+    # 16-QAM and 64-QAM reach 1e-6 near 14.4 dB and 18.8 dB
+    assert np.allclose(
+        qam_bit_error_rate(decibel_to_watt(np.array([14.4, 18.8])), [16, 64]),
+        1e-6,
+        rtol=0.2,
+    )
+    bers = np.logspace(-12, -2, 20)
+    for levels in [4, 16, 64, 256]:
+        assert np.allclose(qam_bit_error_rate(qam_eb_no(bers, levels), levels), bers)
+
+
+def test_apsk_symbol_error_probability():
+    rng = np.random.default_rng(0)
+    constellation = apsk_constellation(*APSK_RINGS[16])
+    assert np.isclose(np.mean(np.abs(constellation) ** 2), 1)
+    # the DVB-S2 32APSK outer ring starts on the real axis, the inner rings half a
+    # point spacing off it
+    outer = apsk_constellation(*APSK_RINGS[32])[16:]
+    assert np.allclose(np.angle(outer[:2]), [0, np.pi / 8])
+    assert np.allclose(np.angle(constellation[:2]), [np.pi / 4, 3 * np.pi / 4])
+
+    # compare the union bound with nearest neighbour detection
+    es_no = decibel_to_watt(15)
+    sent = rng.integers(16, size=200000)
+    noise = (rng.standard_normal(sent.size) + 1j * rng.standard_normal(sent.size)) / (
+        np.sqrt(2 * es_no)
+    )
+    received = constellation[sent] + noise
+    detected = np.argmin(np.abs(received[:, None] - constellation[None, :]), axis=1)
+    assert np.isclose(
+        np.mean(detected != sent), apsk_symbol_error_probability(es_no, 16), rtol=0.1
+    )
+
+    bers = np.logspace(-10, -3, 8)
+    for levels in [16, 32]:
+        assert np.allclose(apsk_bit_error_rate(apsk_eb_no(bers, levels), levels), bers)
+    # the rings cost a little power against square QAM
+    assert qam_eb_no(1e-6, 16) < apsk_eb_no(1e-6, 16) < psk_eb_no(1e-6, 16)
@@ -1,3 +1,5 @@
+import pickle
+
 import numpy as np
 
 from link_calculator.conversions import (
@@ -11,10 +13,17 @@ from link_calculator.conversions import (
     mbit_to_bit,
     watt_to_decibel,
 )
+from link_calculator.signal_processing.error_rates import (
+    apsk_bit_error_rate,
+    qam_bit_error_rate,
+)
 from link_calculator.signal_processing.frequency_modulation import FrequencyModulation
 from link_calculator.signal_processing.modulation import (
+    AmplitudePhaseShiftKeying,
     BinaryPhaseShiftKeying,
+    DigitalModulation,
     MPhaseShiftKeying,
+    QuadratureAmplitudeModulation,
     QuadraturePhaseShiftKeying,
     Waveform,
 )
@@ -214,3 +223,70 @@ def test_eb_no():
         carrier_to_noise=carrier_to_noise,
     )
     assert np.isclose(watt_to_decibel(mod.eb_no), 19.02, rtol=0.01)
+
+
+def test_qam_apsk_modulation():
+    for modulation, levels, ber in [
+        (QuadratureAmplitudeModulation, 16, qam_bit_error_rate),
+        (QuadratureAmplitudeModulation, 64, qam_bit_error_rate),
+        (AmplitudePhaseShiftKeying, 32, apsk_bit_error_rate),
+    ]:
+        mod = modulation(
+            levels=levels,
+            bit_error_rate=1e-6,
+            bandwidth=MHz_to_GHz(50),
+            rolloff_rate=0.25,
+        )
+        assert np.isclose(mod.spectral_efficiency, np.log2(levels) / 1.25)
+        assert np.isclose(ber(mod.eb_no, levels), 1e-6)
+
+        conv_mod = modulation(
+            levels=levels, eb_no=mod.eb_no, bandwidth=MHz_to_GHz(50), rolloff_rate=0.25
+        )
+        assert np.isclose(conv_mod.bit_error_rate, 1e-6)
+
+        # the schemes share the link calculations but not the PSK error model
+        assert isinstance(mod, DigitalModulation)
+        assert not isinstance(mod, MPhaseShiftKeying)
+
+
+def test_slotted_modulation():
+    for mod in [
+        MPhaseShiftKeying(
+            levels=8, bit_error_rate=1e-6, bandwidth=MHz_to_GHz(50), rolloff_rate=0.2
+        ),
+        AmplitudePhaseShiftKeying(
+            levels=16, bit_error_rate=1e-6, bandwidth=MHz_to_GHz(50), rolloff_rate=0.2
+        ),
+        FrequencyModulation(baseband_bandwidth=MHz_to_GHz(4), carrier_to_noise=10),
+    ]:
+        assert not hasattr(mod, "__dict__")
+        copy = pickle.loads(pickle.dumps(mod))
+        for cls in type(mod).__mro__:
+            for name in cls.__dict__.get("__slots__", ()):
+                assert getattr(copy, name) == getattr(mod, name)
+
+
+def test_fm_grid():
+    baseband = np.array([3.4, 4.2, 15]) * 1e-3  # GHz
+    deviation = np.linspace(5, 50, 10) * 1e-3  # GHz
+    carrier_to_noise = decibel_to_watt(np.linspace(0, 25, 26))
+    fm = FrequencyModulation.grid(
+        baseband, deviation, carrier_to_noise, threshold=decibel_to_watt(10)
+    )
+    assert fm.signal_to_noise.shape == (3, 10, 26)
+    assert fm.link_margin.shape == (1, 1, 26)
+
+    point = FrequencyModulation(
+        baseband_bandwidth=baseband[1],
+        frequency_deviation=deviation[3],
+        carrier_to_noise=carrier_to_noise[20],
+    )
+    assert np.isclose(fm.signal_to_noise[1, 3, 20], point.signal_to_noise)
+    assert np.isclose(fm.threshold_signal_to_noise[1, 3, 20], point.signal_to_noise)
+
+    # the knee: click noise only matters near and below threshold
+    knee = watt_to_decibel(fm.signal_to_noise / fm.threshold_signal_to_noise)
+    assert np.all(knee[..., -1] < 0.01)
+    assert np.all(knee[..., 0] > 3)
+    assert np.all(np.diff(knee, axis=-1) <= 0)
@@ -0,0 +1,67 @@
+from functools import partial
+
+import numpy as np
+import pytest
+
+from link_calculator.conversions import decibel_to_watt
+from link_calculator.signal_processing.error_rates import psk_bit_error_rate
+from link_calculator.signal_processing.simulation import (
+    bit_error_table,
+    simulate_psk_error_rate,
+)
+
+
+def test_bit_error_table():
+    table = bit_error_table(8)
+    assert np.all(np.diag(table) == 0)
+    assert np.array_equal(table, table.T)
+    # neighbouring symbols differ in one bit
+    assert np.all(table[np.arange(8), (np.arange(8) + 1) % 8] == 1)
+
+
+def test_simulate_psk_error_rate():
+    eb_no = decibel_to_watt(np.array([4, 7]))
+    for levels in [2, 4, 8]:
+        for symmetric in [False, True]:
+            results = simulate_psk_error_rate(
+                eb_no, levels, target_errors=2000, seed=1, symmetric=symmetric
+            )
+            assert np.all(results.bit_errors >= 2000)
+            assert np.allclose(
+                results.bit_error_rate, psk_bit_error_rate(eb_no, levels), rtol=0.1
+            )
+
+
+def test_simulate_psk_error_rate_processes():
+    eb_no = decibel_to_watt(np.array([2, 4, 6]))
+    serial = simulate_psk_error_rate(eb_no, 4, max_bits=10**5, seed=7)
+    parallel = simulate_psk_error_rate(eb_no, 4, max_bits=10**5, processes=2, seed=7)
+    assert serial.equals(parallel)
+    assert np.all(serial.bits == 2 * 2**18)
+    # the shortcut is taken by default when there is no impairment
+    assert serial.equals(
+        simulate_psk_error_rate(eb_no, 4, max_bits=10**5, seed=7, symmetric=True)
+    )
+
+
+def test_simulate_psk_error_rate_impairment():
+    eb_no = decibel_to_watt(np.array([4, 7]))
+    ideal = simulate_psk_error_rate(eb_no, 8, target_errors=2000, seed=3)
+
+    # a phase offset moves the symbols towards the decision boundaries
+    rotate = partial(np.multiply, np.exp(1j * np.pi / 32))
+    impaired = simulate_psk_error_rate(
+        eb_no, 8, target_errors=2000, seed=3, impairment=rotate, processes=2
+    )
+    assert np.all(impaired.bit_error_rate > 1.1 * ideal.bit_error_rate)
+
+    # rotated by a whole sector every symbol is detected as its Gray neighbour
+    rotate = partial(np.multiply, np.exp(1j * np.pi / 2))
+    results = simulate_psk_error_rate(
+        decibel_to_watt(30), 4, max_bits=10**5, seed=3, impairment=rotate
+    )
+    assert np.allclose(results.symbol_error_rate, 1)
+    assert np.allclose(results.bit_error_rate, 0.5)
+
+    with pytest.raises(ValueError):
+        simulate_psk_error_rate(eb_no, 4, impairment=rotate, symmetric=True)
@@ -0,0 +1,85 @@
+import numpy as np
+
+from link_calculator.conversions import watt_to_decibel
+from link_calculator.signal_processing.spectrum import (
+    adjacent_channel_leakage,
+    occupied_bandwidth,
+    power_spectral_density,
+    raised_cosine_taps,
+)
+
+
+def test_raised_cosine_taps():
+    for rolloff_rate in [0.2, 0.25, 0.35, 0.5]:
+        taps = raised_cosine_taps(rolloff_rate, root=False)
+        assert np.all(np.isfinite(taps))
+        # zero inter-symbol interference at the other symbol instants
+        centre = len(taps) // 2
+        assert np.allclose(np.delete(taps[centre % 8 :: 8], centre // 8), 0)
+
+        # two root raised cosine filters make a raised cosine
+        root = raised_cosine_taps(rolloff_rate, root=True)
+        combined = np.convolve(root, root)
+        assert np.allclose(
+            combined[len(combined) // 2 - 8 : len(combined) // 2 + 9]
+            / combined[len(combined) // 2],
+            taps[centre - 8 : centre + 9] / taps[centre],
+            atol=1e-2,
+        )
+    assert raised_cosine_taps(0.35) is raised_cosine_taps(0.35)
+
+
+def test_occupied_bandwidth():
+    frequency, psd = power_spectral_density(0.35)
+    assert np.isclose(np.sum(psd), 1)
+
+    # each bin holds its positive and negative frequency power, DC and Nyquist once
+    taps = raised_cosine_taps(0.35, 8, 16, root=True)
+    for n_fft in [64, 65]:
+        two_sided = np.abs(np.fft.fft(taps, n_fft)) ** 2
+        two_sided /= np.sum(two_sided)
+        _, psd = power_spectral_density(0.35, 8, 16, n_fft)
+        half = n_fft // 2 + 1
+        expected = two_sided[:half] + np.append(0, two_sided[::-1][: half - 1])
+        if n_fft % 2 == 0:
+            expected[-1] = two_sided[n_fft // 2]
+        assert np.allclose(psd, expected)
+
+    rolloff_rates = np.array([0.05, 0.2, 0.35, 0.5])
+    symbol_rates = np.array([[1e6], [36e6]])
+    bandwidth = occupied_bandwidth(rolloff_rates, symbol_rates)
+    assert bandwidth.shape == (2, 4)
+    assert np.allclose(bandwidth[1], 36 * bandwidth[0])
+    # the occupied bandwidth lies between the Nyquist and the full rolled off width
+    assert np.all(bandwidth[0] > 1e-3)
+    assert np.all(bandwidth[0] < 1e-3 * (1 + rolloff_rates))
+
+
+def test_adjacent_channel_leakage():
+    rolloff_rates = np.array([0.05, 0.2, 0.35, 0.5])
+    aclr = adjacent_channel_leakage(rolloff_rates, (1 + rolloff_rates) * 1e-3, 1e6)
+    assert np.all(watt_to_decibel(aclr) < -30)
+
+    # closer channels leak more
+    spacings = np.array([1.2, 1.35, 1.5]) * 1e-3  # GHz
+    aclr = adjacent_channel_leakage(0.35, spacings, 1e6)
+    assert np.all(np.diff(aclr) < 0)
+    assert watt_to_decibel(aclr[0]) > -30
+
+    # overlapping channels share the power around the carrier
+    assert np.isclose(adjacent_channel_leakage(0.35, 0, 1e6), 1)
+    spacings = np.linspace(0, 1.5, 31) * 1e-3  # GHz
+    aclr = adjacent_channel_leakage(0.35, spacings, 1e6)
+    assert np.all(np.diff(aclr) < 0)
+    # a channel half a symbol rate away spans -0.175 to 1.175 symbol rates, and
+    # half the power within +/- f lies on each side of the carrier
+    frequency, psd = power_spectral_density(0.35)
+
+    def within(f):
+        return np.sum(psd[frequency <= f])
+
+    assert np.isclose(
+        adjacent_channel_leakage(0.35, 0.5e-3, 1e6),
+        0.5 * (within(1.175) + within(0.175)) / within(0.675),
+        rtol=1e-2,
+    )
@@ -0,0 +1,104 @@
+import pickle
+import tempfile
+
+import numpy as np
+
+from link_calculator.grids import RegularGrid
+
+
+def _grid_values():
+    latitudes = np.arange(-90, 91, 30)
+    longitudes = np.arange(-180, 180, 45)
+    return latitudes[:, None] + 0.1 * longitudes[None, :]
+
+
+def test_interpolate():
+    grid = RegularGrid(_grid_values(), -90, 30, -180, 45, column_period=360)
+
+    # grid nodes and midpoints of a linear field are reproduced exactly
+    latitudes = np.array([-90, -75, 0, 10, 90])
+    longitudes = np.array([-180, -157.5, 0, 100, 135])
+    assert np.allclose(
+        grid.interpolate(latitudes, longitudes), latitudes + 0.1 * longitudes
+    )
+
+    # longitudes wrap around the period
+    assert np.isclose(grid.interpolate(0, 180), grid.interpolate(0, -180))
+    assert np.isclose(grid.interpolate(0, 157.5), 0.5 * (13.5 - 18))
+    assert np.allclose(grid.interpolate(30, [10, 370, -350]), grid.interpolate(30, 10))
+
+    # rows are clamped to the edge of the grid
+    assert np.isclose(grid.interpolate(-100, 0), grid.interpolate(-90, 0))
+
+
+def test_interpolate_partial_period():
+    # an azimuth sector from -30 to 30 deg
+    azimuths = np.arange(-30, 31, 1.0)
+    values = np.tile(azimuths, (3, 1))
+    grid = RegularGrid(values, -1, 1, -30, 1, column_period=360)
+
+    assert np.allclose(grid.interpolate(0, [-30, 0, 15.5, 30]), [-30, 0, 15.5, 30])
+    # coordinates around the period are brought into the sector
+    assert np.isclose(grid.interpolate(0, 350), -10)
+    # coordinates outside the sector are clamped to the nearer edge
+    assert np.allclose(
+        grid.interpolate(0, [-40, 40, 170, 190, 300]), [-30, 30, 30, -30, -30]
+    )
+
+
+def test_from_file(tmp_path):
+    values = _grid_values()
+    npy_path = tmp_path / "grid.npy"
+    csv_path = tmp_path / "grid.csv"
+    raw_path = tmp_path / "grid.bin"
+    np.save(npy_path, values)
+    np.savetxt(csv_path, values, delimiter=",")
+    values.astype("float32").tofile(raw_path)
+
+    grids = [
+        RegularGrid.from_file(npy_path, -90, 30, -180, 45, 360),
+        RegularGrid.from_file(csv_path, -90, 30, -180, 45, 360),
+        RegularGrid.from_file(
+            raw_path, -90, 30, -180, 45, 360, shape=values.shape, dtype="float32"
+        ),
+    ]
+    latitudes = np.linspace(-80, 80, 7)
+    for grid in grids:
+        assert isinstance(grid.values, np.memmap)
+        assert np.allclose(grid.interpolate(latitudes, 20), latitudes + 2, rtol=1e-6)
+
+
+def test_from_file_csv(tmp_path, monkeypatch):
+    values = _grid_values()
+    csv_path = tmp_path / "grid.csv"
+    np.savetxt(csv_path, values, delimiter=",")
+
+    grid = RegularGrid.from_file(csv_path, -90, 30, -180, 45, 360)
+    assert grid.path == f"{csv_path}.npy"
+    # the parsed grid is moved into place, leaving no temporary files behind
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["grid.csv", "grid.csv.npy"]
+
+    # a directory that cannot be written to keeps the parsed grid in memory
+    (tmp_path / "grid.csv.npy").unlink()
+
+    def read_only(*args, **kwargs):
+        raise PermissionError
+
+    monkeypatch.setattr(tempfile, "mkstemp", read_only)
+    grid = RegularGrid.from_file(csv_path, -90, 30, -180, 45, 360)
+    assert grid.path is None and not isinstance(grid.values, np.memmap)
+    assert np.array_equal(grid.values, values)
+    assert not (tmp_path / "grid.csv.npy").exists()
+
+
+def test_pickle_memory_mapped(tmp_path):
+    values = _grid_values()
+    path = tmp_path / "grid.npy"
+    np.save(path, values)
+    grid = RegularGrid.from_file(path, -90, 30, -180, 45, 360)
+
+    data = pickle.dumps(grid)
+    assert len(data) < values.nbytes
+    copy = pickle.loads(data)
+    assert isinstance(copy.values, np.memmap)
+    assert np.array_equal(copy.values, values)
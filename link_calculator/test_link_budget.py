@@ -1,7 +1,7 @@
 import numpy as np
 import pandas as pd
 
-from link_calculator.components.antennas import Amplifier, Antenna
+from link_calculator.components.antennas import Amplifier, Antenna, PhasedArrayAntenna
 from link_calculator.components.communicators import GroundStation, Satellite
 from link_calculator.constants import BOLTZMANN_CONSTANT, EARTH_RADIUS
 from link_calculator.conversions import (
@@ -171,3 +171,48 @@ def test_link_budget():
     """~~~~~~~~~~~~~~~~~~~ Link Budget ~~~~~~~~~~~~~~~~~~~"""
     assert np.isclose(watt_to_decibel(budget.eb_no), 12.8, rtol=0.01)
     print(budget.summary())
+
+
+def test_phased_array_terminal():
+    psk = MPhaseShiftKeying(
+        levels=4, bit_rate=mbit_to_bit(20), bandwidth=MHz_to_GHz(15)
+    )
+    sat_antenna = Antenna(
+        gain=decibel_to_watt(30), loss=1, amplifier=Amplifier(power=10), modulation=psk
+    )
+    sat = Satellite(
+        name="sat",
+        transmit=sat_antenna,
+        receive=sat_antenna,
+        gain_to_equiv_noise_temp=decibel_to_watt(5),
+    )
+
+    c_no = []
+    for steering_angle in [0, 50]:
+        terminal = PhasedArrayAntenna.rectangular(
+            32,
+            32,
+            frequency=14,
+            steering_angle=steering_angle,
+            amplifier=Amplifier(power=4),
+            modulation=psk,
+        )
+        gs = GroundStation(
+            name="terminal",
+            transmit=terminal,
+            receive=terminal,
+            gain_to_equiv_noise_temp=terminal.gain / 150,
+        )
+        uplink = Link(
+            transmitter=gs,
+            receiver=sat,
+            path_loss=decibel_to_watt(-200),
+            slant_range=1000,
+        )
+        assert np.isclose(
+            uplink.carrier_to_noise_density,
+            4 * terminal.gain * decibel_to_watt(-200 + 5) / BOLTZMANN_CONSTANT,
+        )
+        c_no.append(uplink.carrier_to_noise_density)
+    # the uplink loses the scan loss of the terminal
+    assert np.isclose(c_no[1] / c_no[0], np.cos(np.radians(50)) ** 1.2)